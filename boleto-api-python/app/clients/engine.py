@@ -1,9 +1,20 @@
 # Cliente do engine BrCobrança (Ruby) — chamadas de renderização.
 #
 # Usado pelo caminho offline/CNAB e pela montagem de carnê. Sem segredo.
+#
+# Um httpx.AsyncClient (pool keep-alive) por base URL do engine, compartilhado
+# por todas as requisições: criado no lifespan da app (ou na primeira chamada) e
+# fechado no shutdown. Limites e timeouts vêm do ambiente (ENGINE_*).
+#
+# Conexões async pertencem ao event loop que as abriu — e só nele podem ser
+# fechadas. O pool fica preso a esse loop: usá-lo de outro é RuntimeError (em
+# vez de abandonar sockets abertos). Fora do lifespan, feche com `close_pool()`
+# no mesmo loop; `app.core.sync.run_sync` faz isso sozinho.
 from __future__ import annotations
 
+import asyncio
 import os
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
@@ -13,17 +24,128 @@ def engine_url() -> str:
     return os.environ.get("BOLETO_ENGINE_URL", "http://boleto-engine:9292").rstrip("/")
 
 
-def render_boleto(bank: str, data: dict[str, Any]) -> dict[str, Any]:
-    return _post("/api/render/boleto", {"bank": bank, "data": data})
+@dataclass(frozen=True)
+class PoolConfig:
+    """Limites do pool e timeouts das chamadas ao engine."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> PoolConfig:
+        env = os.environ
+        return cls(
+            max_connections=int(env.get("ENGINE_MAX_CONNECTIONS", cls.max_connections)),
+            max_keepalive_connections=int(env.get("ENGINE_MAX_KEEPALIVE", cls.max_keepalive_connections)),
+            keepalive_expiry=float(env.get("ENGINE_KEEPALIVE_EXPIRY", cls.keepalive_expiry)),
+            timeout=float(env.get("ENGINE_TIMEOUT", cls.timeout)),
+            connect_timeout=float(env.get("ENGINE_CONNECT_TIMEOUT", cls.connect_timeout)),
+        )
+
+
+class EnginePool:
+    """Um httpx.AsyncClient por base URL do engine, preso ao event loop do primeiro uso."""
+
+    def __init__(self, config: PoolConfig | None = None) -> None:
+        self.config = config or PoolConfig.from_env()
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        return self._loop
+
+    def _check_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif loop is not self._loop:
+            raise RuntimeError(
+                "pool do engine pertence a outro event loop; "
+                "feche-o com `await engine.close_pool()` no loop que o abriu"
+            )
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        self._check_loop()
+        base_url = base_url.rstrip("/")
+        c = self._clients.get(base_url)
+        if c is None:
+            c = self._clients[base_url] = self._new_client()
+        return c
+
+    def _new_client(self) -> httpx.AsyncClient:
+        cfg = self.config
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+        )
+
+    async def aclose(self) -> None:
+        if self._clients:
+            self._check_loop()
+        clients, self._clients = list(self._clients.values()), {}
+        for c in clients:
+            await c.aclose()
+
+
+_pool: EnginePool | None = None
+
+
+def pool() -> EnginePool:
+    """Pool corrente; criado sob demanda se o lifespan não rodou (ex. scripts)."""
+    global _pool
+    if _pool is None:
+        _pool = EnginePool()
+    return _pool
+
+
+async def open_pool(config: PoolConfig | None = None) -> EnginePool:
+    """Lifespan (startup): pool novo com a config do ambiente, já com o engine padrão."""
+    global _pool
+    old, _pool = _pool, EnginePool(config)
+    if old is not None:
+        await old.aclose()
+    _pool.client(engine_url())
+    return _pool
+
+
+async def close_pool() -> None:
+    """Lifespan (shutdown): fecha as conexões keep-alive."""
+    global _pool
+    old, _pool = _pool, None
+    if old is not None:
+        await old.aclose()
+
+
+async def close_loop_pool() -> None:
+    """Fecha o pool se ele pertence ao loop corrente (fim de `run_sync`/scripts)."""
+    if _pool is not None and _pool.loop is asyncio.get_running_loop():
+        await close_pool()
+
+
+def http_client(base_url: str | None = None) -> httpx.AsyncClient:
+    """Client pooled do engine em `base_url` (padrão BOLETO_ENGINE_URL); requer loop rodando."""
+    return pool().client(base_url or engine_url())
+
+
+async def render_boleto(bank: str, data: dict[str, Any]) -> dict[str, Any]:
+    return await _post("/api/render/boleto", {"bank": bank, "data": data})
 
 
-def render_carne(bank: str, boletos: list[dict[str, Any]]) -> dict[str, Any]:
+async def render_carne(bank: str, boletos: list[dict[str, Any]]) -> dict[str, Any]:
     # Carnê 3-vias A4 (template 'carne' no engine, sem GhostScript).
-    return _post("/api/render/carne", {"bank": bank, "boletos": boletos})
+    return await _post("/api/render/carne", {"bank": bank, "boletos": boletos})
 
 
-def _post(path: str, payload: dict[str, Any]) -> dict[str, Any]:
-    with httpx.Client(timeout=30.0) as c:
-        r = c.post(f"{engine_url()}{path}", json=payload)
-        r.raise_for_status()
-        return r.json() if r.content else {}
+async def _post(path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    base = engine_url()
+    r = await http_client(base).post(f"{base}{path}", json=payload)
+    r.raise_for_status()
+    return r.json() if r.content else {}
@@ -7,12 +7,18 @@
 # mTLS: o certificado do tenant vem como PKCS12 (.pfx) base64 + senha. Python/ssl
 # não carrega PKCS12 direto — extraímos cert+key com `cryptography` e montamos um
 # SSLContext em arquivos temporários (em memória/efêmeros), nunca persistidos.
+#
+# Async: token e request usam um httpx.AsyncClient por instância (token + chamada
+# na mesma conexão TLS); feche com `aclose()` ou use `async with`.
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import ssl
 import tempfile
 import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -28,6 +34,10 @@ class OAuthMtlsClient:
     # cache de token em memória, por (client_id, base_url). Não é persistência
     # de credencial — só do access_token vivo.
     _token_cache: dict[tuple[str, str], dict[str, Any]] = {}
+    # single-flight do token por (client_id, base_url): com o cache frio, N
+    # chamadas concorrentes (ex.: parcelas do carnê) fazem UM OAuth, não N.
+    # asyncio.Lock é do loop em que foi criado -> recriado se o loop mudar.
+    _token_locks: dict[tuple[str, str], tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
 
     def __init__(
         self,
@@ -50,16 +60,48 @@ class OAuthMtlsClient:
         self.default_headers = default_headers or {}
         self._ssl = self._build_ssl_context(pfx_base64, pfx_password)
         self._timeout = timeout
+        self._http: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> OAuthMtlsClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(verify=self._ssl, timeout=self._timeout)
+        return self._http
 
     # --- auth ---------------------------------------------------------------
-    def token(self) -> str:
-        key = (self.client_id, self.base_url)
-        cached = self._token_cache.get(key)
+    async def token(self) -> str:
+        cached = self._cached_token()
+        if cached:
+            return cached
+        async with self._token_lock():
+            # quem esperou no lock encontra o token que o primeiro buscou
+            return self._cached_token() or await self._authenticate()
+
+    def _cached_token(self) -> str | None:
+        cached = self._token_cache.get((self.client_id, self.base_url))
         if cached and cached["expires_at"] > time.time() + 30:
             return cached["access_token"]
-        return self._authenticate()
+        return None
+
+    def _token_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        key = (self.client_id, self.base_url)
+        entry = self._token_locks.get(key)
+        if entry is None or entry[0] is not loop:
+            entry = self._token_locks[key] = (loop, asyncio.Lock())
+        return entry[1]
 
-    def _authenticate(self) -> str:
+    async def _authenticate(self) -> str:
         data = {
             "grant_type": "client_credentials",
             "client_id": self.client_id,
@@ -67,10 +109,9 @@ class OAuthMtlsClient:
         }
         if self.scopes:
             data["scope"] = " ".join(self.scopes)
-        with httpx.Client(verify=self._ssl, timeout=self._timeout) as c:
-            r = c.post(self.auth_url, data=data)
-            r.raise_for_status()
-            body = r.json()
+        r = await self._client().post(self.auth_url, data=data)
+        r.raise_for_status()
+        body = r.json()
         access_token = body.get("access_token")
         if not access_token:
             raise RuntimeError("OAuth sem access_token")
@@ -81,34 +122,56 @@ class OAuthMtlsClient:
         return access_token
 
     # --- request ------------------------------------------------------------
-    def request(self, method: str, path: str, json: Any = None) -> dict[str, Any]:
+    async def request(self, method: str, path: str, json: Any = None) -> dict[str, Any]:
         headers = {
-            "Authorization": f"Bearer {self.token()}",
+            "Authorization": f"Bearer {await self.token()}",
             "Content-Type": "application/json",
             **self.default_headers,
         }
         url = f"{self.base_url}{path}"
-        with httpx.Client(verify=self._ssl, timeout=self._timeout) as c:
-            r = c.request(method, url, json=json, headers=headers)
-            r.raise_for_status()
-            return r.json() if r.content else {}
+        r = await self._client().request(method, url, json=json, headers=headers)
+        r.raise_for_status()
+        return r.json() if r.content else {}
 
     # --- mTLS helper --------------------------------------------------------
     @staticmethod
     def _build_ssl_context(pfx_base64: str, pfx_password: str) -> ssl.SSLContext:
-        ctx = ssl.create_default_context()
-        if not pfx_base64:
-            return ctx
-        key, cert, _chain = pkcs12.load_key_and_certificates(
-            base64.b64decode(pfx_base64),
-            pfx_password.encode() if pfx_password else None,
-        )
-        # Arquivos efêmeros só para o load_cert_chain; removidos em seguida.
-        with tempfile.NamedTemporaryFile(suffix=".pem") as cf, \
-             tempfile.NamedTemporaryFile(suffix=".pem") as kf:
-            cf.write(cert.public_bytes(Encoding.PEM))
-            cf.flush()
-            kf.write(key.private_bytes(Encoding.PEM, PrivateFormat.TraditionalOpenSSL, NoEncryption()))
-            kf.flush()
-            ctx.load_cert_chain(certfile=cf.name, keyfile=kf.name)
+        return _ssl_context(pfx_base64, pfx_password)
+
+
+# SSLContext é reutilizável e thread-safe: o mesmo certificado (tenant) não é
+# reprocessado a cada chamada — PKCS12 + arquivos temporários bloqueariam o loop.
+# A chave do cache é um digest: o .pfx e a senha em si não ficam retidos.
+_SSL_CACHE_MAX = 64
+_ssl_cache: OrderedDict[str, ssl.SSLContext] = OrderedDict()
+
+
+def _ssl_context(pfx_base64: str, pfx_password: str) -> ssl.SSLContext:
+    key = hashlib.sha256(f"{pfx_base64}\0{pfx_password}".encode()).hexdigest()
+    ctx = _ssl_cache.get(key)
+    if ctx is not None:
+        _ssl_cache.move_to_end(key)
+        return ctx
+    ctx = _ssl_cache[key] = _load_ssl_context(pfx_base64, pfx_password)
+    if len(_ssl_cache) > _SSL_CACHE_MAX:
+        _ssl_cache.popitem(last=False)
+    return ctx
+
+
+def _load_ssl_context(pfx_base64: str, pfx_password: str) -> ssl.SSLContext:
+    ctx = ssl.create_default_context()
+    if not pfx_base64:
         return ctx
+    key, cert, _chain = pkcs12.load_key_and_certificates(
+        base64.b64decode(pfx_base64),
+        pfx_password.encode() if pfx_password else None,
+    )
+    # Arquivos efêmeros só para o load_cert_chain; removidos em seguida.
+    with tempfile.NamedTemporaryFile(suffix=".pem") as cf, \
+         tempfile.NamedTemporaryFile(suffix=".pem") as kf:
+        cf.write(cert.public_bytes(Encoding.PEM))
+        cf.flush()
+        kf.write(key.private_bytes(Encoding.PEM, PrivateFormat.TraditionalOpenSSL, NoEncryption()))
+        kf.flush()
+        ctx.load_cert_chain(certfile=cf.name, keyfile=kf.name)
+    return ctx
@@ -26,7 +26,7 @@ def sign(body: bytes, secret: str) -> str:
     return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
 
 
-def forward_event(event: dict[str, Any], *, url: str | None = None, secret: str | None = None) -> bool:
+async def forward_event(event: dict[str, Any], *, url: str | None = None, secret: str | None = None) -> bool:
     """Encaminha o evento ao consumidor downstream. True se entregue (2xx/3xx).
 
     `url`/`secret` permitem override por chamada (ex.: callback por tenant),
@@ -44,8 +44,8 @@ def forward_event(event: dict[str, Any], *, url: str | None = None, secret: str
         headers["X-Signature"] = sign(body, secret)
 
     try:
-        with httpx.Client(timeout=10.0) as c:
-            r = c.post(url, content=body, headers=headers)
+        async with httpx.AsyncClient(timeout=10.0) as c:
+            r = await c.post(url, content=body, headers=headers)
             return r.status_code < 400
     except httpx.HTTPError:
         # TODO: enfileirar para retry (o webhook do banco não pode quebrar aqui).
@@ -0,0 +1,33 @@
+# Shim síncrono para o caminho async (providers, OAuthMtlsClient, engine, forwarder).
+#
+# As rotas aguardam as corrotinas direto no event loop do servidor. Testes,
+# scripts e REPL — que não têm loop rodando — chamam via `run_sync`, que sobe
+# um loop só para a chamada; o pool do engine aberto nesse loop é fechado antes
+# de o loop acabar. Não use dentro de código async (levanta RuntimeError).
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from app.clients import engine
+
+T = TypeVar("T")
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Executa `awaitable` até o fim num event loop próprio e devolve o resultado."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("run_sync chamado dentro de um event loop; use await")
+
+    async def _main() -> T:
+        try:
+            return await awaitable
+        finally:
+            await engine.close_loop_pool()
+
+    return asyncio.run(_main())
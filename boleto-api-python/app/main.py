@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from app.clients import engine
 from app.core.vault import CredentialNotFound
 from app.routers import carne, cobranca, webhooks
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Pool keep-alive do engine vive o tempo do processo (ENGINE_* no ambiente)
+    app.state.engine_pool = await engine.open_pool()
+    try:
+        yield
+    finally:
+        await engine.close_pool()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Boleto-API (Python)",
     version="0.1.0",
     description=(
@@ -1,4 +1,8 @@
 # Interface comum a todos os providers (porte do BaseProvider Ruby).
+#
+# registrar/consultar/baixar são corrotinas: as rotas rodam no event loop, sem
+# ocupar uma thread do pool por chamada ao banco. Fora de um loop (testes,
+# scripts, REPL) use o shim `app.core.sync.run_sync`.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -13,13 +17,13 @@ class BankProvider(ABC):
         self.credentials = credentials  # do cofre; em memória, não persiste
 
     @abstractmethod
-    def registrar(self, cobranca: Cobranca) -> CobrancaOut: ...
+    async def registrar(self, cobranca: Cobranca) -> CobrancaOut: ...
 
     @abstractmethod
-    def consultar(self, cobranca_id: str) -> CobrancaOut: ...
+    async def consultar(self, cobranca_id: str) -> CobrancaOut: ...
 
     @abstractmethod
-    def baixar(self, cobranca_id: str) -> CobrancaOut: ...
+    async def baixar(self, cobranca_id: str) -> CobrancaOut: ...
 
     def normalizar_webhook(self, headers: dict[str, str], body: dict[str, Any]) -> WebhookEvent:
         raise NotImplementedError
@@ -8,8 +8,7 @@ from __future__ import annotations
 import os
 from typing import Any
 
-import httpx
-
+from app.clients import engine
 from app.providers.base import BankProvider
 from app.schemas import Cobranca, CobrancaOut, Status
 
@@ -17,14 +16,14 @@ ENGINE_URL = os.environ.get("BOLETO_ENGINE_URL", "http://boleto-engine:9292")
 
 
 class BrcobrancaProxyProvider(BankProvider):
-    def registrar(self, cobranca: Cobranca) -> CobrancaOut:
+    async def registrar(self, cobranca: Cobranca) -> CobrancaOut:
         bank = self.account_config.get("bank")
         payload = {"bank": bank, "data": _to_engine_payload(cobranca, self.account_config)}
-        with httpx.Client(timeout=30.0) as c:
-            r = c.post(f"{ENGINE_URL}/api/render/boleto", json=payload)
-            if r.status_code >= 400:
-                return CobrancaOut(status=Status.erro, raw={"engine_status": r.status_code, "body": r.text})
-            data = r.json()
+        # Pool keep-alive compartilhado (um por URL do engine), ver clients/engine.py
+        r = await engine.http_client(ENGINE_URL).post(f"{ENGINE_URL}/api/render/boleto", json=payload)
+        if r.status_code >= 400:
+            return CobrancaOut(status=Status.erro, raw={"engine_status": r.status_code, "body": r.text})
+        data = r.json()
         return CobrancaOut(
             id=data.get("nosso_numero"),
             status=Status.registrado,
@@ -35,11 +34,11 @@ class BrcobrancaProxyProvider(BankProvider):
         )
 
     # Offline não tem consulta/baixa online (conciliação via retorno/OFX no engine).
-    def consultar(self, cobranca_id: str) -> CobrancaOut:
+    async def consultar(self, cobranca_id: str) -> CobrancaOut:
         return CobrancaOut(id=cobranca_id, status=Status.pendente,
                            raw={"hint": "offline: conciliar via retorno/OFX"})
 
-    def baixar(self, cobranca_id: str) -> CobrancaOut:
+    async def baixar(self, cobranca_id: str) -> CobrancaOut:
         return CobrancaOut(id=cobranca_id, status=Status.baixado,
                            raw={"hint": "offline: baixa via remessa CNAB"})
 
@@ -26,14 +26,18 @@ class C6Provider(BankProvider):
             pfx_password=self.credentials.get("pfx_password", ""),
         )
 
-    def registrar(self, cobranca: Cobranca) -> CobrancaOut:
+    async def _request(self, method: str, path: str, json: Any = None) -> dict[str, Any]:
+        async with self._client() as c:
+            return await c.request(method, path, json=json)
+
+    async def registrar(self, cobranca: Cobranca) -> CobrancaOut:
         payload = {  # TODO mapear contrato real do C6
             "amount": float(cobranca.valor),
             "dueDate": cobranca.vencimento.isoformat(),
             "ourNumber": cobranca.nosso_numero,
             "payer": {"name": cobranca.pagador.nome, "document": cobranca.pagador.documento},
         }
-        data = self._client().request("POST", "/v1/bank-slips", json=payload)  # TODO path
+        data = await self._request("POST", "/v1/bank-slips", json=payload)  # TODO path
         return CobrancaOut(
             id=data.get("id") or data.get("nossoNumero"),
             status=_map_status(data.get("status")) or Status.registrado,
@@ -43,12 +47,12 @@ class C6Provider(BankProvider):
             raw=data,
         )
 
-    def consultar(self, cobranca_id: str) -> CobrancaOut:
-        data = self._client().request("GET", f"/v1/bank-slips/{cobranca_id}")  # TODO path
+    async def consultar(self, cobranca_id: str) -> CobrancaOut:
+        data = await self._request("GET", f"/v1/bank-slips/{cobranca_id}")  # TODO path
         return CobrancaOut(id=cobranca_id, status=_map_status(data.get("status")) or Status.pendente, raw=data)
 
-    def baixar(self, cobranca_id: str) -> CobrancaOut:
-        data = self._client().request("DELETE", f"/v1/bank-slips/{cobranca_id}")  # TODO path
+    async def baixar(self, cobranca_id: str) -> CobrancaOut:
+        data = await self._request("DELETE", f"/v1/bank-slips/{cobranca_id}")  # TODO path
         return CobrancaOut(id=cobranca_id, status=Status.baixado, raw=data)
 
     def normalizar_webhook(self, headers: dict[str, str], body: dict[str, Any]) -> WebhookEvent:
@@ -32,7 +32,11 @@ class SicoobProvider(BankProvider):
             default_headers={"client_id": self.credentials["client_id"]},  # Sicoob exige
         )
 
-    def registrar(self, cobranca: Cobranca) -> CobrancaOut:
+    async def _request(self, method: str, path: str, json: Any = None) -> dict[str, Any]:
+        async with self._client() as c:
+            return await c.request(method, path, json=json)
+
+    async def registrar(self, cobranca: Cobranca) -> CobrancaOut:
         payload = {  # TODO mapear contrato real do Sicoob
             "numeroCliente": self.account_config.get("numeroCliente"),
             "codigoModalidade": self.account_config.get("codigoModalidade"),
@@ -42,7 +46,7 @@ class SicoobProvider(BankProvider):
             "seuNumero": cobranca.seu_numero,
             "pagador": {"nome": cobranca.pagador.nome, "numeroCpfCnpj": cobranca.pagador.documento},
         }
-        data = self._client().request("POST", "/cobranca-bancaria/v3/boletos", json=payload)  # TODO path
+        data = await self._request("POST", "/cobranca-bancaria/v3/boletos", json=payload)  # TODO path
         res = (data.get("resultado") or data)
         return CobrancaOut(
             id=str(res.get("nossoNumero") or res.get("seuNumero")),
@@ -53,14 +57,14 @@ class SicoobProvider(BankProvider):
             raw=data,
         )
 
-    def consultar(self, cobranca_id: str) -> CobrancaOut:
+    async def consultar(self, cobranca_id: str) -> CobrancaOut:
         # Também é o que o WORKER de conciliação chama no polling agendado.
-        data = self._client().request("GET", f"/cobranca-bancaria/v3/boletos/{cobranca_id}")  # TODO path
+        data = await self._request("GET", f"/cobranca-bancaria/v3/boletos/{cobranca_id}")  # TODO path
         res = (data.get("resultado") or data)
         return CobrancaOut(id=cobranca_id, status=_map_status(res.get("situacao")) or Status.pendente, raw=data)
 
-    def baixar(self, cobranca_id: str) -> CobrancaOut:
-        data = self._client().request("POST", f"/cobranca-bancaria/v3/boletos/{cobranca_id}/baixar")  # TODO path
+    async def baixar(self, cobranca_id: str) -> CobrancaOut:
+        data = await self._request("POST", f"/cobranca-bancaria/v3/boletos/{cobranca_id}/baixar")  # TODO path
         return CobrancaOut(id=cobranca_id, status=Status.baixado, raw=data)
 
     def normalizar_webhook(self, headers: dict[str, str], body: dict[str, Any]) -> WebhookEvent:
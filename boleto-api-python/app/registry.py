@@ -1,6 +1,7 @@
 # Roteador de providers + resolução de credenciais no cofre.
 from __future__ import annotations
 
+import logging
 import os
 from typing import Any
 
@@ -11,6 +12,8 @@ from app.providers.c6 import C6Provider
 from app.providers.sicoob import SicoobProvider
 from app.schemas import Provider
 
+logger = logging.getLogger(__name__)
+
 _PROVIDERS: dict[Provider, type[BankProvider]] = {
     Provider.brcobranca: BrcobrancaProxyProvider,
     Provider.c6: C6Provider,
@@ -23,6 +26,8 @@ _BRCOBRANCA_BANK: dict[Provider, str] = {
     Provider.sicoob: "sicoob",
 }
 
+_DEFAULT_MAX_CONCURRENCY = 8
+
 
 def registered_ready(provider: Provider) -> bool:
     """Indica se a cobrança REGISTRADA (API do banco) está homologada e pronta.
@@ -36,6 +41,27 @@ def registered_ready(provider: Provider) -> bool:
     return os.environ.get(f"{provider.value.upper()}_REGISTERED_READY", "").lower() in ("1", "true", "yes")
 
 
+def max_concurrency(provider: Provider | BankProvider) -> int:
+    """Teto de registros simultâneos num provider (ex.: parcelas de um carnê).
+
+    Protege o rate limit do banco. Por provider: `C6_MAX_CONCURRENCY`,
+    `SICOOB_MAX_CONCURRENCY`, `BRCOBRANCA_MAX_CONCURRENCY` (padrão 8, mínimo 1).
+    Aceita a instância de `build_provider`: no fallback offline vale o teto do
+    brcobrança, que é quem recebe as chamadas. Valor inválido → padrão.
+    """
+    if isinstance(provider, BankProvider):
+        provider = next(k for k, klass in _PROVIDERS.items() if isinstance(provider, klass))
+    name = f"{provider.value.upper()}_MAX_CONCURRENCY"
+    value = os.environ.get(name, "")
+    if not value:
+        return _DEFAULT_MAX_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("%s=%r não é inteiro; usando %d", name, value, _DEFAULT_MAX_CONCURRENCY)
+        return _DEFAULT_MAX_CONCURRENCY
+
+
 def build_provider(
     *, provider: Provider, tenant_id: str, account_config: dict[str, Any], vault: Vault
 ) -> BankProvider:
@@ -1,37 +1,71 @@
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 from fastapi import APIRouter, Depends
 
 from app.clients import engine
 from app.core.vault import Vault, get_vault
+from app.providers.base import BankProvider
 from app.providers.brcobranca_proxy import _to_engine_payload
-from app.registry import build_provider
-from app.schemas import CarneIn, CarneOut
+from app.registry import build_provider, max_concurrency
+from app.schemas import CarneIn, CarneOut, Cobranca, CobrancaOut, Status
 
 router = APIRouter(prefix="/carne", tags=["carne"])
 
 
 @router.post("", response_model=CarneOut)
-def gerar_carne(body: CarneIn, vault: Vault = Depends(get_vault)) -> CarneOut:
+async def gerar_carne(body: CarneIn, vault: Vault = Depends(get_vault)) -> CarneOut:
     """Registra N parcelas no provider e monta o carnê (3-vias A4) no engine.
 
     Bancos registram cobranças individuais; o PDF de carnê é montado pelo
     BrCobrança (template 'carne'). Quando o banco devolve um nosso_numero
     registrado, ele é repassado ao render para o carnê bater com a cobrança.
+
+    As parcelas são registradas em paralelo (até `<PROVIDER>_MAX_CONCURRENCY`
+    em voo, do provider efetivo — brcobrança no fallback), e `cobrancas` volta
+    na ordem de `parcelas`. Parcela que falhar volta com status `erro` (motivo
+    em `raw`) e fica fora do PDF; sem nenhuma registrada, não há render.
     """
     provider = build_provider(
         provider=body.provider, tenant_id=body.tenant_id,
         account_config=body.account_config, vault=vault,
     )
 
-    cobrancas = [provider.registrar(p) for p in body.parcelas]
+    cobrancas = await _registrar_parcelas(provider, body.parcelas, max_concurrency(provider))
 
     boletos = []
     for parcela, cob in zip(body.parcelas, cobrancas):
+        if cob.status is Status.erro:
+            continue
         data = _to_engine_payload(parcela, body.account_config)
         if cob.id:  # usa o nosso_numero registrado pelo banco, se houver
             data["nosso_numero"] = cob.id
         boletos.append(data)
 
-    rendered = engine.render_carne(body.bank, boletos)
+    if not boletos:
+        return CarneOut(cobrancas=cobrancas)
+    rendered = await engine.render_carne(body.bank, boletos)
     return CarneOut(carne_pdf_base64=rendered.get("pdf_base64"), cobrancas=cobrancas)
+
+
+async def _registrar_parcelas(
+    provider: BankProvider, parcelas: list[Cobranca], limit: int
+) -> list[CobrancaOut]:
+    # Até `limit` registros em voo; gather preserva a ordem das parcelas.
+    sem = asyncio.Semaphore(limit)
+
+    async def registrar(n: int, parcela: Cobranca) -> CobrancaOut:
+        async with sem:
+            try:
+                return await provider.registrar(parcela)
+            except Exception as e:
+                # Qualquer falha (HTTP/transporte/OAuth, corpo inválido, mapeamento)
+                # derruba só esta parcela: as já registradas no banco voltam com id
+                raw = {"parcela": n, "erro": type(e).__name__, "detail": str(e)}
+                if isinstance(e, httpx.HTTPStatusError):
+                    raw["status_code"] = e.response.status_code
+                return CobrancaOut(status=Status.erro, raw=raw)
+
+    return list(await asyncio.gather(*(registrar(n, p) for n, p in enumerate(parcelas, 1))))
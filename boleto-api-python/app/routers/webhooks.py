@@ -25,7 +25,7 @@ async def _handle(banco: str, request: Request, tenant_id: str | None) -> Webhoo
     # Push assinado (HMAC) ao consumidor DONO do tenant (multi-sistema). Sem
     # tenant na rota, cai no destino global. forward_event no-op se não houver destino.
     cb = resolve_callback(tenant_id)
-    forward_event(event.model_dump(), url=cb[0] if cb else None, secret=cb[1] if cb else None)
+    await forward_event(event.model_dump(), url=cb[0] if cb else None, secret=cb[1] if cb else None)
     return event
 
 
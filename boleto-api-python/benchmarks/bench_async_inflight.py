@@ -0,0 +1,147 @@
+"""
+Benchmark: chamadas ao banco em voo por worker — rota sync (threadpool) vs. rota async.
+
+Sobe um banco falso local noutro processo (API C6: token OAuth +
+``/v1/bank-slips`` com ``--bank-ms`` de latência) e dispara ``--total`` ``POST /cobranca``
+(``provider=c6``) todos de uma vez, via ``httpx.ASGITransport`` contra a app
+em processo (um único event loop, como um worker uvicorn). Compara:
+
+- ``sync (threads)``: o caminho antigo — rota ``def`` + ``httpx.Client``
+  bloqueante por chamada; o Starlette roda cada uma no threadpool do anyio
+  (40 threads), então no máximo 40 chamadas ao banco ficam em voo;
+- ``async``: a rota ``/cobranca`` atual — provider e ``OAuthMtlsClient``
+  aguardados no event loop, sem teto de threads.
+
+Mostra o pico de chamadas simultâneas que o banco viu, tempo total e vazão.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_async_inflight.py [--total 1000] [--bank-ms 200]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+COBRANCA = {
+    "valor": "1000.00",
+    "vencimento": "2026-07-10",
+    "nosso_numero": "123",
+    "pagador": {"nome": "Fulano", "documento": "12345678901"},
+}
+BODY = {"tenant_id": "imob1", "provider": "c6", "cobranca": COBRANCA}
+
+
+class _Bank:
+    """API do banco (HTTP/1.1 keep-alive) em asyncio; pico de chamadas em voo em ``peak``."""
+
+    def __init__(self, latency, peak):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = peak
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while (line := await reader.readline()) not in (b'\r\n', b''):
+                    name, _, value = line.decode().partition(':')
+                    if name.lower() == 'content-length':
+                        length = int(value)
+                await reader.readexactly(length)
+                if b'/oauth/token' in request_line:
+                    body = {"access_token": "tok", "expires_in": 3600}
+                else:
+                    self.in_flight += 1
+                    self.peak.value = max(self.peak.value, self.in_flight)
+                    await asyncio.sleep(self.latency)
+                    self.in_flight -= 1
+                    body = {"id": "C6-1", "status": "REGISTERED"}
+                payload = json.dumps(body).encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                             b'Content-Length: %d\r\n\r\n%s' % (len(payload), payload))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _serve_bank(latency, port, peak):
+    async def serve():
+        server = await asyncio.start_server(_Bank(latency, peak).handle, '127.0.0.1', 0, backlog=4096)
+        port.value = server.sockets[0].getsockname()[1]
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def _sync_route(app, base_url):
+    # Réplica do caminho antigo: rota sync + httpx.Client bloqueante por chamada
+    from app.clients.oauth_mtls import _ssl_context
+    from app.schemas import CobrancaIn, CobrancaOut, Status
+
+    ctx = _ssl_context("", "")
+
+    @app.post('/bench/cobranca-sync', include_in_schema=False)
+    def registrar_sync(body: CobrancaIn) -> CobrancaOut:
+        payload = {"amount": float(body.cobranca.valor), "ourNumber": body.cobranca.nosso_numero}
+        with httpx.Client(verify=ctx, timeout=30.0) as c:
+            data = c.post(f"{base_url}/v1/bank-slips", json=payload,
+                          headers={"Authorization": "Bearer tok"}).json()
+        return CobrancaOut(id=data["id"], status=Status.registrado, raw=data)
+
+
+async def run(app, path, total):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://gw', timeout=None) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.post(path, json=BODY) for _ in range(total)))
+        elapsed = time.perf_counter() - start
+    assert all(r.status_code == 200 and r.json()['status'] == 'registrado' for r in responses), \
+        responses[0].text
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--total', type=int, default=1000)
+    parser.add_argument('--bank-ms', type=float, default=200)
+    args = parser.parse_args()
+
+    port, peak = multiprocessing.Value('i', 0), multiprocessing.Value('i', 0)
+    bank = multiprocessing.Process(target=_serve_bank, args=(args.bank_ms / 1000, port, peak), daemon=True)
+    bank.start()
+    while not port.value:
+        time.sleep(0.01)
+    base_url = f'http://127.0.0.1:{port.value}'
+    os.environ.update({
+        'C6_BASE_URL': base_url,
+        'C6_REGISTERED_READY': 'true',
+        'VAULT__imob1__c6__client_id': 'cid',
+        'VAULT__imob1__c6__client_secret': 'sec',
+    })
+    from app.main import app  # C6_BASE_URL é lido no import do provider
+
+    _sync_route(app, base_url)
+
+    print(f"{args.total} POST /cobranca (C6) simultâneos, banco {args.bank_ms:.0f} ms, 1 event loop")
+    print(f"{'rota':<15} {'pico em voo':>11} {'total (s)':>10} {'req/s':>8}")
+    for label, path in [('sync (threads)', '/bench/cobranca-sync'), ('async', '/cobranca')]:
+        peak.value = 0
+        elapsed = asyncio.run(run(app, path, args.total))
+        print(f"{label:<15} {peak.value:>11} {elapsed:>10.2f} {args.total / elapsed:>8.0f}")
+    bank.terminate()
+
+
+if __name__ == '__main__':
+    main()
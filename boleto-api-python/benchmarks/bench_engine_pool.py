@@ -0,0 +1,154 @@
+"""
+Benchmark: POST /cobranca (caminho brcobrança) com httpx.AsyncClient por chamada vs. pool do lifespan.
+
+Sobe um engine falso local (HTTP/1.1 keep-alive, ``--render-ms`` de render)
+e dispara ``--total`` ``POST /cobranca`` com ``provider=brcobranca`` em
+``--concurrency`` threads contra a app FastAPI em processo (TestClient).
+Compara:
+
+- ``por chamada``: comportamento antigo — um client httpx novo (contexto
+  SSL, pool, conexão TCP) por render, fechado em seguida;
+- ``pool``: ``engine.open_pool()`` do lifespan — um client por URL do
+  engine, conexões keep-alive reaproveitadas.
+
+Mostra p50/p99 por chamada, vazão e quantas conexões TCP o engine aceitou.
+Em loopback o handshake TCP é barato; o grosso da diferença é criar o
+client (SSLContext) por chamada. Contra um engine remoto/TLS o ganho cresce.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_engine_pool.py [--total 2000] [--concurrency 16]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.clients import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.providers import brcobranca_proxy  # noqa: E402
+
+RENDER = json.dumps({
+    "nosso_numero": "123",
+    "linha_digitavel": "34191.09008 00123.456789 00000.000000 1 13120000100000",
+    "codigo_barras": "34191131200001000001090000123456780000000000",
+    "pdf_base64": "JVBERi0xLjQK" * 2000,
+}).encode()
+
+BODY = {
+    "tenant_id": "imob1",
+    "provider": "brcobranca",
+    "account_config": {"bank": "itau", "agencia": "1234", "conta_corrente": "56789"},
+    "cobranca": {
+        "valor": "1000.00",
+        "vencimento": "2026-07-10",
+        "nosso_numero": "123",
+        "pagador": {"nome": "Fulano", "documento": "12345678901"},
+    },
+}
+
+
+class _Engine(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, render):
+        self.render = render
+        self.connections = 0
+        self._lock = threading.Lock()
+        super().__init__(('127.0.0.1', 0), _Handler)
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.server.render)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(RENDER)))
+        self.end_headers()
+        self.wfile.write(RENDER)
+
+    def log_message(self, *args):
+        pass
+
+
+class _OneShotClient(httpx.AsyncClient):
+    """Reproduz o código antigo: um client novo por render, fechado em seguida."""
+
+    async def post(self, *args, **kwargs):
+        try:
+            return await super().post(*args, **kwargs)
+        finally:
+            await self.aclose()
+
+
+def run(client, total, concurrency):
+    def call(_):
+        start = time.perf_counter()
+        r = client.post('/cobranca', json=BODY)
+        assert r.status_code == 200 and r.json()['status'] == 'registrado', r.text
+        return (time.perf_counter() - start) * 1000
+
+    for _ in range(concurrency):  # aquecimento
+        call(None)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = sorted(executor.map(call, range(total)))
+    return timings, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--total', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--render-ms', type=float, default=5)
+    args = parser.parse_args()
+
+    server = _Engine(args.render_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}'
+    brcobranca_proxy.ENGINE_URL = url
+    os.environ['BOLETO_ENGINE_URL'] = url
+    os.environ.setdefault('ENGINE_MAX_CONNECTIONS', str(args.concurrency))
+
+    original = engine.http_client
+    modes = [
+        ('por chamada', lambda base_url=None: _OneShotClient(timeout=30.0)),
+        ('pool', original),
+    ]
+
+    print(f"{args.total} POST /cobranca (brcobrança), {args.concurrency} simultâneos, "
+          f"render {args.render_ms:.0f} ms")
+    print(f"{'engine client':<13} {'conexões':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'req/s':>8}")
+    for label, factory in modes:
+        engine.http_client = factory
+        server.connections = 0
+        with TestClient(app) as client:
+            timings, elapsed = run(client, args.total, args.concurrency)
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{label:<13} {server.connections:>9} {statistics.median(timings):>9.1f} "
+              f"{p99:>9.1f} {args.total / elapsed:>8.0f}")
+    engine.http_client = original
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import base64
 import datetime
+from collections.abc import Iterator
 
 import pytest
 from cryptography import x509
@@ -32,8 +33,11 @@ def make_pfx_base64(password: bytes = b"secret") -> str:
 
 
 @pytest.fixture
-def client() -> TestClient:
-    return TestClient(app)
+def client() -> Iterator[TestClient]:
+    # `with` roda o lifespan (pool do engine) e mantém um único event loop,
+    # como no servidor: os clients async pooled são reaproveitados entre requests.
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
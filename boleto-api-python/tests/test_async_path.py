@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.core.sync import run_sync
+from app.main import app
+
+
+def test_cobrancas_concorrentes_nao_serializam(monkeypatch, cobranca_payload):
+    # Chamada ao banco "lenta": com a rota async as N esperas se sobrepõem no
+    # mesmo event loop, em vez de ocupar uma thread do pool cada.
+    monkeypatch.setenv("VAULT__imob1__c6__client_id", "cid")
+    monkeypatch.setenv("VAULT__imob1__c6__client_secret", "sec")
+    monkeypatch.setenv("C6_REGISTERED_READY", "true")
+    in_flight = peak = 0
+
+    async def fake_request(self, method, path, json=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.2)
+        in_flight -= 1
+        return {"id": json["ourNumber"], "status": "REGISTERED"}
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gw") as c:
+            bodies = [
+                {"tenant_id": "imob1", "provider": "c6",
+                 "cobranca": {**cobranca_payload, "nosso_numero": str(i)}}
+                for i in range(50)
+            ]
+            return await asyncio.gather(*(c.post("/cobranca", json=b) for b in bodies))
+
+    started = time.perf_counter()
+    responses = run_sync(scenario())
+    elapsed = time.perf_counter() - started
+
+    assert [r.json()["id"] for r in responses] == [str(i) for i in range(50)]
+    assert peak == 50
+    assert elapsed < 2.0  # serial seria >= 10s
+
+
+def test_run_sync_recusa_loop_rodando():
+    async def inner():
+        coro = asyncio.sleep(0)
+        try:
+            run_sync(coro)
+        finally:
+            coro.close()
+
+    with pytest.raises(RuntimeError, match="use await"):
+        asyncio.run(inner())
@@ -1,7 +1,13 @@
+import asyncio
+
 import httpx
+import pytest
 import respx
 
 from app.clients import engine
+from app.core.vault import EnvVault
+from app.registry import build_provider, max_concurrency
+from app.schemas import Provider
 
 
 @respx.mock
@@ -15,7 +21,7 @@ def test_carne_registra_parcelas_e_monta_pdf(client, cobranca_payload, monkeypat
     # cada parcela registrada no banco devolve um nosso_numero
     counter = {"n": 0}
 
-    def fake_request(self, method, path, json=None):
+    async def fake_request(self, method, path, json=None):
         counter["n"] += 1
         return {"id": f"C6-{counter['n']}", "status": "REGISTERED", "digitableLine": "00190..."}
 
@@ -44,3 +50,131 @@ def test_carne_registra_parcelas_e_monta_pdf(client, cobranca_payload, monkeypat
     sent = carne_route.calls.last.request
     assert b'"bank":"banco_c6"' in sent.content.replace(b" ", b"")
     assert b'"nosso_numero":"C6-1"' in sent.content.replace(b" ", b"")
+
+
+@pytest.fixture
+def c6_carne(monkeypatch, cobranca_payload):
+    monkeypatch.setenv("VAULT__imob1__c6__client_id", "cid")
+    monkeypatch.setenv("VAULT__imob1__c6__client_secret", "sec")
+    monkeypatch.setenv("C6_REGISTERED_READY", "true")
+    monkeypatch.setattr(engine, "engine_url", lambda: "http://engine.test")
+    return {
+        "tenant_id": "imob1",
+        "provider": "c6",
+        "bank": "banco_c6",
+        "parcelas": [{**cobranca_payload, "nosso_numero": str(n)} for n in range(1, 13)],
+    }
+
+
+@respx.mock
+def test_carne_registra_parcelas_em_paralelo_com_teto(client, c6_carne, monkeypatch):
+    monkeypatch.setenv("C6_MAX_CONCURRENCY", "4")
+    state = {"in_flight": 0, "peak": 0}
+
+    async def fake_request(self, method, path, json=None):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        # parcelas iniciais mais lentas: a ordem da resposta não segue a conclusão
+        await asyncio.sleep(0.01 * (13 - int(json["ourNumber"])))
+        state["in_flight"] -= 1
+        return {"id": f"C6-{json['ourNumber']}", "status": "REGISTERED"}
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
+    respx.post("http://engine.test/api/render/carne").mock(
+        return_value=httpx.Response(200, json={"pdf_base64": "JVBERi0xCg=="})
+    )
+
+    r = client.post("/carne", json=c6_carne)
+    assert r.status_code == 200, r.text
+    assert [c["id"] for c in r.json()["cobrancas"]] == [f"C6-{n}" for n in range(1, 13)]
+    assert state["peak"] == 4
+
+
+@respx.mock
+def test_carne_reporta_falha_por_parcela(client, c6_carne, monkeypatch):
+    async def fake_request(self, method, path, json=None):
+        if json["ourNumber"] == "3":
+            request = httpx.Request(method, f"https://c6.test{path}")
+            raise httpx.HTTPStatusError("422", request=request, response=httpx.Response(422, request=request))
+        return {"id": f"C6-{json['ourNumber']}", "status": "REGISTERED"}
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
+    carne_route = respx.post("http://engine.test/api/render/carne").mock(
+        return_value=httpx.Response(200, json={"pdf_base64": "JVBERi0xCg=="})
+    )
+
+    r = client.post("/carne", json=c6_carne)
+    assert r.status_code == 200, r.text
+    cobrancas = r.json()["cobrancas"]
+    assert len(cobrancas) == 12
+    assert cobrancas[2]["status"] == "erro"
+    assert cobrancas[2]["raw"]["parcela"] == 3
+    assert cobrancas[2]["raw"]["status_code"] == 422
+    assert all(c["status"] == "registrado" for i, c in enumerate(cobrancas) if i != 2)
+
+    # a parcela com erro fica fora do PDF
+    sent = carne_route.calls.last.request.content.replace(b" ", b"")
+    assert sent.count(b'"nosso_numero":') == 11
+    assert b'"nosso_numero":"C6-3"' not in sent
+
+
+@respx.mock
+def test_carne_excecao_inesperada_nao_perde_as_registradas(client, c6_carne, monkeypatch):
+    # ex.: corpo do banco que não é JSON -> ValueError; as outras parcelas já
+    # foram registradas e precisam voltar com id
+    async def fake_request(self, method, path, json=None):
+        if json["ourNumber"] == "5":
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")
+        return {"id": f"C6-{json['ourNumber']}", "status": "REGISTERED"}
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
+    respx.post("http://engine.test/api/render/carne").mock(
+        return_value=httpx.Response(200, json={"pdf_base64": "JVBERi0xCg=="})
+    )
+
+    r = client.post("/carne", json=c6_carne)
+    assert r.status_code == 200, r.text
+    cobrancas = r.json()["cobrancas"]
+    assert cobrancas[4]["status"] == "erro"
+    assert cobrancas[4]["raw"]["erro"] == "ValueError"
+    assert [c["id"] for i, c in enumerate(cobrancas) if i != 4] == [
+        f"C6-{n}" for n in range(1, 13) if n != 5
+    ]
+
+
+@respx.mock
+def test_carne_sem_parcela_registrada_nao_renderiza(client, c6_carne, monkeypatch):
+    async def fake_request(self, method, path, json=None):
+        raise httpx.ConnectError("banco fora")
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
+    carne_route = respx.post("http://engine.test/api/render/carne")
+
+    r = client.post("/carne", json=c6_carne)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["carne_pdf_base64"] is None
+    assert {c["status"] for c in data["cobrancas"]} == {"erro"}
+    assert not carne_route.called
+
+
+def test_max_concurrency_por_provider(monkeypatch):
+    monkeypatch.delenv("C6_MAX_CONCURRENCY", raising=False)
+    monkeypatch.setenv("SICOOB_MAX_CONCURRENCY", "2")
+    assert max_concurrency(Provider.c6) == 8
+    assert max_concurrency(Provider.sicoob) == 2
+
+
+def test_max_concurrency_invalido_usa_o_padrao(monkeypatch, caplog):
+    monkeypatch.setenv("C6_MAX_CONCURRENCY", "muitos")
+    assert max_concurrency(Provider.c6) == 8
+    assert "C6_MAX_CONCURRENCY" in caplog.text
+
+
+def test_max_concurrency_segue_o_provider_efetivo(monkeypatch):
+    # C6 não homologado cai no brcobrança: vale o teto do brcobrança
+    monkeypatch.delenv("C6_REGISTERED_READY", raising=False)
+    monkeypatch.setenv("C6_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("BRCOBRANCA_MAX_CONCURRENCY", "5")
+    p = build_provider(provider=Provider.c6, tenant_id="imob1", account_config={}, vault=EnvVault())
+    assert max_concurrency(p) == 5
@@ -1,5 +1,6 @@
 import pytest
 
+from app.core.sync import run_sync
 from app.providers.c6 import C6Provider, _map_status
 from app.schemas import Status
 
@@ -23,7 +24,7 @@ def test_c6_status_mapping():
 def test_c6_registrar_mapeia_payload_e_normaliza(client, cobranca_payload, c6_env, monkeypatch):
     captured = {}
 
-    def fake_request(self, method, path, json=None):
+    async def fake_request(self, method, path, json=None):
         captured.update(method=method, path=path, json=json)
         return {
             "id": "C6-1",
@@ -57,10 +58,10 @@ def test_c6_registrar_mapeia_payload_e_normaliza(client, cobranca_payload, c6_en
 
 
 def test_c6_consultar_e_baixar(c6_env, monkeypatch):
-    monkeypatch.setattr(
-        "app.clients.oauth_mtls.OAuthMtlsClient.request",
-        lambda self, method, path, json=None: {"status": "PAID"} if method == "GET" else {"status": "WRITTEN_OFF"},
-    )
+    async def fake_request(self, method, path, json=None):
+        return {"status": "PAID"} if method == "GET" else {"status": "WRITTEN_OFF"}
+
+    monkeypatch.setattr("app.clients.oauth_mtls.OAuthMtlsClient.request", fake_request)
     p = C6Provider(account_config={}, credentials={"client_id": "c", "client_secret": "s"})
-    assert p.consultar("X").status == Status.liquidado
-    assert p.baixar("X").status == Status.baixado
+    assert run_sync(p.consultar("X")).status == Status.liquidado
+    assert run_sync(p.baixar("X")).status == Status.baixado
@@ -28,7 +28,7 @@ def test_sicoob_client_usa_scopes_e_header_client_id():
 def test_sicoob_registrar_mapeia_identificadores_e_normaliza(client, cobranca_payload, sicoob_env, monkeypatch):
     captured = {}
 
-    def fake_request(self, method, path, json=None):
+    async def fake_request(self, method, path, json=None):
         captured.update(method=method, path=path, json=json)
         return {
             "resultado": {
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from app.clients import engine
+from app.core.sync import run_sync
+from app.main import app
+from app.providers import brcobranca_proxy
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("ENGINE_MAX_CONNECTIONS", "64")
+    monkeypatch.setenv("ENGINE_CONNECT_TIMEOUT", "1.5")
+    cfg = engine.PoolConfig.from_env()
+    assert cfg.max_connections == 64
+    assert cfg.connect_timeout == 1.5
+    assert cfg.timeout == 30.0
+
+
+def test_um_client_por_url():
+    pool = engine.EnginePool(engine.PoolConfig(timeout=10.0, connect_timeout=2.0))
+
+    async def scenario():
+        a = pool.client("http://a.test/")
+        assert pool.client("http://a.test") is a
+        assert pool.client("http://b.test") is not a
+        assert a.timeout == httpx.Timeout(10.0, connect=2.0)
+        await pool.aclose()
+        return a
+
+    assert run_sync(scenario()).is_closed
+
+
+def test_pool_preso_ao_loop_que_o_abriu():
+    # Conexões async só fecham no loop que as abriu: outro loop é erro, não vazamento
+    pool = engine.EnginePool()
+
+    async def get():
+        return pool.client("http://a.test")
+
+    loop = asyncio.new_event_loop()
+    try:
+        a = loop.run_until_complete(get())
+        with pytest.raises(RuntimeError, match="outro event loop"):
+            run_sync(get())
+        loop.run_until_complete(pool.aclose())
+        assert a.is_closed
+    finally:
+        loop.close()
+
+
+def test_run_sync_fecha_o_pool_aberto_no_seu_loop(monkeypatch):
+    monkeypatch.setattr(engine, "_pool", None)
+
+    async def get():
+        return engine.http_client("http://a.test")
+
+    c = run_sync(get())
+    assert c.is_closed
+    assert engine._pool is None
+    assert run_sync(get()) is not c  # novo loop, pool novo (também fechado ao fim)
+
+
+def test_lifespan_abre_e_fecha_o_pool(monkeypatch):
+    monkeypatch.setenv("BOLETO_ENGINE_URL", "http://engine.test")
+    with TestClient(app):
+        pool = app.state.engine_pool
+        assert engine.pool() is pool
+        c = pool._clients["http://engine.test"]
+    assert c.is_closed
+    assert engine._pool is None
+
+
+@respx.mock
+def test_cobranca_reusa_o_client_do_engine(cobranca_payload, monkeypatch):
+    monkeypatch.setenv("BOLETO_ENGINE_URL", "http://engine.test")
+    monkeypatch.setattr(brcobranca_proxy, "ENGINE_URL", "http://engine.test")
+    respx.post("http://engine.test/api/render/boleto").mock(
+        return_value=httpx.Response(200, json={"nosso_numero": "123"})
+    )
+    created = []
+    original = engine.EnginePool._new_client
+    monkeypatch.setattr(engine.EnginePool, "_new_client", lambda self: created.append(1) or original(self))
+
+    body = {"tenant_id": "imob1", "provider": "brcobranca", "account_config": {"bank": "itau"},
+            "cobranca": cobranca_payload}
+    with TestClient(app) as client:
+        for _ in range(3):
+            assert client.post("/cobranca", json=body).json()["status"] == "registrado"
+
+    assert len(created) == 1
@@ -6,6 +6,7 @@ import httpx
 import respx
 
 from app.core import forwarder
+from app.core.sync import run_sync
 
 
 def test_sign_is_deterministic_hmac_sha256():
@@ -16,7 +17,7 @@ def test_sign_is_deterministic_hmac_sha256():
 
 def test_forward_noop_sem_url(monkeypatch):
     monkeypatch.delenv("EVENT_WEBHOOK_URL", raising=False)
-    assert forwarder.forward_event({"event": "x"}) is False
+    assert run_sync(forwarder.forward_event({"event": "x"})) is False
 
 
 @respx.mock
@@ -28,7 +29,7 @@ def test_forward_posts_signed_event(monkeypatch):
     )
 
     event = {"event": "cobranca.atualizada", "id": "X1", "status": "liquidado"}
-    assert forwarder.forward_event(event) is True
+    assert run_sync(forwarder.forward_event(event)) is True
 
     sent = route.calls.last.request
     # assinatura confere com o corpo bruto enviado
@@ -41,7 +42,7 @@ def test_forward_override_por_chamada(monkeypatch):
     # override por chamada (callback por tenant) ignora o env global
     monkeypatch.delenv("EVENT_WEBHOOK_URL", raising=False)
     route = respx.post("https://tenant-cb.test/hook").mock(return_value=httpx.Response(204))
-    ok = forwarder.forward_event({"event": "x"}, url="https://tenant-cb.test/hook", secret="s")
+    ok = run_sync(forwarder.forward_event({"event": "x"}, url="https://tenant-cb.test/hook", secret="s"))
     assert ok is True
     assert route.calls.last.request.headers["x-signature"] == forwarder.sign(
         route.calls.last.request.content, "s"
@@ -52,4 +53,4 @@ def test_forward_override_por_chamada(monkeypatch):
 def test_forward_retorna_false_em_erro(monkeypatch):
     monkeypatch.setenv("EVENT_WEBHOOK_URL", "https://consumer.test/hook")
     respx.post("https://consumer.test/hook").mock(return_value=httpx.Response(500))
-    assert forwarder.forward_event({"event": "x"}) is False
+    assert run_sync(forwarder.forward_event({"event": "x"})) is False
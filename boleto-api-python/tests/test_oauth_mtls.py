@@ -1,7 +1,10 @@
+import asyncio
+
 import httpx
 import respx
 
 from app.clients.oauth_mtls import OAuthMtlsClient
+from app.core.sync import run_sync
 
 
 def _make_client(pfx_b64, client_id="cid"):
@@ -25,8 +28,8 @@ def test_authenticates_with_scopes_and_caches_token(pfx_b64):
     )
     c = _make_client(pfx_b64, client_id="unique-a")
 
-    assert c.token() == "tok"
-    assert c.token() == "tok"  # 2ª chamada usa cache
+    assert run_sync(c.token()) == "tok"
+    assert run_sync(c.token()) == "tok"  # 2ª chamada usa cache
     assert auth.call_count == 1
 
     # scopes vão no corpo do token como string separada por espaço
@@ -46,12 +49,27 @@ def test_request_sends_bearer_and_extra_headers(pfx_b64):
     )
     c = _make_client(pfx_b64, client_id="unique-b")
 
-    assert c.request("GET", "/v1/ping") == {"ok": True}
+    assert run_sync(c.request("GET", "/v1/ping")) == {"ok": True}
     req = ping.calls.last.request
     assert req.headers["authorization"] == "Bearer tok"
     assert req.headers["client_id"] == "unique-b"  # header extra do Sicoob
 
 
+@respx.mock
+def test_token_frio_faz_um_so_oauth_com_chamadas_concorrentes(pfx_b64):
+    OAuthMtlsClient._token_cache.clear()
+    auth = respx.post("https://api.test/oauth/token").mock(
+        return_value=httpx.Response(200, json={"access_token": "tok", "expires_in": 300})
+    )
+
+    async def scenario():
+        clients = [_make_client(pfx_b64, client_id="unique-d") for _ in range(10)]
+        return await asyncio.gather(*(c.token() for c in clients))
+
+    assert run_sync(scenario()) == ["tok"] * 10
+    assert auth.call_count == 1
+
+
 @respx.mock
 def test_request_raises_on_http_error(pfx_b64):
     OAuthMtlsClient._token_cache.clear()
@@ -62,7 +80,7 @@ def test_request_raises_on_http_error(pfx_b64):
     c = _make_client(pfx_b64, client_id="unique-c")
 
     try:
-        c.request("GET", "/v1/boom")
+        run_sync(c.request("GET", "/v1/boom"))
         assert False, "deveria ter levantado"
     except httpx.HTTPStatusError as e:
         assert e.response.status_code == 422
@@ -74,3 +92,12 @@ def test_build_ssl_context_loads_pkcs12(pfx_b64):
     import ssl
 
     assert isinstance(c._ssl, ssl.SSLContext)
+
+
+def test_ssl_context_reaproveitado_sem_reter_o_pfx(pfx_b64):
+    from app.clients import oauth_mtls
+
+    a, b = _make_client(pfx_b64), _make_client(pfx_b64)
+    assert a._ssl is b._ssl
+    # cache por digest: nem o .pfx nem a senha viram chave em memória
+    assert all(pfx_b64 not in k and "secret" not in k for k in oauth_mtls._ssl_cache)
@@ -25,7 +25,7 @@ def test_webhook_banco_desconhecido_ignora(client):
 def test_webhook_c6_faz_push_do_evento(client, monkeypatch):
     capturado = {}
 
-    def fake_forward(event, *, url=None, secret=None):
+    async def fake_forward(event, *, url=None, secret=None):
         capturado.update(event)
         return True
 
@@ -43,7 +43,7 @@ def test_webhook_por_tenant_roteia_para_o_consumidor_dono(client, monkeypatch):
     monkeypatch.setenv("SUB__imobA__SECRET", "segA")
     destino = {}
 
-    def fake_forward(event, *, url=None, secret=None):
+    async def fake_forward(event, *, url=None, secret=None):
         destino["url"] = url
         destino["secret"] = secret
         return True
@@ -23,6 +23,7 @@ require_relative 'boleto_api/services/ofx_parser_service'
 require_relative 'boleto_api/services/bank_info_service'
 require_relative 'boleto_api/middleware/error_handler'
 require_relative 'boleto_api/middleware/request_logger'
+require_relative 'boleto_api/middleware/gzip_request'
 require_relative 'boleto_api/endpoints/health_endpoint'
 require_relative 'boleto_api/endpoints/boleto_endpoint'
 require_relative 'boleto_api/endpoints/remessa_endpoint'
@@ -59,6 +60,7 @@ module BoletoApi
     # Middlewares
     use Middleware::RequestLogger
     use Middleware::ErrorHandler
+    use Middleware::GzipRequest
 
     # Monta endpoints
     mount Endpoints::HealthEndpoint
@@ -126,6 +126,16 @@ module BoletoApi
         documento_numero
       ].freeze
 
+      # Máximo de itens por chamada aos endpoints /api/boleto/batch/*
+      MAX_BATCH_ITEMS = Integer(ENV.fetch('BOLETO_MAX_BATCH_ITEMS', 1000))
+
+      # max-age (segundos) do Cache-Control de /api/info, /api/metadata e /api/bancos
+      DISCOVERY_MAX_AGE = Integer(ENV.fetch('BOLETO_DISCOVERY_MAX_AGE', 300))
+
+      # Limite (bytes) do corpo descomprimido de requisições com
+      # Content-Encoding: gzip; acima disso responde 413 (proteção contra gzip bomb)
+      MAX_INFLATED_BODY_BYTES = Integer(ENV.fetch('BOLETO_MAX_INFLATED_BODY_BYTES', 100 * 1024 * 1024))
+
       # Content types para cada formato de saída
       CONTENT_TYPES = {
         'pdf' => 'application/pdf',
@@ -8,15 +8,28 @@ module BoletoApi
     class BoletoEndpoint < Grape::API
       format :json
 
-      resource :boleto do
-        desc 'Valida dados do boleto'
-        params do
-          requires :bank, type: String, desc: 'Nome do banco (ex: itau, banco_brasil)'
-          requires :data, type: String, desc: 'Dados do boleto em JSON'
+      # include_data=headers: só campos escalares de tamanho fixo, um header cada.
+      # Texto livre (instruções, sacado, endereço) não vai em header — estouraria
+      # o limite de proxies/Puma; para ele use include_data=true ou /boleto/data.
+      INFO_HEADERS = {
+        'X-Banco' => :bank,
+        'X-Valor' => :valor,
+        'X-Data-Vencimento' => :data_vencimento,
+        'X-Agencia-Conta' => :agencia_conta_boleto,
+        'X-Carteira' => :carteira
+      }.freeze
+
+      helpers do
+        params :batch_items do
+          requires :items, type: Array, desc: 'Lista de boletos ({ bank, data }), processados em ordem' do
+            requires :bank, type: String, desc: 'Nome do banco'
+            requires :data, type: Hash, desc: 'Dados do boleto'
+          end
         end
-        get :validate do
-          values = JSON.parse(params[:data])
-          result = Services::BoletoService.validate(params[:bank], values)
+
+        # Respostas compartilhadas entre GET (data= na query) e POST (corpo JSON)
+        def validate_response(bank, values)
+          result = Services::BoletoService.validate(bank, values)
 
           if result[:valid]
             { valid: true, message: 'Dados do boleto são válidos' }
@@ -29,14 +42,8 @@ module BoletoApi
           end
         end
 
-        desc 'Retorna dados completos do boleto (sem gerar arquivo)'
-        params do
-          requires :bank, type: String, desc: 'Nome do banco'
-          requires :data, type: String, desc: 'Dados do boleto em JSON'
-        end
-        get :data do
-          values = JSON.parse(params[:data])
-          result = Services::BoletoService.data(params[:bank], values)
+        def data_response(bank, values)
+          result = Services::BoletoService.data(bank, values)
 
           if result[:valid]
             result.except(:valid)
@@ -48,14 +55,8 @@ module BoletoApi
           end
         end
 
-        desc 'Gera nosso_numero e dados relacionados'
-        params do
-          requires :bank, type: String, desc: 'Nome do banco'
-          requires :data, type: String, desc: 'Dados do boleto em JSON'
-        end
-        get :nosso_numero do
-          values = JSON.parse(params[:data])
-          result = Services::BoletoService.nosso_numero(params[:bank], values)
+        def nosso_numero_response(bank, values)
+          result = Services::BoletoService.nosso_numero(bank, values)
 
           if result[:valid]
             result.except(:valid)
@@ -67,13 +68,114 @@ module BoletoApi
           end
         end
 
+        def batch_response(operation)
+          items = params[:items]
+          if items.size > Config::Constants::MAX_BATCH_ITEMS
+            error!({
+              error: "Lote com #{items.size} itens excede o máximo de #{Config::Constants::MAX_BATCH_ITEMS}",
+              hint: 'Divida em chamadas menores'
+            }, 400)
+          end
+
+          results = Services::BoletoService.batch(operation, items.map(&:to_h))
+          valid_count = results.count { |r| r[:valid] }
+
+          status 200
+          {
+            total: results.size,
+            valid_count: valid_count,
+            invalid_count: results.size - valid_count,
+            results: results
+          }
+        end
+      end
+
+      resource :boleto do
+        desc 'Valida dados do boleto'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco (ex: itau, banco_brasil)'
+          requires :data, type: String, desc: 'Dados do boleto em JSON'
+        end
+        get :validate do
+          validate_response(params[:bank], JSON.parse(params[:data]))
+        end
+
+        desc 'Valida dados do boleto (corpo JSON, sem limite de tamanho de URL)'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco (ex: itau, banco_brasil)'
+          requires :data, type: Hash, desc: 'Dados do boleto'
+        end
+        post :validate do
+          status 200
+          validate_response(params[:bank], params[:data].to_h)
+        end
+
+        desc 'Retorna dados completos do boleto (sem gerar arquivo)'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco'
+          requires :data, type: String, desc: 'Dados do boleto em JSON'
+        end
+        get :data do
+          data_response(params[:bank], JSON.parse(params[:data]))
+        end
+
+        desc 'Retorna dados completos do boleto (corpo JSON)'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco'
+          requires :data, type: Hash, desc: 'Dados do boleto'
+        end
+        post :data do
+          status 200
+          data_response(params[:bank], params[:data].to_h)
+        end
+
+        desc 'Gera nosso_numero e dados relacionados'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco'
+          requires :data, type: String, desc: 'Dados do boleto em JSON'
+        end
+        get :nosso_numero do
+          nosso_numero_response(params[:bank], JSON.parse(params[:data]))
+        end
+
+        desc 'Gera nosso_numero e dados relacionados (corpo JSON)'
+        params do
+          requires :bank, type: String, desc: 'Nome do banco'
+          requires :data, type: Hash, desc: 'Dados do boleto'
+        end
+        post :nosso_numero do
+          status 200
+          nosso_numero_response(params[:bank], params[:data].to_h)
+        end
+
+        namespace :batch do
+          desc 'Valida vários boletos numa chamada (resultado por item, na ordem)'
+          params { use :batch_items }
+          post :validate do
+            batch_response(:validate)
+          end
+
+          desc 'Dados calculados de vários boletos numa chamada'
+          params { use :batch_items }
+          post :data do
+            batch_response(:data)
+          end
+
+          desc 'nosso_numero de vários boletos numa chamada'
+          params { use :batch_items }
+          post :nosso_numero do
+            batch_response(:nosso_numero)
+          end
+        end
+
         desc 'Gera boleto em PDF, JPG, PNG ou TIF'
         params do
           requires :bank, type: String, desc: 'Nome do banco'
           requires :type, type: String, values: Config::Constants::OUTPUT_TYPES, desc: 'Formato de saída'
           requires :data, type: String, desc: 'Dados do boleto em JSON'
           optional :include_data, type: String, default: 'false',
-                   desc: 'Se "true", retorna JSON com dados do boleto + arquivo em base64.'
+                   desc: 'Se "true", retorna JSON com dados do boleto + arquivo em base64. ' \
+                         'Se "headers", retorna o binário e os dados completos no header X-Boleto-Info (JSON).'
           optional :template, type: String, values: Config::Constants::TEMPLATES,
                    default: Config::Constants.default_template,
                    desc: 'Template: "rghost" (GhostScript), "prawn" (Ruby puro) ou "carne" (carnê Prawn). ' \
@@ -113,6 +215,16 @@ module BoletoApi
             header['X-Codigo-Barras'] = meta[:codigo_barras].to_s
             header['X-Linha-Digitavel'] = meta[:linha_digitavel].to_s
 
+            # Modo headers: banco, valor, vencimento, agência/conta e carteira,
+            # sem base64 no corpo (ver INFO_HEADERS)
+            if params[:include_data].to_s.downcase == 'headers'
+              data_result = Services::BoletoService.data(params[:bank], values)
+              INFO_HEADERS.each do |name, key|
+                value = data_result[key]
+                header[name] = value.to_s unless value.nil?
+              end
+            end
+
             env['api.format'] = :binary
             result[:content]
           end
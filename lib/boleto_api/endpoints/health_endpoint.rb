@@ -1,32 +1,51 @@
 # frozen_string_literal: true
 
+require 'digest'
+
 module BoletoApi
   module Endpoints
     # Endpoints de health check, informacoes e metadados
     class HealthEndpoint < Grape::API
       format :json
 
+      helpers do
+        # Respostas de descoberta mudam só com deploy: ETag do corpo JSON e
+        # Cache-Control com max-age. If-None-Match com o ETag atual recebe 304.
+        def cacheable(payload)
+          etag = %("#{Digest::SHA256.hexdigest(payload.to_json)[0, 32]}")
+          header['ETag'] = etag
+          header['Cache-Control'] = "public, max-age=#{Config::Constants::DISCOVERY_MAX_AGE}"
+
+          candidates = env['HTTP_IF_NONE_MATCH'].to_s.split(',').map { |tag| tag.strip.delete_prefix('W/') }
+          return payload unless candidates.include?(etag) || candidates.include?('*')
+
+          body false
+          status 304
+        end
+      end
+
       desc 'Health check da API'
       get '/health' do
+        header['Cache-Control'] = 'no-cache'
         { status: 'OK', timestamp: Time.now.iso8601 }
       end
 
       desc 'Informacoes da API'
       get '/info' do
-        {
+        cacheable(
           name: 'Boleto CNAB API',
           version: BoletoApi::VERSION,
           supported_banks: Config::Constants::SUPPORTED_BANKS,
           supported_formats: Config::Constants::OUTPUT_TYPES,
           cnab_types: Config::Constants::CNAB_TYPES
-        }
+        )
       end
 
       desc 'Metadados da API e gem brcobranca'
       get '/metadata' do
         brcobranca_version = Gem.loaded_specs['brcobranca']&.version&.to_s rescue 'unknown'
 
-        {
+        cacheable(
           api: {
             name: 'Boleto CNAB API',
             version: BoletoApi::VERSION,
@@ -45,6 +64,12 @@ module BoletoApi
             boleto_validate: 'GET /api/boleto/validate',
             boleto_data: 'GET /api/boleto/data',
             boleto_nosso_numero: 'GET /api/boleto/nosso_numero',
+            boleto_validate_post: 'POST /api/boleto/validate',
+            boleto_data_post: 'POST /api/boleto/data',
+            boleto_nosso_numero_post: 'POST /api/boleto/nosso_numero',
+            boleto_batch_validate: 'POST /api/boleto/batch/validate',
+            boleto_batch_data: 'POST /api/boleto/batch/data',
+            boleto_batch_nosso_numero: 'POST /api/boleto/batch/nosso_numero',
             boleto_generate: 'GET /api/boleto',
             boleto_multi: 'POST /api/boleto/multi',
             remessa: 'POST /api/remessa',
@@ -56,12 +81,12 @@ module BoletoApi
             openapi_json: 'GET /api/openapi.json',
             openapi_yaml: 'GET /api/openapi.yaml'
           }
-        }
+        )
       end
 
       desc 'Lista bancos suportados com capacidades detalhadas'
       get '/bancos' do
-        Services::BankInfoService.all
+        cacheable(Services::BankInfoService.all)
       end
     end
   end
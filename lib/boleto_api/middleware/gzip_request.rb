@@ -0,0 +1,67 @@
+# frozen_string_literal: true
+
+require 'stringio'
+require 'zlib'
+
+module BoletoApi
+  module Middleware
+    # Descomprime corpos de requisição enviados com Content-Encoding: gzip.
+    #
+    # Listas do /multi, remessas e arquivos de retorno são texto e comprimem
+    # 5-10x; o cliente Python envia gzip a partir de um limite de tamanho
+    # (opt-in). Roda antes do Formatter do Grape, então JSON e multipart são
+    # parseados já descomprimidos. O corpo inflado é limitado por
+    # MAX_INFLATED_BODY_BYTES (413 acima disso).
+    class GzipRequest < Grape::Middleware::Base
+      GZIP_ENCODINGS = %w[gzip x-gzip].freeze
+      CHUNK_SIZE = 64 * 1024
+
+      class BodyTooLarge < StandardError; end
+
+      def call(env)
+        encoding = env['HTTP_CONTENT_ENCODING'].to_s.strip.downcase
+        return @app.call(env) if encoding.empty? || encoding == 'identity'
+
+        unless GZIP_ENCODINGS.include?(encoding)
+          return error(415, 'Content-Encoding não suportado', "use gzip (recebido #{encoding})", 'UnsupportedEncoding')
+        end
+
+        body = inflate(env['rack.input'])
+        env['rack.input'] = StringIO.new(body)
+        env['CONTENT_LENGTH'] = body.bytesize.to_s
+        env.delete('HTTP_CONTENT_ENCODING')
+        @app.call(env)
+      rescue Zlib::Error => e
+        error(400, 'Corpo gzip inválido', e.message, 'GzipError')
+      rescue BodyTooLarge
+        error(413, 'Corpo muito grande',
+              "descomprimido excede #{Config::Constants::MAX_INFLATED_BODY_BYTES} bytes", 'BodyTooLarge')
+      end
+
+      private
+
+      def inflate(input)
+        return String.new(encoding: Encoding::BINARY) if input.nil?
+
+        limit = Config::Constants::MAX_INFLATED_BODY_BYTES
+        reader = Zlib::GzipReader.new(input)
+        body = String.new(encoding: Encoding::BINARY)
+        while (chunk = reader.read(CHUNK_SIZE))
+          body << chunk
+          raise BodyTooLarge if body.bytesize > limit
+        end
+        body
+      ensure
+        reader&.finish
+      end
+
+      def error(status, message, details, type)
+        [
+          status,
+          { 'Content-Type' => 'application/json; charset=utf-8' },
+          [{ error: message, details: details, type: type }.to_json]
+        ]
+      end
+    end
+  end
+end
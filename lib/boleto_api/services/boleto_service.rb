@@ -7,6 +7,9 @@ module BoletoApi
   module Services
     # Serviço para operações com boletos
     class BoletoService
+      # Operações aceitas por BoletoService.batch
+      BATCH_OPERATIONS = %i[validate data nosso_numero].freeze
+
       class << self
         # Cria um objeto boleto a partir dos parâmetros
         #
@@ -198,6 +201,38 @@ module BoletoApi
           }
         end
 
+        # Executa validate/data/nosso_numero para vários boletos numa chamada
+        #
+        # Cada item é processado de forma independente: um item inválido (ou
+        # de banco não suportado) não impede os demais.
+        #
+        # @param operation [Symbol] :validate, :data ou :nosso_numero
+        # @param items [Array<Hash>] Lista de { 'bank' => String, 'data' => Hash }
+        # @return [Array<Hash>] Um resultado por item, na ordem recebida
+        #   ({ index:, valid: true, ... } ou { index:, valid: false, errors: } /
+        #   { index:, valid: false, error: })
+        def batch(operation, items)
+          unless BATCH_OPERATIONS.include?(operation)
+            raise ArgumentError, "Operação '#{operation}' não suportada em lote"
+          end
+
+          items.each_with_index.map do |item, index|
+            bank = item['bank'] || item[:bank]
+            values = (item['data'] || item[:data] || {}).to_h
+
+            begin
+              result = public_send(operation, bank, values)
+              if result[:valid]
+                { index: index + 1 }.merge(operation == :validate ? { valid: true } : result)
+              else
+                { index: index + 1, valid: false, errors: result[:errors] }
+              end
+            rescue ArgumentError => e
+              { index: index + 1, valid: false, error: e.message }
+            end
+          end
+        end
+
         private
 
         def validate_bank!(bank)
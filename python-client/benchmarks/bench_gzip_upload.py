@@ -0,0 +1,95 @@
+"""
+Benchmark: uploads do /multi, remessa e retorno crus vs. com gzip.
+
+Monta os corpos multipart como o ``BoletoClient`` envia e mede, para cada
+nível de compressão, o tamanho no fio, o tempo de ``gzip`` no cliente e o
+tempo estimado de transferência num link WAN de ``--mbps``:
+
+- ``/multi``: ``--boletos`` boletos (lista JSON, variando sacado/valor/nosso número);
+- remessa: ``--boletos`` pagamentos;
+- retorno: arquivo CNAB 240 com 2 segmentos (T/U) por título.
+
+Os dados são sintéticos mas seguem o formato real (campos numéricos com
+zeros à esquerda, nomes repetidos); arquivos de produção costumam comprimir
+na mesma faixa.
+
+Uso:
+    python benchmarks/bench_gzip_upload.py [--boletos 2000] [--mbps 20]
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+
+from urllib3.filepost import encode_multipart_formdata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from boleto_cnab_client.client import _json_upload  # noqa: E402
+
+SACADOS = ["Maria da Silva", "João Souza", "Comercial Andrade LTDA", "Ana Paula Ferreira", "José Santos"]
+
+
+def boletos(n):
+    return [{
+        "bank": "sicoob",
+        "agencia": "3073",
+        "conta_corrente": "12345678",
+        "convenio": "229385",
+        "carteira": "1",
+        "nosso_numero": f"{i:07d}",
+        "numero_documento": f"NF-{100000 + i}",
+        "cedente": "Empresa Teste LTDA",
+        "documento_cedente": "12345678000199",
+        "sacado": SACADOS[i % len(SACADOS)],
+        "sacado_documento": f"{(i * 7919) % 10 ** 11:011d}",
+        "sacado_endereco": f"Rua das Flores, {i % 900 + 1} - Centro - Belo Horizonte/MG",
+        "valor": round(50 + (i * 37) % 5000 + (i % 100) / 100, 2),
+        "data_vencimento": f"2025/{i % 12 + 1:02d}/{i % 28 + 1:02d}",
+        "instrucao1": "Não receber após o vencimento.",
+    } for i in range(n)]
+
+
+def retorno(n):
+    linhas = ["75600000" + "0" * 9 + "2" + "12345678000199".rjust(14, "0") + " " * 200]
+    for i in range(n):
+        valor = f"{(i * 37) % 500000:015d}"
+        linhas.append(f"7560001300{i * 2 + 1:05d}T 06" + "0" * 20 + f"{i:020d}" + " " * 40 + valor + " " * 150)
+        linhas.append(f"7560001300{i * 2 + 2:05d}U 06" + valor * 6 + "15012501012025" + " " * 100)
+    linhas.append("75699999" + " " * 232)
+    return ("\r\n".join(line[:240].ljust(240) for line in linhas) + "\r\n").encode("ascii")
+
+
+def multipart(fields):
+    body, _ = encode_multipart_formdata(fields)
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--boletos', type=int, default=2000)
+    parser.add_argument('--mbps', type=float, default=20, help='banda do link (Mbit/s)')
+    args = parser.parse_args()
+
+    bodies = [
+        ('/multi', multipart({'type': 'pdf', 'data': _json_upload('boletos.json', boletos(args.boletos))})),
+        ('remessa', multipart({'data': _json_upload('remessa.json', {'pagamentos': boletos(args.boletos)})})),
+        ('retorno', multipart({'data': ('retorno.ret', retorno(args.boletos))})),
+    ]
+    bytes_per_s = args.mbps * 1e6 / 8
+
+    print(f"{args.boletos} títulos, link de {args.mbps:.0f} Mbit/s")
+    print(f"{'upload':<8} {'nível':>5} {'bytes':>10} {'razão':>6} {'gzip (ms)':>10} {'envio (ms)':>11}")
+    for label, body in bodies:
+        print(f"{label:<8} {'-':>5} {len(body):>10} {1:>6.1f} {0:>10.1f} {len(body) / bytes_per_s * 1000:>11.0f}")
+        for level in (1, 6, 9):
+            start = time.perf_counter()
+            compressed = gzip.compress(body, compresslevel=level)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{'':<8} {level:>5} {len(compressed):>10} {len(body) / len(compressed):>6.1f} "
+                  f"{elapsed:>10.1f} {len(compressed) / bytes_per_s * 1000:>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
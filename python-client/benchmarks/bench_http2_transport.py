@@ -0,0 +1,204 @@
+"""
+Benchmark: transporte HTTP/1.1 (requests) vs. HTTP/2 (httpx) com 64 renders simultâneos.
+
+Dispara ``--total`` chamadas a ``generate_boleto`` com ``--concurrency``
+threads (padrão 64) e conta quantas conexões TCP o servidor aceitou e a
+latência p50/p99 por chamada, nos dois transportes do ``BoletoClient``:
+
+- ``requests``: urllib3, HTTP/1.1 — uma conexão por requisição em voo;
+- ``http2``: ``HTTPXAdapter`` com HTTP/2 "prior knowledge" (h2c), as
+  requisições multiplexadas na mesma conexão.
+
+Os servidores rodam no mesmo processo (HTTP/1.1 com ``ThreadingHTTPServer``,
+HTTP/2 com ``asyncio`` + ``h2``) e simulam o tempo de render do engine com
+``--render-ms``. Em produção o HTTP/2 costuma terminar num proxy (nginx,
+ALB) na frente do engine; sem TLS aqui, o ganho do handshake não aparece —
+só o número de conexões e a fila.
+
+Requer ``pip install boleto-cnab-client[http2]``.
+
+Uso:
+    python benchmarks/bench_http2_transport.py [--total 640] [--render-ms 20]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from boleto_cnab_client import BoletoClient, HTTPXAdapter  # noqa: E402
+
+BOLETO = {
+    "agencia": "3073",
+    "conta_corrente": "12345678",
+    "convenio": "01234567",
+    "carteira": "18",
+    "nosso_numero": "12345678",
+    "cedente": "Empresa Teste LTDA",
+    "documento_cedente": "12345678000199",
+    "sacado": "Cliente Teste",
+    "sacado_documento": "12345678901",
+    "valor": 150.00,
+    "data_vencimento": "2025/12/31",
+}
+
+PDF = b"%PDF-1.4 " + b"0" * 48 * 1024
+
+
+class _HTTP1Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, render: float):
+        self.render = render
+        self.connections = 0
+        self._lock = threading.Lock()
+        super().__init__(('127.0.0.1', 0), _HTTP1Handler)
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(self.server.render)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(PDF)))
+        self.end_headers()
+        self.wfile.write(PDF)
+
+    def log_message(self, *args):
+        pass
+
+
+class _H2Protocol(asyncio.Protocol):
+    """Servidor h2c mínimo: responde o PDF a cada stream após ``render``."""
+
+    def __init__(self, server: '_HTTP2Server'):
+        self.server = server
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self.pending = {}  # stream_id -> bytes ainda não enviados (controle de fluxo)
+
+    def connection_made(self, transport):
+        self.server.connections += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.server.loop.call_later(self.server.render, self._respond, event.stream_id)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._flush()
+            elif isinstance(event, h2.events.StreamReset):
+                self.pending.pop(event.stream_id, None)
+        self.transport.write(self.conn.data_to_send())
+
+    def _respond(self, stream_id):
+        self.conn.send_headers(stream_id, [
+            (':status', '200'),
+            ('content-type', 'application/pdf'),
+            ('content-length', str(len(PDF))),
+        ])
+        self.pending[stream_id] = PDF
+        self._flush()
+
+    def _flush(self):
+        for stream_id, data in list(self.pending.items()):
+            size = min(len(data), self.conn.local_flow_control_window(stream_id),
+                       self.conn.max_outbound_frame_size)
+            while size > 0:
+                self.conn.send_data(stream_id, data[:size])
+                data = data[size:]
+                size = min(len(data), self.conn.local_flow_control_window(stream_id),
+                           self.conn.max_outbound_frame_size)
+            if data:
+                self.pending[stream_id] = data
+            else:
+                self.conn.end_stream(stream_id)
+                del self.pending[stream_id]
+        self.transport.write(self.conn.data_to_send())
+
+
+class _HTTP2Server:
+    def __init__(self, render: float):
+        self.render = render
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self._server = self.loop.run_until_complete(
+            self.loop.create_server(lambda: _H2Protocol(self), '127.0.0.1', 0)
+        )
+        self.server_port = self._server.sockets[0].getsockname()[1]
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def shutdown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def run(client, total, concurrency):
+    def render(_):
+        start = time.perf_counter()
+        client.generate_boleto('banco_brasil', BOLETO)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = sorted(executor.map(render, range(total)))
+    elapsed = time.perf_counter() - start
+    return timings, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--total', type=int, default=640)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--render-ms', type=float, default=20)
+    args = parser.parse_args()
+    render = args.render_ms / 1000
+
+    http1 = _HTTP1Server(render)
+    threading.Thread(target=http1.serve_forever, daemon=True).start()
+    http2 = _HTTP2Server(render)
+
+    rows = [
+        ('requests', http1, BoletoClient(
+            f'http://127.0.0.1:{http1.server_port}', retries=0, coalesce=False,
+            pool_maxsize=args.concurrency
+        )),
+        ('http2', http2, BoletoClient(
+            f'http://127.0.0.1:{http2.server_port}', retries=0, coalesce=False,
+            transport=HTTPXAdapter(http2=True, http1=False, max_connections=args.concurrency)
+        )),
+    ]
+
+    print(f"{args.total} renders, {args.concurrency} simultâneos, render {args.render_ms:.0f} ms")
+    print(f"{'transporte':<10} {'conexões':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'renders/s':>10}")
+    for label, server, client in rows:
+        timings, elapsed = run(client, args.total, args.concurrency)
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{label:<10} {server.connections:>9} {statistics.median(timings):>9.1f} "
+              f"{p99:>9.1f} {args.total / elapsed:>10.0f}")
+        client.close()
+
+    http1.shutdown()
+    http2.shutdown()
+
+
+if __name__ == '__main__':
+    main()
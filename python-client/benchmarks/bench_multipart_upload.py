@@ -0,0 +1,130 @@
+"""
+Benchmark: upload multipart do /api/boleto/multi com e sem arquivo temporário.
+
+Compara o fluxo legado (``json.dump`` num ``NamedTemporaryFile``, reabrir,
+enviar e ``unlink``) com o fluxo atual do ``BoletoClient`` (JSON serializado
+direto em memória), para listas de 1k e 10k boletos.
+
+Mede latência por chamada e, no Linux, as syscalls de leitura/escrita do
+processo (``/proc/self/io``: ``syscr``/``syscw``). O servidor HTTP roda no
+mesmo processo e tem o mesmo custo nos dois fluxos, então a diferença entre
+eles é o que o arquivo temporário custa.
+
+Uso:
+    python benchmarks/bench_multipart_upload.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from boleto_cnab_client import BoletoClient  # noqa: E402
+
+BOLETO = {
+    "agencia": "3073",
+    "conta_corrente": "12345678",
+    "convenio": "01234567",
+    "carteira": "18",
+    "nosso_numero": "12345678",
+    "numero_documento": "DOC-001",
+    "cedente": "Empresa Teste LTDA",
+    "documento_cedente": "12345678000199",
+    "sacado": "Cliente Teste",
+    "sacado_documento": "12345678901",
+    "sacado_endereco": "Rua das Flores, 123 - Centro - Belo Horizonte/MG",
+    "valor": 150.00,
+    "data_vencimento": "2025/12/31",
+    "instrucao1": "Não receber após o vencimento",
+    "instrucao2": "Multa de 2% após o vencimento",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        body = b"%PDF-1.4 benchmark"
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def legacy_multi_request(client, boletos, file_type='pdf', template='rghost'):
+    """Reprodução do _multi_request anterior (arquivo temporário)."""
+    f = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
+    json.dump(boletos, f)
+    f.close()
+    try:
+        with open(f.name, 'rb') as fp:
+            response = client._make_request(
+                'POST',
+                f'/api/boleto/multi?template={template}',
+                data={'type': file_type},
+                files={'data': fp}
+            )
+        return response.content
+    finally:
+        os.unlink(f.name)
+
+
+def io_syscalls():
+    """Retorna syscr + syscw do processo (Linux) ou None."""
+    try:
+        with open('/proc/self/io') as f:
+            stats = dict(line.split(': ') for line in f.read().splitlines())
+        return int(stats['syscr']) + int(stats['syscw'])
+    except (OSError, KeyError):
+        return None
+
+
+def measure(fn, repeat):
+    timings, syscalls = [], []
+    for _ in range(repeat):
+        before = io_syscalls()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+        after = io_syscalls()
+        if before is not None and after is not None:
+            syscalls.append(after - before)
+    return statistics.median(timings), (statistics.median(syscalls) if syscalls else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = BoletoClient(f'http://127.0.0.1:{server.server_port}', retries=0)
+
+    print(f"{'boletos':>8} {'modo':<10} {'p50 (ms)':>10} {'syscalls I/O':>14}")
+    for size in (1_000, 10_000):
+        boletos = [dict(BOLETO, nosso_numero=str(i)) for i in range(size)]
+        rows = [
+            ('tempfile', lambda: legacy_multi_request(client, boletos)),
+            ('memória', lambda: client.generate_multiple_boletos(boletos)),
+        ]
+        for label, fn in rows:
+            fn()  # aquecimento (conexão keep-alive)
+            p50, sys_io = measure(fn, args.repeat)
+            sys_txt = f"{sys_io:.0f}" if sys_io is not None else 'n/d'
+            print(f"{size:>8} {label:<10} {p50:>10.1f} {sys_txt:>14}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
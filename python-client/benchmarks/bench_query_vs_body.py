@@ -0,0 +1,87 @@
+"""
+Benchmark: payload de validate/data/nosso_numero na query string vs. corpo JSON.
+
+Mede, por chamada, o custo de codificar (cliente) e decodificar (servidor) o
+boleto nas duas formas aceitas pelo engine:
+
+- GET: ``json.dumps`` + URL-encoding em ``?bank=...&data=...``; o servidor
+  desfaz o URL-encoding e depois o JSON;
+- POST: ``{"bank": ..., "data": {...}}`` no corpo; o servidor só decodifica JSON.
+
+A decodificação do lado do servidor é reproduzida com ``urllib.parse`` e
+``json`` da biblioteca padrão — o engine Ruby faz os mesmos dois passos
+(Rack + ``JSON.parse``). Também mostra o tamanho da URL resultante, que é o
+que esbarra no limite de proxies (tipicamente 8 KB).
+
+Uso:
+    python benchmarks/bench_query_vs_body.py [--number 2000]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from urllib.parse import parse_qs, urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from boleto_cnab_client.client import _json_body  # noqa: E402
+
+BOLETO = {
+    "agencia": "3073",
+    "conta_corrente": "12345678",
+    "convenio": "01234567",
+    "carteira": "18",
+    "nosso_numero": "12345678",
+    "numero_documento": "DOC-001",
+    "cedente": "Empresa Teste LTDA",
+    "documento_cedente": "12345678000199",
+    "sacado": "Cliente Teste",
+    "sacado_documento": "12345678901",
+    "sacado_endereco": "Rua das Flores, 123 - Centro - Belo Horizonte/MG",
+    "valor": 150.00,
+    "data_vencimento": "2025/12/31",
+}
+
+INSTRUCAO = "Não receber após o vencimento. Multa de 2% e juros de 1% a.m. "
+
+
+def query_encode(bank, data):
+    return '/api/boleto/data?' + urlencode({'bank': bank, 'data': json.dumps(data)})
+
+
+def query_decode(url):
+    params = parse_qs(url.split('?', 1)[1])
+    return params['bank'][0], json.loads(params['data'][0])
+
+
+def body_decode(body):
+    payload = json.loads(body)
+    return payload['bank'], payload['data']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    n = args.number
+
+    print(f"{'instruções':>11} {'URL (B)':>9} {'GET enc':>9} {'GET dec':>9} "
+          f"{'POST enc':>9} {'POST dec':>9}   (µs/chamada)")
+    for repeats in (0, 16, 128, 512):
+        data = dict(BOLETO, instrucoes=INSTRUCAO * repeats)
+        url = query_encode('banco_brasil', data)
+        body = _json_body('banco_brasil', data)
+
+        timings = [
+            timeit.timeit(lambda: query_encode('banco_brasil', data), number=n),
+            timeit.timeit(lambda: query_decode(url), number=n),
+            timeit.timeit(lambda: _json_body('banco_brasil', data), number=n),
+            timeit.timeit(lambda: body_decode(body), number=n),
+        ]
+        us = [t / n * 1e6 for t in timings]
+        print(f"{len(data['instrucoes']):>11} {len(url):>9} " + ' '.join(f"{v:>9.1f}" for v in us))
+
+
+if __name__ == '__main__':
+    main()
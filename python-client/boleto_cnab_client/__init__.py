@@ -22,13 +22,41 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2025 Maxwell da Silva Oliveira'
 
 from .client import BoletoClient
+from .async_client import AsyncBoletoClient
+from .async_gateway import AsyncGatewayClient
+from .balancer import LoadBalancer
+from .batch import BoletoBatch
+from .columnar import batch_from_frame, records_to_table
+from .cache import BaseCache, MemoryCache, DiskCache, HTTPCache
+from .gateway import (
+    CarneIn,
+    CarneOut,
+    Cobranca,
+    CobrancaIn,
+    CobrancaOut,
+    GatewayClient,
+    Pagador
+)
 from .exceptions import (
     BoletoAPIError,
     BoletoValidationError,
     BoletoConnectionError,
-    BoletoTimeoutError
+    BoletoTimeoutError,
+    BoletoCircuitOpenError
+)
+from .metrics import MetricsCollector, RequestEvent
+from .models import (
+    BoletoData,
+    BoletoFile,
+    BoletoResponse,
+    CompactBoletoData,
+    CompactBoletoResponse
 )
-from .models import BoletoData, BoletoResponse
+from .pdf import merge_pdfs
+from .resilience import CircuitBreaker, RetryBudget
+from .streaming import iter_json_array
+from .transport import HTTPXAdapter
+from .validation import ValidationReport, documento_valido, validate_batch
 from .types import (
     BoletoDataDict,
     BoletoResponseDict,
@@ -44,14 +72,55 @@ from .types import (
 __all__ = [
     # Cliente
     'BoletoClient',
+    'AsyncBoletoClient',
+    # Gateway de cobrança (FastAPI)
+    'GatewayClient',
+    'AsyncGatewayClient',
+    'Pagador',
+    'Cobranca',
+    'CobrancaIn',
+    'CobrancaOut',
+    'CarneIn',
+    'CarneOut',
+    # Cache
+    'BaseCache',
+    'MemoryCache',
+    'DiskCache',
+    'HTTPCache',
     # Exceções
     'BoletoAPIError',
     'BoletoValidationError',
     'BoletoConnectionError',
     'BoletoTimeoutError',
+    'BoletoCircuitOpenError',
+    # Retry adaptativo
+    'RetryBudget',
+    'CircuitBreaker',
+    # Balanceamento entre réplicas
+    'LoadBalancer',
+    # Transporte HTTP/2
+    'HTTPXAdapter',
     # Modelos (dataclass)
     'BoletoData',
     'BoletoResponse',
+    'BoletoFile',
+    # Modelos compactos (__slots__) e lote colunar
+    'CompactBoletoData',
+    'CompactBoletoResponse',
+    'BoletoBatch',
+    # Tabelas Arrow/pandas
+    'batch_from_frame',
+    'records_to_table',
+    # Utilitários
+    'merge_pdfs',
+    'iter_json_array',
+    # Instrumentação
+    'MetricsCollector',
+    'RequestEvent',
+    # Pré-validação local
+    'validate_batch',
+    'ValidationReport',
+    'documento_valido',
     # Tipos TypedDict
     'BoletoDataDict',
     'BoletoResponseDict',
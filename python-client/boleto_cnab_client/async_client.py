@@ -0,0 +1,430 @@
+"""
+Cliente assíncrono para a API Boleto CNAB (asyncio + httpx)
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Any, Optional, List
+from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependência opcional
+    httpx = None
+
+from .cache import HTTPCache, shared_http_cache
+from .client import _gzip_body, _json_body, _json_upload, _raise_for_status
+from .columnar import OFX_TYPES, RETORNO_TYPES, TableFormat, batch_from_frame, records_to_table
+from .exceptions import (
+    BoletoAPIError,
+    BoletoCircuitOpenError,
+    BoletoConnectionError,
+    BoletoTimeoutError
+)
+from .models import BoletoFile, BoletoResponse
+from .resilience import (
+    BACKOFF_MAX,
+    RETRY_STATUS,
+    CircuitBreaker,
+    RetryBudget,
+    backoff_delay,
+    retry_after_seconds
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBoletoClient:
+    """
+    Cliente assíncrono para a API Boleto CNAB.
+
+    Mesma superfície do :class:`BoletoClient`, com métodos ``async``. Todas as
+    chamadas compartilham um pool keep-alive (``httpx.AsyncClient``) e um
+    semáforo limita quantas requisições ficam em voo ao mesmo tempo.
+
+    Requer ``httpx``: ``pip install boleto-cnab-client[async]``.
+
+    Example:
+        >>> async with AsyncBoletoClient('http://localhost:9292') as client:
+        ...     results = await asyncio.gather(*[
+        ...         client.generate_boleto_with_data('sicoob', d) for d in dados
+        ...     ])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        retries: int = 3,
+        verify_ssl: bool = True,
+        max_connections: int = 100,
+        max_concurrency: Optional[int] = None,
+        backoff_factor: float = 1,
+        transport: Optional[Any] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        post_threshold: Optional[int] = 2048,
+        http_cache: Optional[HTTPCache] = shared_http_cache,
+        compress_threshold: Optional[int] = None
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncBoletoClient requer httpx. "
+                "Instale com: pip install boleto-cnab-client[async]"
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.verify_ssl = verify_ssl
+        self.backoff_factor = backoff_factor
+        self.max_concurrency = max_concurrency or max_connections
+        self.post_threshold = post_threshold
+        self.http_cache = http_cache
+        self.compress_threshold = compress_threshold
+        self.retry_budget = retry_budget or RetryBudget()
+        # Padrão: o disjuntor da URL no processo, o mesmo do BoletoClient
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.for_url(self.base_url)
+
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            verify=verify_ssl,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+        # Criado sob demanda: no Python < 3.10 o semáforo se prende ao loop
+        # corrente no momento da criação.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncBoletoClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões."""
+        await self.client.aclose()
+
+    def _gzip_request(self, method: str, url: str, kwargs: Dict[str, Any]):
+        # Monta o corpo (multipart incluído) uma vez e troca pelo gzip dele
+        request = self.client.build_request(method, url, **kwargs)
+        compressed = _gzip_body(request.read(), self.compress_threshold)
+        if compressed is None:
+            return url, kwargs
+        headers = {'Content-Type': request.headers['Content-Type'], 'Content-Encoding': 'gzip'}
+        return str(request.url), {'content': compressed, 'headers': headers}
+
+    def _should_retry(self, attempt: int, retry_after: Optional[float] = None) -> bool:
+        if attempt > self.retries:
+            return False
+        if retry_after is not None and retry_after > BACKOFF_MAX:
+            return False
+        return self.retry_budget.try_acquire()
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> 'httpx.Response':
+        url = urljoin(self.base_url, endpoint)
+        if kwargs.pop('compress', False) and self.compress_threshold is not None:
+            url, kwargs = self._gzip_request(method, url, kwargs)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            # Vaga do semáforo só durante a tentativa: o backoff (Retry-After até
+            # BACKOFF_MAX) é esperado fora dele, sem tirar a vez dos outros.
+            async with self._semaphore:
+                if not self.circuit_breaker.allow():
+                    raise BoletoCircuitOpenError(
+                        f"Circuito aberto para {self.base_url}; "
+                        f"nova tentativa em {self.circuit_breaker.retry_in():.0f}s"
+                    )
+                try:
+                    response = await self.client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    self.circuit_breaker.record_failure()
+                    if not self._should_retry(attempt):
+                        if isinstance(e, httpx.TimeoutException):
+                            raise BoletoTimeoutError(f"Timeout após {self.timeout}s") from e
+                        raise BoletoConnectionError(f"Erro de conexão: {str(e)}") from e
+                    delay = backoff_delay(attempt, self.backoff_factor)
+                except BaseException:
+                    # Erro local/cancelamento, sem resposta do servidor: só devolve a sondagem
+                    self.circuit_breaker.release_probe()
+                    raise
+                else:
+                    if response.status_code not in RETRY_STATUS:
+                        self.circuit_breaker.record_success()
+                        self.retry_budget.record_success()
+                        break
+
+                    self.circuit_breaker.record_failure()
+                    retry_after = retry_after_seconds(response.headers)
+                    if not self._should_retry(attempt, retry_after):
+                        if attempt == 1:
+                            break
+                        raise BoletoAPIError(
+                            "Servidor indisponível após múltiplas tentativas: "
+                            f"{method} {endpoint} -> {response.status_code}",
+                            status_code=500
+                        )
+
+                    delay = backoff_delay(attempt, self.backoff_factor)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    logger.debug(
+                        "Retry %d/%d de %s %s em %.1fs (status %d)",
+                        attempt, self.retries, method, endpoint, delay, response.status_code
+                    )
+                    await response.aclose()
+            await asyncio.sleep(delay)
+
+        _raise_for_status(response)
+        return response
+
+    # ==================== Consulta ====================
+
+    async def health_check(self) -> Dict[str, str]:
+        """Health check da API."""
+        return (await self._make_request('GET', '/api/health')).json()
+
+    async def info(self) -> Dict[str, Any]:
+        """Versão, bancos suportados e formatos."""
+        return await self._conditional_json('/api/info')
+
+    async def metadata(self) -> Dict[str, Any]:
+        """Metadados da API e gem brcobranca."""
+        return await self._conditional_json('/api/metadata')
+
+    async def bancos(self) -> List[Dict[str, Any]]:
+        """Lista 18 bancos com capacidades (boleto, CNAB, PIX, carteiras)."""
+        return await self._conditional_json('/api/bancos')
+
+    async def _conditional_json(self, endpoint: str) -> Any:
+        # Mesmo cache HTTP do BoletoClient (compartilhado no processo por padrão)
+        if self.http_cache is None:
+            return (await self._make_request('GET', endpoint)).json()
+
+        url = urljoin(self.base_url, endpoint)
+        body, headers = self.http_cache.lookup(url)
+        if body is not None:
+            return body
+        response = await self._make_request('GET', endpoint, headers=headers)
+        body = self.http_cache.update(url, response)
+        if body is None:
+            body = self.http_cache.update(url, await self._make_request('GET', endpoint))
+        return body
+
+    # ==================== Boleto ====================
+
+    async def _query(self, endpoint: str, bank: str, data: Dict[str, Any]) -> 'httpx.Response':
+        # Mesmo critério do BoletoClient: payload grande vai no corpo (POST)
+        encoded = json.dumps(data)
+        if self.post_threshold is not None and len(encoded) > self.post_threshold:
+            return await self._make_request(
+                'POST', endpoint,
+                content=_json_body(bank, data),
+                headers={'Content-Type': 'application/json'}
+            )
+        return await self._make_request('GET', endpoint, params={'bank': bank, 'data': encoded})
+
+    async def validate(self, bank: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida dados do boleto sem gerar PDF."""
+        response = await self._query('/api/boleto/validate', bank, data)
+        return response.json()
+
+    async def get_boleto_data(self, bank: str, data: Dict[str, Any]) -> BoletoResponse:
+        """Obtém dados calculados (nosso_numero, código barras, linha digitável)."""
+        response = await self._query('/api/boleto/data', bank, data)
+        return BoletoResponse(**response.json())
+
+    async def get_nosso_numero(self, bank: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Gera apenas nosso_numero, nosso_numero_formatado e nosso_numero_dv."""
+        response = await self._query('/api/boleto/nosso_numero', bank, data)
+        return response.json()
+
+    async def generate_boleto(
+        self,
+        bank: str,
+        data: Dict[str, Any],
+        file_type: str = 'pdf',
+        template: str = 'rghost'
+    ) -> bytes:
+        """Gera boleto como bytes (PDF/JPG/PNG/TIF)."""
+        response = await self._make_request(
+            'GET', '/api/boleto',
+            params={
+                'bank': bank, 'type': file_type,
+                'template': template,
+                'data': json.dumps(data)
+            }
+        )
+        return response.content
+
+    async def generate_boleto_with_data(
+        self,
+        bank: str,
+        data: Dict[str, Any],
+        file_type: str = 'pdf',
+        template: str = 'rghost'
+    ) -> Dict[str, Any]:
+        """Gera boleto + dados em 1 chamada (include_data=true)."""
+        response = await self._make_request(
+            'GET', '/api/boleto',
+            params={
+                'bank': bank, 'type': file_type,
+                'template': template,
+                'include_data': 'true',
+                'data': json.dumps(data)
+            }
+        )
+        return response.json()
+
+    async def generate_boleto_file(
+        self,
+        bank: str,
+        data: Dict[str, Any],
+        file_type: str = 'pdf',
+        template: str = 'rghost'
+    ) -> BoletoFile:
+        """
+        Gera boleto em bytes crus + metadados dos headers (include_data=headers).
+
+        Dados principais de ``generate_boleto_with_data``, sem base64: o arquivo
+        vem no corpo e os dados em ``X-Nosso-Numero*``, ``X-Codigo-Barras``,
+        ``X-Linha-Digitavel`` e nos campos escalares de ``BoletoFile.data``.
+
+        Example:
+            >>> boleto = await client.generate_boleto_file('sicoob', dados)
+            >>> open('boleto.pdf', 'wb').write(boleto.content)
+            >>> boleto.linha_digitavel, boleto.data['valor']
+        """
+        response = await self._make_request(
+            'GET', '/api/boleto',
+            params={
+                'bank': bank, 'type': file_type,
+                'template': template,
+                'include_data': 'headers',
+                'data': json.dumps(data)
+            }
+        )
+        return BoletoFile.from_response(response.content, response.headers)
+
+    async def generate_multiple_boletos(
+        self,
+        boletos: List[Dict[str, Any]],
+        file_type: str = 'pdf',
+        template: str = 'rghost'
+    ) -> bytes:
+        """Gera múltiplos boletos como bytes."""
+        return await self._multi_request(boletos, file_type, template, include_data=False)
+
+    async def generate_multiple_boletos_with_data(
+        self,
+        boletos: List[Dict[str, Any]],
+        file_type: str = 'pdf',
+        template: str = 'rghost'
+    ) -> Dict[str, Any]:
+        """Gera múltiplos boletos + dados em 1 chamada."""
+        return await self._multi_request(boletos, file_type, template, include_data=True)
+
+    async def generate_multiple_boletos_from_frame(
+        self,
+        frame: Any,
+        bank: Optional[str] = None,
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        include_data: bool = False
+    ) -> Any:
+        """Gera múltiplos boletos a partir de um ``pandas.DataFrame``/``pyarrow.Table``."""
+        return await self._multi_request(batch_from_frame(frame, bank), file_type, template, include_data)
+
+    # ==================== Remessa / Retorno ====================
+
+    async def generate_remessa(
+        self,
+        bank: str,
+        cnab_type: str,
+        data: Dict[str, Any],
+        pix: bool = False
+    ) -> bytes:
+        """Gera arquivo de remessa CNAB."""
+        response = await self._make_request(
+            'POST', '/api/remessa',
+            params={'bank': bank, 'type': cnab_type, 'pix': str(pix).lower()},
+            files={'data': _json_upload('remessa.json', data)},
+            compress=True
+        )
+        return response.content
+
+    async def process_retorno(
+        self,
+        bank: str,
+        cnab_type: str,
+        file_path: str,
+        as_table: TableFormat = False
+    ) -> Any:
+        """Processa arquivo de retorno CNAB (``as_table`` como no cliente síncrono)."""
+        content = await _read_file(file_path)
+        response = await self._make_request(
+            'POST', '/api/retorno',
+            params={'bank': bank, 'type': cnab_type},
+            files={'data': (os.path.basename(file_path), content)},
+            compress=True
+        )
+        pagamentos = response.json()
+        if as_table:
+            return records_to_table(pagamentos, RETORNO_TYPES, as_table)
+        return pagamentos
+
+    # ==================== OFX ====================
+
+    async def parse_ofx(
+        self,
+        file_path: str,
+        somente_creditos: bool = False,
+        as_table: TableFormat = False
+    ) -> Any:
+        """Parseia arquivo OFX (extrato bancário); ``as_table`` como no cliente síncrono."""
+        content = await _read_file(file_path)
+        response = await self._make_request(
+            'POST', '/api/ofx/parse',
+            files={'file': (os.path.basename(file_path), content)},
+            data={'somente_creditos': str(somente_creditos).lower()}
+        )
+        extrato = response.json()
+        if as_table:
+            transacoes = extrato.pop('transacoes', [])
+            return records_to_table(transacoes, OFX_TYPES, as_table, metadata=extrato)
+        return extrato
+
+    # ==================== Internos ====================
+
+    async def _multi_request(self, boletos, file_type, template, include_data):
+        params = {'template': template}
+        if include_data:
+            params['include_data'] = 'true'
+        response = await self._make_request(
+            'POST', '/api/boleto/multi',
+            params=params,
+            data={'type': file_type},
+            files={'data': _json_upload('boletos.json', boletos)},
+            compress=True
+        )
+        return response.json() if include_data else response.content
+
+    def __repr__(self) -> str:
+        return f"<AsyncBoletoClient(base_url='{self.base_url}')>"
+
+
+async def _read_file(file_path: str) -> bytes:
+    # Leitura em thread para não bloquear o event loop com arquivos grandes
+    loop = asyncio.get_running_loop()
+    with open(file_path, 'rb') as f:
+        return await loop.run_in_executor(None, f.read)
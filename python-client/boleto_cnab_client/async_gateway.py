@@ -0,0 +1,189 @@
+"""
+Cliente assíncrono do gateway de cobrança (asyncio + httpx).
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependência opcional
+    httpx = None
+
+from .exceptions import BoletoAPIError, BoletoConnectionError, BoletoTimeoutError
+from .gateway import (
+    IDEMPOTENT_METHODS,
+    CarneIn,
+    CarneOut,
+    CobrancaIn,
+    CobrancaOut,
+    _cobranca_path,
+    _json_or_none,
+    _raise_for_gateway_status,
+    _to_dict
+)
+from .resilience import BACKOFF_MAX, RETRY_STATUS, backoff_delay, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGatewayClient:
+    """
+    Cliente assíncrono do gateway de cobrança.
+
+    Mesma superfície do :class:`~boleto_cnab_client.gateway.GatewayClient`,
+    com métodos ``async`` sobre um ``httpx.AsyncClient`` (pool de
+    ``max_connections``). Nos helpers em lote, um semáforo limita as
+    requisições em voo a ``max_in_flight``.
+
+    Requer ``httpx``: ``pip install boleto-cnab-client[async]``.
+
+    Example:
+        >>> async with AsyncGatewayClient('http://gateway:8000') as gateway:
+        ...     resultados = await gateway.consultar_many(ids, 'imob_123', 'sicoob')
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30,
+        retries: int = 3,
+        max_connections: int = 20,
+        backoff_factor: float = 0.5,
+        headers: Optional[Mapping[str, str]] = None,
+        max_in_flight: Optional[int] = None,
+        verify_ssl: bool = True,
+        transport: Optional[Any] = None
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncGatewayClient requer httpx. "
+                "Instale com: pip install boleto-cnab-client[async]"
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_in_flight = max_in_flight or max_connections
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            verify=verify_ssl,
+            headers=dict(headers or {}),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> 'AsyncGatewayClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                # Conexão que nem abriu é segura de repetir para qualquer método
+                retryable = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if retryable and attempt <= self.retries:
+                    await asyncio.sleep(backoff_delay(attempt, self.backoff_factor))
+                    continue
+                if isinstance(e, httpx.TimeoutException):
+                    raise BoletoTimeoutError(f"Timeout após {self.timeout}s") from e
+                raise BoletoConnectionError(f"Erro de conexão: {str(e)}") from e
+
+            if idempotent and response.status_code in RETRY_STATUS and attempt <= self.retries:
+                wait_for = retry_after_seconds(response.headers)
+                if wait_for is None or wait_for <= BACKOFF_MAX:
+                    delay = backoff_delay(attempt, self.backoff_factor)
+                    if wait_for is not None:
+                        delay = max(delay, wait_for)
+                    logger.debug("Retry %d/%d de %s %s em %.1fs (status %d)",
+                                 attempt, self.retries, method, path, delay, response.status_code)
+                    await asyncio.sleep(delay)
+                    continue
+
+            body = _json_or_none(response)
+            _raise_for_gateway_status(response.status_code, body, response.text)
+            return body
+
+    # ==================== Operações ====================
+
+    async def health(self) -> Dict[str, str]:
+        """``GET /health`` do gateway."""
+        return await self._request('GET', '/health')
+
+    async def registrar(self, cobranca: Union[CobrancaIn, Mapping[str, Any]]) -> CobrancaOut:
+        """Registra uma cobrança (``POST /cobranca``)."""
+        return CobrancaOut.from_dict(await self._request('POST', '/cobranca', json=_to_dict(cobranca)))
+
+    async def consultar(self, cobranca_id: str, tenant_id: str, provider: str) -> CobrancaOut:
+        """Consulta o status de uma cobrança (``GET /cobranca/{id}``)."""
+        return CobrancaOut.from_dict(await self._request(
+            'GET', _cobranca_path(cobranca_id), params={'tenant_id': tenant_id, 'provider': provider}
+        ))
+
+    async def baixar(self, cobranca_id: str, tenant_id: str, provider: str) -> CobrancaOut:
+        """Baixa/cancela uma cobrança (``DELETE /cobranca/{id}``)."""
+        return CobrancaOut.from_dict(await self._request(
+            'DELETE', _cobranca_path(cobranca_id), params={'tenant_id': tenant_id, 'provider': provider}
+        ))
+
+    async def gerar_carne(self, carne: Union[CarneIn, Mapping[str, Any]]) -> CarneOut:
+        """Registra as parcelas e monta o carnê 3-vias (``POST /carne``)."""
+        return CarneOut.from_dict(await self._request('POST', '/carne', json=_to_dict(carne)))
+
+    # ==================== Em lote ====================
+
+    async def registrar_many(
+        self,
+        cobrancas: Iterable[Union[CobrancaIn, Mapping[str, Any]]],
+        max_in_flight: Optional[int] = None
+    ) -> List[Union[CobrancaOut, BoletoAPIError]]:
+        """Registra várias cobranças; resultado/exceção por item, na ordem recebida."""
+        return await self._map(self.registrar, list(cobrancas), max_in_flight)
+
+    async def consultar_many(
+        self,
+        cobranca_ids: Iterable[str],
+        tenant_id: str,
+        provider: str,
+        max_in_flight: Optional[int] = None
+    ) -> List[Union[CobrancaOut, BoletoAPIError]]:
+        """Consulta várias cobranças do mesmo tenant/provider; ver ``registrar_many``."""
+        return await self._map(
+            lambda cobranca_id: self.consultar(cobranca_id, tenant_id, provider),
+            list(cobranca_ids), max_in_flight
+        )
+
+    async def _map(self, fn, items, max_in_flight):
+        max_in_flight = max_in_flight or self.max_in_flight
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight deve ser >= 1")
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def call(item):
+            async with semaphore:
+                try:
+                    return await fn(item)
+                except BoletoAPIError as e:
+                    return e
+
+        return list(await asyncio.gather(*(call(item) for item in items)))
+
+    def __repr__(self) -> str:
+        return f"<AsyncGatewayClient(base_url='{self.base_url}')>"
@@ -0,0 +1,181 @@
+"""
+Balanceamento no cliente entre réplicas do engine Boleto CNAB.
+
+O ``BoletoClient`` aceita uma lista de URLs; a cada requisição o
+:class:`LoadBalancer` escolhe a réplica com menos requisições em voo
+(``least_outstanding``) ou com a melhor latência EWMA ponderada pela fila
+(``ewma``). Réplicas com taxa de erro alta ou ``/api/health`` falhando saem
+da rotação por um tempo (só voltam a ser usadas se não houver outra);
+réplicas com o disjuntor aberto são puladas. Em falha, o retry vai para outra
+réplica.
+
+Exemplo:
+    >>> client = BoletoClient(
+    ...     ['http://engine-1:9292', 'http://engine-2:9292'],
+    ...     balancer='ewma', health_check_interval=10,
+    ... )
+    >>> client.balancer.stats()
+"""
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .resilience import OPEN, CircuitBreaker
+
+STRATEGIES = ('least_outstanding', 'ewma')
+
+
+class Endpoint:
+    """
+    Uma réplica do engine e suas estatísticas de seleção.
+
+    Attributes:
+        url: URL base da réplica (sem ``/`` final)
+        breaker: Disjuntor desta réplica
+        outstanding: Requisições em voo
+        ewma: Latência média móvel exponencial, em segundos (None sem amostras)
+        error_rate: Taxa de erro móvel exponencial (0 a 1)
+    """
+
+    def __init__(self, url: str, breaker: CircuitBreaker):
+        self.url = url.rstrip('/')
+        self.breaker = breaker
+        self.outstanding = 0
+        self.ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.ejected_until = 0.0
+
+    def ejected(self, now: float) -> bool:
+        return now < self.ejected_until
+
+    def __repr__(self) -> str:
+        return f"<Endpoint({self.url!r}, outstanding={self.outstanding}, ewma={self.ewma})>"
+
+
+class LoadBalancer:
+    """
+    Seleção de réplica por requisição, com ejeção de réplicas doentes.
+
+    Args:
+        urls: URLs base das réplicas
+        strategy: ``'least_outstanding'`` ou ``'ewma'``
+        decay: Peso da amostra nova na EWMA de latência e de erros
+        max_error_rate: Taxa de erro que tira a réplica da rotação
+        min_samples: Amostras mínimas antes de ejetar por taxa de erro
+        eject_time: Segundos fora da rotação após ejeção
+        breaker_factory: Cria o disjuntor de cada réplica a partir da URL
+            (padrão: ``CircuitBreaker.for_url``, compartilhado no processo)
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        strategy: str = 'least_outstanding',
+        decay: float = 0.3,
+        max_error_rate: float = 0.5,
+        min_samples: int = 5,
+        eject_time: float = 30.0,
+        breaker_factory: Optional[Callable[[str], CircuitBreaker]] = None
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy deve ser um de {STRATEGIES}, recebido {strategy!r}")
+        breaker_factory = breaker_factory or CircuitBreaker.for_url
+        self.endpoints: List[Endpoint] = [Endpoint(url, breaker_factory(url)) for url in urls]
+        if not self.endpoints:
+            raise ValueError("Informe ao menos uma URL")
+        self.strategy = strategy
+        self.decay = decay
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.eject_time = eject_time
+        self._tiebreak = itertools.count()
+        self._lock = threading.Lock()
+
+    def _score(self, endpoint: Endpoint) -> float:
+        if self.strategy == 'ewma':
+            # Réplica sem amostras é tentada primeiro; fila pesa na latência esperada
+            return (endpoint.ewma or 0.0) * (endpoint.outstanding + 1)
+        return endpoint.outstanding
+
+    def acquire(self, exclude: Iterable[Endpoint] = ()) -> Optional[Endpoint]:
+        """
+        Escolhe uma réplica e a marca como em uso.
+
+        Réplicas ejetadas ou em ``exclude`` só são usadas se nenhuma outra
+        estiver disponível.
+
+        Returns:
+            None se todas estão com o disjuntor aberto
+        """
+        excluded = set(map(id, exclude))
+        now = time.monotonic()
+        with self._lock:
+            tick = next(self._tiebreak)
+            size = len(self.endpoints)
+            candidates = [e for e in self.endpoints if e.breaker.state != OPEN]
+            # Rodízio como desempate: sem carga, as réplicas se alternam
+            candidates.sort(key=lambda e: (
+                e.ejected(now),
+                id(e) in excluded,
+                self._score(e),
+                (self.endpoints.index(e) - tick) % size,
+            ))
+            for endpoint in candidates:
+                if endpoint.breaker.allow():
+                    endpoint.outstanding += 1
+                    return endpoint
+        return None
+
+    def release(self, endpoint: Endpoint, latency: Optional[float], ok: bool) -> None:
+        """
+        Devolve a réplica com o resultado da chamada.
+
+        Args:
+            latency: Segundos até a resposta (None se não houve resposta)
+            ok: False para erro de conexão/timeout ou status transitório
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            endpoint.samples += 1
+            if latency is not None:
+                endpoint.ewma = latency if endpoint.ewma is None else (
+                    self.decay * latency + (1 - self.decay) * endpoint.ewma
+                )
+            endpoint.error_rate = self.decay * (0.0 if ok else 1.0) + (1 - self.decay) * endpoint.error_rate
+            if endpoint.samples >= self.min_samples and endpoint.error_rate > self.max_error_rate:
+                self._eject(endpoint)
+
+    def _eject(self, endpoint: Endpoint) -> None:
+        endpoint.ejected_until = time.monotonic() + self.eject_time
+        # Volta à rotação sem carregar o histórico ruim
+        endpoint.error_rate = 0.0
+        endpoint.samples = 0
+
+    def mark_health(self, endpoint: Endpoint, healthy: bool) -> None:
+        """Resultado de um ``/api/health``: ejeta ou devolve a réplica à rotação."""
+        with self._lock:
+            if healthy:
+                endpoint.ejected_until = 0.0
+            else:
+                self._eject(endpoint)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Estado de cada réplica, para monitoramento."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'url': e.url,
+                    'outstanding': e.outstanding,
+                    'ewma': e.ewma,
+                    'error_rate': e.error_rate,
+                    'ejected': e.ejected(now),
+                    'breaker': e.breaker.state,
+                }
+                for e in self.endpoints
+            ]
+
+    def __repr__(self) -> str:
+        return f"<LoadBalancer(strategy={self.strategy!r}, endpoints={len(self.endpoints)})>"
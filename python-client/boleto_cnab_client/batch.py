@@ -0,0 +1,204 @@
+"""
+Lote colunar de boletos (struct-of-arrays) para o cliente Boleto CNAB.
+
+Em vez de 100 mil objetos com ~30 atributos cada, o ``BoletoBatch`` guarda uma
+lista por campo e colunas numéricas em ``array('d')``. A serialização para o
+``/api/boleto/multi`` é feita direto das colunas, sem criar dicts por linha.
+
+Exemplo:
+    >>> batch = BoletoBatch(bank='sicoob')
+    >>> for linha in ler_csv():
+    ...     batch.append(linha)
+    >>> pdf = client.generate_multiple_boletos(batch)
+"""
+import json
+import math
+from array import array
+from dataclasses import fields
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from .models import BoletoData
+
+# Campos numéricos guardados em array('d'); ausência vira NaN
+NUMERIC_FIELDS = ('valor',)
+
+
+def _encode_value(value: Any) -> str:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return float.__repr__(value)
+    return json.dumps(value, separators=(',', ':'))
+
+
+class BoletoBatch:
+    """
+    Lote de boletos em colunas.
+
+    Args:
+        rows: Linhas iniciais (dicts no formato ``BoletoDataDict``)
+        bank: Banco incluído em todas as linhas ao serializar para o ``/multi``
+            (o endpoint exige ``bank`` por boleto); uma coluna ``bank``
+            explícita tem precedência
+    """
+
+    def __init__(self, rows: Optional[Iterable[Mapping[str, Any]]] = None, bank: Optional[str] = None):
+        self.bank = bank
+        self._size = 0
+        self._columns: Dict[str, Union[List[Any], 'array[float]']] = {}
+        for f in fields(BoletoData):
+            self._add_column(f.name)
+        if rows is not None:
+            self.extend(rows)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any], bank: Optional[str] = None) -> 'BoletoBatch':
+        """
+        Lote a partir de colunas prontas (``{campo: sequência}``), sem passar por linhas.
+
+        Colunas numéricas (``valor``) podem vir como ``array('d')`` (usado
+        sem cópia) ou qualquer sequência de números/None; as demais, como
+        sequências com None para ausente. Usado pelos adaptadores de
+        DataFrame/Arrow (:mod:`boleto_cnab_client.columnar`).
+        """
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Colunas com tamanhos diferentes: {sorted(sizes)}")
+        batch = cls(bank=bank)
+        batch._size = sizes.pop() if sizes else 0
+        for name in list(batch._columns):
+            if name not in columns:
+                batch._add_column(name)
+        for name, values in columns.items():
+            if name in NUMERIC_FIELDS:
+                if not isinstance(values, array) or values.typecode != 'd':
+                    values = array('d', (math.nan if v is None else float(v) for v in values))
+                batch._columns[name] = values
+            else:
+                batch._columns[name] = values if isinstance(values, list) else list(values)
+        return batch
+
+    def _add_column(self, name: str) -> None:
+        if name in NUMERIC_FIELDS:
+            self._columns[name] = array('d', [math.nan]) * self._size
+        else:
+            self._columns[name] = [None] * self._size
+
+    @property
+    def columns(self) -> List[str]:
+        """Nomes das colunas, na ordem de serialização."""
+        return list(self._columns)
+
+    def column(self, name: str) -> Union[List[Any], 'array[float]']:
+        """Coluna crua (lista ou ``array('d')``); não copie se só for ler."""
+        return self._columns[name]
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        """Adiciona uma linha; campos novos viram colunas (preenchidas com None)."""
+        for name in row:
+            if name not in self._columns:
+                self._add_column(name)
+        for name, column in self._columns.items():
+            value = row.get(name)
+            if isinstance(column, array):
+                column.append(math.nan if value is None else float(value))
+            else:
+                column.append(value)
+        self._size += 1
+
+    def extend(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Linha ``i`` como dict, ou um novo lote para fatias."""
+        if isinstance(index, slice):
+            sliced = BoletoBatch(bank=self.bank)
+            sliced._columns = {name: column[index] for name, column in self._columns.items()}
+            sliced._size = len(range(*index.indices(self._size)))
+            return sliced
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('índice fora do lote')
+        return self._row(index)
+
+    def take(self, indices: Iterable[int]) -> 'BoletoBatch':
+        """Novo lote só com as linhas ``indices``, copiando coluna a coluna."""
+        indices = list(indices)
+        taken = BoletoBatch(bank=self.bank)
+        taken._columns = {
+            name: (array('d', (column[i] for i in indices)) if isinstance(column, array)
+                   else [column[i] for i in indices])
+            for name, column in self._columns.items()
+        }
+        taken._size = len(indices)
+        return taken
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        row = {}
+        if self.bank is not None:
+            row['bank'] = self.bank
+        for name, column in self._columns.items():
+            value = column[index]
+            if value is None or (isinstance(column, array) and math.isnan(value)):
+                continue
+            row[name] = value
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Itera as linhas como dicts (sem None), materializando uma por vez."""
+        for index in range(self._size):
+            yield self._row(index)
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Serializa o lote como array JSON, em pedaços (uma linha por pedaço).
+
+        Trabalha direto sobre as colunas: cada linha vira texto sem passar por
+        um dict intermediário. Valores None/NaN são omitidos, como no
+        ``to_dict`` dos modelos.
+        """
+        columns = list(self._columns.items())
+        prefixes = {name: encode_basestring_ascii(name) + ':' for name, _ in columns}
+        numeric = {name for name, column in columns if isinstance(column, array)}
+        bank_prefix = '"bank":' + encode_basestring_ascii(self.bank) if self.bank is not None else None
+        # Coluna bank tem precedência, mas só onde preenchida (como em ``_row``)
+        bank_column = self._columns.get('bank')
+        isnan = math.isnan
+
+        yield '['
+        for index in range(self._size):
+            if bank_prefix and (bank_column is None or bank_column[index] is None):
+                parts = [bank_prefix]
+            else:
+                parts = []
+            for name, column in columns:
+                value = column[index]
+                if value is None:
+                    continue
+                if name in numeric:
+                    if isnan(value):
+                        continue
+                    parts.append(prefixes[name] + float.__repr__(value))
+                else:
+                    parts.append(prefixes[name] + _encode_value(value))
+            yield ('{' if index == 0 else ',{') + ','.join(parts) + '}'
+        yield ']'
+
+    def to_json_bytes(self) -> bytes:
+        """Array JSON do lote (ASCII), pronto para o upload do ``/multi``."""
+        return ''.join(self.iter_json()).encode('ascii')
+
+    def __repr__(self) -> str:
+        return f"<BoletoBatch(size={self._size}, bank={self.bank!r})>"
@@ -0,0 +1,293 @@
+"""
+Cache de resultados determinísticos para o cliente Boleto CNAB.
+
+Os endpoints ``/api/boleto/data``, ``/api/boleto/nosso_numero`` e
+``/api/boleto/validate`` dependem apenas de ``(bank, data)``; com um cache
+configurado no ``BoletoClient``, consultas repetidas não vão à rede.
+
+Exemplo:
+    >>> from boleto_cnab_client import BoletoClient, MemoryCache
+    >>> client = BoletoClient('http://localhost:9292',
+    ...                       cache=MemoryCache(maxsize=10_000, ttl=3600))
+    >>> client.get_boleto_data('sicoob', dados)  # rede
+    >>> client.get_boleto_data('sicoob', dados)  # cache
+    >>> client.cache.stats()
+    {'hits': 1, 'misses': 1, 'size': 1}
+"""
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def cache_key(endpoint: str, bank: str, data: Any) -> str:
+    """Hash canônico (sha256) de endpoint + banco + JSON com chaves ordenadas."""
+    canonical = json.dumps(
+        [endpoint, bank, data],
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class BaseCache:
+    """
+    Interface dos backends de cache.
+
+    Subclasses implementam ``_get``/``_set``/``clear``/``__len__``; os
+    contadores de hit/miss ficam aqui.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retorna o valor em cache ou None (miss ou expirado)."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Armazena um valor (JSON-serializável)."""
+        self._set(key, value)
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de hit/miss e número de entradas."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def _get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    Cache LRU em memória com TTL, seguro para uso entre threads.
+
+    Args:
+        maxsize: Número máximo de entradas (as menos usadas saem primeiro)
+        ttl: Validade de cada entrada em segundos (None = sem expiração)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600):
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache(BaseCache):
+    """
+    Cache em disco (um arquivo JSON por chave), compartilhável entre processos.
+
+    Args:
+        directory: Diretório das entradas (criado se não existir)
+        ttl: Validade de cada entrada em segundos (None = sem expiração)
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = 86400):
+        super().__init__()
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _get(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        expires = entry.get('expires')
+        if expires is not None and expires <= time.time():
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+            return None
+        return entry.get('value')
+
+    def _set(self, key: str, value: Any) -> None:
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        # Escrita atômica: outro processo nunca lê um arquivo pela metade
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'expires': expires, 'value': value}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.unlink(os.path.join(self.directory, name))
+
+    def __len__(self) -> int:
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.json'))
+
+
+def _max_age(cache_control: str) -> Optional[float]:
+    """``max-age`` do header Cache-Control; None se a resposta não pode ser guardada."""
+    max_age = 0.0
+    for directive in cache_control.lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'no-store':
+            return None
+        if name == 'no-cache':
+            max_age = 0.0
+            break
+        if name == 'max-age':
+            try:
+                max_age = max(0.0, float(value.strip('"')))
+            except ValueError:
+                pass
+    return max_age
+
+
+class HTTPCache:
+    """
+    Cache HTTP condicional (ETag + Cache-Control) para ``info``, ``bancos`` e ``metadata``.
+
+    Dentro do ``max-age`` informado pelo engine a cópia é servida sem ir à
+    rede; depois disso a consulta revalida com ``If-None-Match`` e um ``304``
+    renova a cópia sem baixar o corpo de novo. Por padrão todos os clientes
+    do processo usam a mesma instância (``shared_http_cache``), então jobs
+    curtos só pagam a descoberta de capacidades uma vez.
+
+    Example:
+        >>> client.info(); client.info()
+        >>> client.http_cache.stats()
+        {'hits': 1, 'revalidated': 0, 'misses': 1, 'size': 1}
+    """
+
+    def __init__(self) -> None:
+        # url -> (etag, expira_em, corpo)
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def lookup(self, url: str) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Cópia ainda fresca, ou None e os headers da revalidação.
+
+        Returns:
+            ``(corpo, {})`` dentro do max-age; ``(None, {'If-None-Match': etag})``
+            se há cópia vencida com ETag; ``(None, {})`` sem cópia
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None, {}
+            etag, expires, body = entry
+            if time.monotonic() < expires:
+                self.hits += 1
+                return copy.deepcopy(body), {}
+        return None, {'If-None-Match': etag} if etag else {}
+
+    def update(self, url: str, response: Any) -> Optional[Any]:
+        """
+        Registra a resposta (``requests``/``httpx``) e devolve o corpo JSON.
+
+        Returns:
+            None se o engine respondeu ``304`` e a cópia já não existe
+            (ex.: ``clear()`` concorrente) — refaça a consulta sem ``If-None-Match``
+        """
+        max_age = _max_age(response.headers.get('Cache-Control', ''))
+        with self._lock:
+            if response.status_code == 304:
+                entry = self._entries.get(url)
+                if entry is None:
+                    return None
+                self.revalidated += 1
+                etag, _, body = entry
+                if max_age is not None:
+                    self._entries[url] = (etag, time.monotonic() + max_age, body)
+                return copy.deepcopy(body)
+
+        body = response.json()
+        etag = response.headers.get('ETag')
+        with self._lock:
+            self.misses += 1
+            if max_age is None or (not etag and not max_age):
+                self._entries.pop(url, None)
+            else:
+                self._entries[url] = (etag, time.monotonic() + max_age, copy.deepcopy(body))
+        return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Servidas do cache, revalidadas com 304, baixadas e número de entradas."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'size': len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Instância padrão, compartilhada por todos os clientes do processo
+shared_http_cache = HTTPCache()
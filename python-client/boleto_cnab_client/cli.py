@@ -0,0 +1,437 @@
+"""
+Linha de comando ``boleto-cnab``: geração em massa de boletos a partir de CSV/JSONL.
+
+Lê a entrada em streaming (CSV com cabeçalho ou JSONL), mapeia as colunas
+para ``BoletoDataDict``, gera os boletos com paralelismo limitado e grava os
+arquivos num diretório ou num ZIP escrito incrementalmente. Cada linha
+concluída (ou com falha) vai para um checkpoint JSONL; com ``--resume`` uma
+execução interrompida continua de onde parou e repete só as falhas e o que
+ficou em voo.
+
+Exemplo:
+    $ boleto-cnab boletos.csv --bank sicoob --out pdfs/ --workers 16
+    $ boleto-cnab boletos.jsonl --zip boletos.zip --resume
+    $ boleto-cnab clientes.csv --map cpf=sacado_documento --map nome=sacado \\
+    ...     --bank itau --name '{nosso_numero}' --out pdfs/
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import signal
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, TextIO, Tuple
+
+from .client import BoletoClient, _bounded_map
+
+DEFAULT_URL = 'http://localhost:9292'
+FORMATS = ('csv', 'jsonl')
+
+# Campos numéricos de BoletoDataDict (o CSV traz tudo como texto)
+FLOAT_FIELDS = ('valor',)
+
+_UNSAFE_NAME = re.compile(r'[^\w.-]+')
+
+
+# =============================================================================
+# Entrada
+# =============================================================================
+
+def detect_format(path: str) -> str:
+    """``csv`` ou ``jsonl`` pela extensão do arquivo."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if ext in ('.csv', '.txt'):
+        return 'csv'
+    raise ValueError(f"Formato de {path!r} não reconhecido; use --format csv|jsonl")
+
+
+def read_rows(stream: TextIO, fmt: str, delimiter: Optional[str] = None) -> Iterator[Any]:
+    """
+    Linhas da entrada, uma por vez, sem carregar o arquivo.
+
+    JSONL: linhas em branco são ignoradas; uma linha com JSON inválido vira
+    a exceção correspondente (a falha é só daquela linha). CSV: o
+    delimitador é detectado no cabeçalho (``,``, ``;``, tab ou ``|``) se não
+    for informado.
+    """
+    if fmt == 'jsonl':
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"JSON inválido: {e}")
+        return
+
+    header = stream.readline()
+    if delimiter is None:
+        delimiter = max(',;\t|', key=header.count)
+    fields = next(csv.reader([header], delimiter=delimiter), [])
+    yield from csv.DictReader(stream, fieldnames=fields, delimiter=delimiter)
+
+
+def count_rows(path: str, fmt: str) -> int:
+    """Total aproximado de linhas (para o progresso); CSV desconta o cabeçalho."""
+    total = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                total += 1
+    return max(total - 1, 0) if fmt == 'csv' else total
+
+
+def parse_valor(value: Any) -> float:
+    """Valor monetário em número: aceita ``150.00``, ``150,00`` e ``1.234,56``."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace('R$', '').replace(' ', '')
+    if ',' in text:
+        text = text.replace('.', '').replace(',', '.')
+    return float(text)
+
+
+def map_row(
+    row: Mapping[str, Any],
+    mapping: Optional[Mapping[str, str]] = None,
+    default_bank: Optional[str] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Converte uma linha da entrada em ``(bank, BoletoDataDict)``.
+
+    Aceita a linha plana (colunas = campos, com coluna ``bank`` opcional) ou,
+    em JSONL, ``{"bank": ..., "data": {...}}``. ``mapping`` renomeia colunas
+    (``{'cpf': 'sacado_documento'}``); células vazias são descartadas.
+
+    Raises:
+        ValueError: Linha sem banco ou com valor inválido
+    """
+    if not isinstance(row, Mapping):
+        raise ValueError(f"Linha deve ser um objeto, recebido {type(row).__name__}")
+    if isinstance(row.get('data'), Mapping):
+        data = dict(row['data'])
+        data.setdefault('bank', row.get('bank'))
+    else:
+        data = dict(row)
+
+    for source, target in (mapping or {}).items():
+        if source in data:
+            data[target] = data.pop(source)
+
+    data = {
+        k: v.strip() if isinstance(v, str) else v
+        for k, v in data.items()
+        if k is not None and v is not None and v != ''
+    }
+    bank = data.pop('bank', None) or default_bank
+    if not bank:
+        raise ValueError("Linha sem banco: informe --bank ou uma coluna 'bank'")
+
+    for field in FLOAT_FIELDS:
+        if field in data:
+            try:
+                data[field] = parse_valor(data[field])
+            except ValueError:
+                raise ValueError(f"{field} inválido: {data[field]!r}") from None
+    return bank, data
+
+
+# =============================================================================
+# Saída e checkpoint
+# =============================================================================
+
+class DirectoryWriter:
+    """Um arquivo por boleto; cada um é gravado por inteiro ou não aparece."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def has(self, name: str) -> bool:
+        return os.path.exists(os.path.join(self.directory, name))
+
+    def write(self, name: str, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, os.path.join(self.directory, name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self) -> None:
+        pass
+
+
+class ZipWriter:
+    """
+    ZIP escrito incrementalmente, um boleto por vez (só ele fica em memória).
+
+    Sem recompressão: PDFs já vêm comprimidos e o deflate custaria CPU no
+    laço principal. O índice do ZIP só é gravado no ``close()`` — interrupções
+    por Ctrl-C/SIGTERM fecham o arquivo; um ``kill -9`` deixa o ZIP ilegível
+    (para isso, prefira ``--out``).
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        mode = 'a' if resume and os.path.exists(path) else 'w'
+        try:
+            self._zip = zipfile.ZipFile(path, mode, compression=zipfile.ZIP_STORED)
+        except zipfile.BadZipFile:
+            raise ValueError(
+                f"{path} está incompleto (interrupção abrupta) e não pode ser retomado; "
+                "remova-o junto com o checkpoint ou gere num diretório com --out"
+            ) from None
+        self._names = set(self._zip.namelist())
+        self._resumed = set(self._names)
+
+    def has(self, name: str) -> bool:
+        return name in self._names
+
+    def write(self, name: str, content: bytes) -> None:
+        # ZIP não sobrescreve: entrada da execução anterior que o checkpoint
+        # não chegou a registrar (interrupção entre os dois) fica como está
+        if name in self._resumed:
+            self._resumed.discard(name)
+            return
+        if name in self._names:
+            raise ValueError(f"{name} já está no ZIP")
+        self._zip.writestr(name, content)
+        self._names.add(name)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class Checkpoint:
+    """
+    Registro JSONL das linhas processadas: ``{"row", "file"}`` ou ``{"row", "error"}``.
+
+    Na retomada, só linhas com ``file`` cujo arquivo existe na saída contam
+    como feitas; falhas são tentadas de novo.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.done: Dict[int, str] = {}
+        if resume and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # última linha cortada pela interrupção
+                    if entry.get('file'):
+                        self.done[entry['row']] = entry['file']
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def record(self, row: int, file: Optional[str] = None, error: Optional[str] = None) -> None:
+        entry: Dict[str, Any] = {'row': row}
+        if file is not None:
+            entry['file'] = file
+        if error is not None:
+            entry['error'] = error
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Progress:
+    """Linha de progresso em stderr, atualizada no máximo a cada ``interval`` segundos."""
+
+    def __init__(self, total: Optional[int], stream: TextIO = sys.stderr,
+                 enabled: bool = True, interval: float = 0.5):
+        self.total = total
+        self.stream = stream
+        self.enabled = enabled
+        self.interval = interval
+        self.start = time.monotonic()
+        self._last = 0.0
+        self._shown: Optional[Tuple[int, int, int]] = None
+        self.ok = self.failed = self.skipped = 0
+
+    def update(self, force: bool = False) -> None:
+        now = time.monotonic()
+        counts = (self.ok, self.failed, self.skipped)
+        if not self.enabled or counts == self._shown or (not force and now - self._last < self.interval):
+            return
+        self._last, self._shown = now, counts
+        processed = self.ok + self.failed + self.skipped
+        rate = (self.ok + self.failed) / max(now - self.start, 1e-9)
+        line = f"{processed}" + (f"/{self.total}" if self.total else '')
+        line += f"  gerados={self.ok} falhas={self.failed} pulados={self.skipped}  {rate:.1f}/s"
+        if self.total and rate:
+            line += f"  faltam ~{max(self.total - processed, 0) / rate:.0f}s"
+        end = '\r' if self.stream.isatty() else '\n'
+        self.stream.write(line.ljust(78) + end)
+        self.stream.flush()
+
+    def finish(self) -> None:
+        self.update(force=True)
+        if self.enabled and self.stream.isatty():
+            self.stream.write('\n')
+
+
+# =============================================================================
+# Execução
+# =============================================================================
+
+def output_name(template: str, row: int, bank: str, data: Mapping[str, Any], file_type: str) -> str:
+    """Nome do arquivo a partir de ``--name`` (``{row}``, ``{bank}`` e campos do boleto)."""
+    fields = dict(data, row=row, bank=bank)
+    try:
+        name = template.format_map(fields)
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(f"--name {template!r}: campo ausente ou inválido ({e})") from None
+    return f"{_UNSAFE_NAME.sub('_', name).strip('._') or row}.{file_type}"
+
+
+def _raise_interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='boleto-cnab',
+        description='Gera boletos em massa a partir de CSV ou JSONL.'
+    )
+    parser.add_argument('input', help="Arquivo CSV/JSONL ('-' para stdin)")
+    parser.add_argument('--format', choices=FORMATS, help='Formato da entrada (padrão: pela extensão)')
+    parser.add_argument('--delimiter', help='Delimitador do CSV (padrão: detectado no cabeçalho)')
+    parser.add_argument('--url', default=os.environ.get('BOLETO_API_URL', DEFAULT_URL),
+                        help=f'URL do engine (padrão: $BOLETO_API_URL ou {DEFAULT_URL})')
+    parser.add_argument('--bank', help="Banco das linhas sem coluna 'bank'")
+    parser.add_argument('--map', action='append', default=[], metavar='COLUNA=CAMPO',
+                        help='Renomeia uma coluna da entrada para um campo do boleto (repetível)')
+    parser.add_argument('--type', default='pdf', choices=('pdf', 'jpg', 'png', 'tif'), dest='file_type')
+    parser.add_argument('--template', default='rghost', choices=('rghost', 'prawn'))
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('--out', metavar='DIR', help='Diretório de saída (um arquivo por boleto)')
+    output.add_argument('--zip', metavar='ARQUIVO', help='ZIP de saída, escrito em streaming')
+    parser.add_argument('--name', default='{row:06d}',
+                        help="Nome de cada arquivo: {row}, {bank} e campos do boleto (padrão: '{row:06d}')")
+    parser.add_argument('--workers', type=int, default=8, help='Boletos gerados em paralelo (padrão: 8)')
+    parser.add_argument('--checkpoint', help='Arquivo de checkpoint (padrão: ao lado da saída)')
+    parser.add_argument('--resume', action='store_true', help='Continua a partir do checkpoint')
+    parser.add_argument('--timeout', type=int, default=30)
+    parser.add_argument('--retries', type=int, default=3)
+    parser.add_argument('--quiet', action='store_true', help='Sem linha de progresso')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Ponto de entrada do ``boleto-cnab``.
+
+    Returns:
+        0 se todas as linhas foram geradas, 1 se houve falhas, 130 se interrompido
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers deve ser >= 1')
+    try:
+        mapping = dict(item.split('=', 1) for item in args.map)
+    except ValueError:
+        parser.error('--map espera COLUNA=CAMPO')
+
+    from_stdin = args.input == '-'
+    try:
+        fmt = args.format or ('jsonl' if from_stdin else detect_format(args.input))
+    except ValueError as e:
+        parser.error(str(e))
+    checkpoint_path = args.checkpoint or (
+        os.path.join(args.out, '.boleto-cnab-checkpoint.jsonl') if args.out
+        else f'{args.zip}.checkpoint.jsonl'
+    )
+
+    try:
+        writer = DirectoryWriter(args.out) if args.out else ZipWriter(args.zip, resume=args.resume)
+    except ValueError as e:
+        print(f"boleto-cnab: {e}", file=sys.stderr)
+        return 2
+    checkpoint = Checkpoint(checkpoint_path, resume=args.resume)
+    progress = Progress(
+        None if from_stdin else count_rows(args.input, fmt),
+        enabled=not args.quiet
+    )
+    client = BoletoClient(args.url, timeout=args.timeout, retries=args.retries, pool_maxsize=args.workers)
+    # Linha dona de cada nome de saída: duas linhas com o mesmo --name não se sobrescrevem
+    owners = {name: row for row, name in checkpoint.done.items()}
+
+    def pending_rows(rows: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        for row_number, row in enumerate(rows, start=1):
+            name = checkpoint.done.get(row_number)
+            if name is not None and writer.has(name):
+                progress.skipped += 1
+                progress.update()
+                continue
+            yield row_number, row
+
+    def generate(item: Tuple[int, Any]) -> Tuple[str, bytes]:
+        row_number, row = item
+        if isinstance(row, Exception):
+            raise row
+        bank, data = map_row(row, mapping, args.bank)
+        name = output_name(args.name, row_number, bank, data, args.file_type)
+        return name, client.generate_boleto(bank, data, args.file_type, args.template)
+
+    try:
+        previous_handler = signal.signal(signal.SIGTERM, _raise_interrupt)
+    except ValueError:  # pragma: no cover - fora da thread principal
+        previous_handler = None
+
+    source = sys.stdin if from_stdin else open(args.input, 'r', encoding='utf-8-sig', newline='')
+    interrupted = False
+    try:
+        rows = read_rows(source, fmt, args.delimiter)
+        for (row_number, _), result in _bounded_map(generate, pending_rows(rows), args.workers):
+            if isinstance(result, Exception):
+                checkpoint.record(row_number, error=f"{type(result).__name__}: {result}")
+                progress.failed += 1
+            elif owners.setdefault(result[0], row_number) != row_number:
+                checkpoint.record(
+                    row_number,
+                    error=f"nome {result[0]!r} já usado pela linha {owners[result[0]]}; "
+                          "ajuste --name (ex.: inclua {row})"
+                )
+                progress.failed += 1
+            else:
+                name, content = result
+                writer.write(name, content)
+                checkpoint.record(row_number, file=name)
+                progress.ok += 1
+            progress.update()
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        progress.finish()
+        writer.close()
+        checkpoint.close()
+        client.close()
+        if not from_stdin:
+            source.close()
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    if interrupted:
+        print(f"boleto-cnab: interrompido; retome com --resume (checkpoint: {checkpoint_path})", file=sys.stderr)
+        return 130
+    if progress.failed:
+        print(f"boleto-cnab: {progress.failed} linha(s) com falha; detalhes em {checkpoint_path}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
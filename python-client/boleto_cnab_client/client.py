@@ -2,27 +2,114 @@
 Cliente principal para a API Boleto CNAB v1.4.1
 """
 import base64
+import copy
+import gzip
 import json
 import logging
-import tempfile
 import os
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Any, Optional, List, Iterable, Iterator, Mapping, Sequence, Tuple, Union
+from urllib.parse import parse_qs, urljoin
 
 import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from requests.adapters import BaseAdapter
 
+from .balancer import Endpoint, LoadBalancer
+from .batch import BoletoBatch
+from .cache import BaseCache, HTTPCache, cache_key, shared_http_cache
+from .coalescing import COALESCE_ENDPOINTS, SingleFlight, request_key
+from .columnar import OFX_TYPES, RETORNO_TYPES, TableFormat, batch_from_frame, records_to_table
 from .exceptions import (
     BoletoAPIError,
     BoletoValidationError,
+    BoletoCircuitOpenError,
     BoletoConnectionError,
     BoletoTimeoutError
 )
-from .models import BoletoData, BoletoResponse
+from .metrics import Observer, RequestEvent
+from .models import BoletoData, BoletoFile, BoletoResponse
+from .pdf import merge_pdfs
+from .resilience import (
+    BACKOFF_MAX,
+    RETRY_STATUS,
+    CircuitBreaker,
+    RetryBudget,
+    backoff_delay,
+    retry_after_seconds
+)
+from .streaming import iter_json_array
+from .transport import make_adapter
 
 logger = logging.getLogger(__name__)
 
+# Destino de escrita: caminho no disco ou stream binário aberto
+Destination = Union[str, 'os.PathLike[str]', BinaryIO]
+
+# Item de validate_many/data_many: (bank, data), {'bank', 'data'} ou só data
+BatchItem = Union[Tuple[str, Dict[str, Any]], Dict[str, Any]]
+
+# Nível do gzip em uploads: 6 fica perto do máximo em texto CNAB/JSON com
+# uma fração da CPU do 9
+GZIP_LEVEL = 6
+
+
+def _raise_for_status(response: Any) -> None:
+    """
+    Converte respostas 4xx/5xx nas exceções do cliente.
+
+    Aceita qualquer objeto com ``status_code``, ``json()`` e ``text``
+    (``requests.Response`` ou ``httpx.Response``).
+    """
+    if response.status_code < 400:
+        return
+
+    try:
+        error_data = response.json()
+        error_msg = error_data.get('error', response.text)
+    except Exception:
+        error_msg = response.text
+
+    if response.status_code == 400:
+        raise BoletoValidationError(error_msg, response.status_code)
+    raise BoletoAPIError(error_msg, response.status_code)
+
+
+def _bounded_map(fn: Callable[[Any], Any], items: Iterable[Any], workers: int) -> Iterator[Tuple[Any, Any]]:
+    """
+    ``(item, resultado_ou_exceção)`` fora de ordem, com no máximo ``workers`` em voo.
+
+    Consome ``items`` sob demanda num pool de threads; exceções de ``fn`` viram
+    o resultado do item em vez de interromper o laço. Base de
+    ``BoletoClient.iter_generate`` e do ``boleto-cnab``.
+    """
+    source = iter(items)
+
+    def call(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: Dict[Any, Any] = {}
+    try:
+        for item in islice(source, workers):
+            pending[executor.submit(call, item)] = item
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(source, 1):
+                    pending[executor.submit(call, next_item)] = next_item
+                yield item, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
 
 class BoletoClient:
     """
@@ -34,61 +121,278 @@ class BoletoClient:
         >>> print(result['nosso_numero_formatado'])
         >>> with open('boleto.pdf', 'wb') as f:
         ...     f.write(base64.b64decode(result['content_base64']))
+
+    Com várias réplicas do engine, passe a lista de URLs: cada requisição vai
+    para a réplica escolhida por ``balancer`` e falhas são repetidas em outra.
+
+        >>> client = BoletoClient(['http://engine-1:9292', 'http://engine-2:9292'])
+
+    Com ``transport='http2'`` as requisições simultâneas são multiplexadas em
+    poucas conexões HTTP/2 (extra ``http2``).
+
+    Com ``compress_threshold`` (ex. ``16 * 1024``), uploads do ``/multi``,
+    remessa e retorno a partir desse tamanho vão com ``Content-Encoding: gzip``.
     """
 
     def __init__(
         self,
-        base_url: str,
+        base_url: Union[str, Sequence[str]],
         timeout: int = 30,
         retries: int = 3,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        pool_maxsize: int = 10,
+        cache: Optional[BaseCache] = None,
+        multi_chunk_size: Optional[int] = None,
+        stream_chunk_size: int = 64 * 1024,
+        observers: Optional[Iterable[Observer]] = None,
+        backoff_factor: float = 1,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        balancer: Union[str, LoadBalancer] = 'least_outstanding',
+        health_check_interval: Optional[float] = None,
+        coalesce: bool = True,
+        coalesce_uploads: bool = False,
+        post_threshold: Optional[int] = 2048,
+        batch_chunk_size: int = 500,
+        http_cache: Optional[HTTPCache] = shared_http_cache,
+        transport: Union[str, BaseAdapter] = 'requests',
+        compress_threshold: Optional[int] = None
     ):
-        self.base_url = base_url.rstrip('/')
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if circuit_breaker is not None and len(urls) > 1:
+            raise ValueError(
+                "circuit_breaker vale para uma URL; com várias réplicas use "
+                "LoadBalancer(urls, breaker_factory=...)"
+            )
+        self.base_url = urls[0].rstrip('/') if urls else ''
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.retries = retries
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        # info/bancos/metadata: cópia servida dentro do max-age e revalidada
+        # com If-None-Match depois (None desliga)
+        self.http_cache = http_cache
+        self.multi_chunk_size = multi_chunk_size
+        self.stream_chunk_size = stream_chunk_size
+        # Acima deste tamanho (JSON de ``data``), validate/data/nosso_numero
+        # vão como POST com corpo JSON em vez de ``?data=`` na URL
+        self.post_threshold = post_threshold
+        # Itens por requisição em validate_many/data_many (engine aceita até 1000)
+        self.batch_chunk_size = batch_chunk_size
+        # Uploads (/multi, remessa, retorno) a partir deste tamanho vão com
+        # Content-Encoding: gzip; None desliga (engine sem GzipRequest não descomprime)
+        self.compress_threshold = compress_threshold
+        self.observers: List[Observer] = list(observers or [])
+        self.backoff_factor = backoff_factor
+        # Retries ficam a cargo de _make_request (orçamento + Retry-After);
+        # o disjuntor padrão é CircuitBreaker.for_url de cada réplica, o mesmo
+        # para todos os clientes da URL no processo.
+        self.retry_budget = retry_budget or RetryBudget()
+        # Chamadas idênticas simultâneas compartilham uma ida à rede: leituras
+        # de COALESCE_ENDPOINTS; com coalesce_uploads, também /multi e remessa
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        self.coalesce_uploads = coalesce_uploads
+        if isinstance(balancer, LoadBalancer):
+            self.balancer = balancer
+        else:
+            self.balancer = LoadBalancer(
+                urls, strategy=balancer,
+                breaker_factory=(lambda url: circuit_breaker) if circuit_breaker else None
+            )
 
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "OPTIONS"],
-            backoff_factor=1
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # 'requests' (urllib3, HTTP/1.1) ou 'http2' (httpx, multiplexado)
+        self.transport = make_adapter(transport, pool_maxsize)
+        self.session.mount("http://", self.transport)
+        self.session.mount("https://", self.transport)
+
+        self._closed = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        if health_check_interval:
+            self._health_thread = threading.Thread(
+                target=self._health_loop, args=(health_check_interval,),
+                name='boleto-health-check', daemon=True
+            )
+            self._health_thread.start()
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Disjuntor da primeira réplica (a única, com uma URL)."""
+        return self.balancer.endpoints[0].breaker
+
+    def close(self) -> None:
+        """Para o health check periódico e fecha o pool de conexões."""
+        self._closed.set()
+        if self._health_thread is not None:
+            self._health_thread.join()
+        self.session.close()
+
+    def __enter__(self) -> 'BoletoClient':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Consulta ``/api/health`` de cada réplica e atualiza a rotação.
+
+        Réplicas que falham saem da rotação; as que respondem voltam.
+
+        Returns:
+            ``{url: saudável}``
+        """
+        result = {}
+        for endpoint in self.balancer.endpoints:
+            try:
+                response = self.session.get(
+                    urljoin(endpoint.url, '/api/health'),
+                    timeout=min(self.timeout, 5), verify=self.verify_ssl
+                )
+                healthy = response.status_code == 200
+            except requests.RequestException:
+                healthy = False
+            self.balancer.mark_health(endpoint, healthy)
+            result[endpoint.url] = healthy
+        return result
+
+    def _health_loop(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            try:
+                self.check_health()
+            except Exception:
+                logger.exception("Falha no health check das réplicas")
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Registra um observador chamado ao fim de cada requisição.
+
+        O observador recebe um :class:`~boleto_cnab_client.metrics.RequestEvent`
+        (endpoint, banco, status, tentativas, bytes, TTFB e latência total).
+        Exceções levantadas pelo observador são registradas no log e ignoradas.
+
+        Example:
+            >>> metrics = MetricsCollector()
+            >>> client.add_observer(metrics)
+        """
+        self.observers.append(observer)
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        if self.single_flight is not None and (
+            self.coalesce_uploads or endpoint.partition('?')[0] in COALESCE_ENDPOINTS
+        ):
+            key = request_key(method, urljoin(self.base_url, endpoint), kwargs)
+            if key is not None:
+                return self.single_flight.do(key, lambda: self._send(method, endpoint, **kwargs))
+        return self._send(method, endpoint, **kwargs)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         url = urljoin(self.base_url, endpoint)
-        kwargs.setdefault('timeout', self.timeout)
-        kwargs.setdefault('verify', self.verify_ssl)
+        timeout = kwargs.pop('timeout', self.timeout)
+        verify = kwargs.pop('verify', self.verify_ssl)
+        stream = kwargs.pop('stream', False)
+        compress = kwargs.pop('compress', False)
+        # Banco informado pelo chamador quando não está na query (corpo JSON, lote, /multi)
+        bank = kwargs.pop('bank', None)
 
+        start = time.perf_counter()
+        response = None
+        attempt = 0
+        tried: List[Endpoint] = []
         try:
-            response = self.session.request(method, url, **kwargs)
-
-            if response.status_code >= 400:
+            # Preparado uma vez: o corpo (multipart incluído) é reenviado igual nos retries
+            prepared = self.session.prepare_request(requests.Request(method, url, **kwargs))
+            if compress:
+                compressed = _gzip_body(prepared.body, self.compress_threshold)
+                if compressed is not None:
+                    prepared.body = compressed
+                    prepared.headers['Content-Encoding'] = 'gzip'
+                    prepared.headers['Content-Length'] = str(len(compressed))
+            while True:
+                attempt += 1
+                replica = self.balancer.acquire(exclude=tried)
+                if replica is None:
+                    raise BoletoCircuitOpenError(
+                        f"Circuito aberto para {self.base_url}; "
+                        f"nova tentativa em {self.circuit_breaker.retry_in():.0f}s"
+                        if len(self.balancer.endpoints) == 1 else
+                        "Circuito aberto em todas as réplicas: "
+                        + ", ".join(e.url for e in self.balancer.endpoints)
+                    )
+                tried.append(replica)
+                request = prepared.copy()
+                request.url = urljoin(replica.url, prepared.path_url)
+                settings = self.session.merge_environment_settings(request.url, {}, stream, verify, None)
+                sent_at = time.perf_counter()
                 try:
-                    error_data = response.json()
-                    error_msg = error_data.get('error', response.text)
-                except Exception:
-                    error_msg = response.text
-
-                if response.status_code == 400:
-                    raise BoletoValidationError(error_msg, response.status_code)
-                else:
-                    raise BoletoAPIError(error_msg, response.status_code)
-
-            return response
-
-        except requests.exceptions.RetryError as e:
-            raise BoletoAPIError(
-                f"Servidor indisponível após múltiplas tentativas: {str(e)}",
-                status_code=500
-            ) from e
-        except requests.Timeout as e:
-            raise BoletoTimeoutError(f"Timeout após {self.timeout}s") from e
-        except requests.ConnectionError as e:
-            raise BoletoConnectionError(f"Erro de conexão: {str(e)}") from e
+                    response = self.session.send(request, timeout=timeout, **settings)
+                except (requests.Timeout, requests.ConnectionError) as e:
+                    replica.breaker.record_failure()
+                    self.balancer.release(replica, None, ok=False)
+                    if self._should_retry(attempt):
+                        self._sleep_before_retry(attempt, method, endpoint, None, repr(e))
+                        continue
+                    if isinstance(e, requests.Timeout):
+                        raise BoletoTimeoutError(f"Timeout após {timeout}s") from e
+                    raise BoletoConnectionError(f"Erro de conexão: {str(e)}") from e
+                except BaseException:
+                    # Erro local, sem resposta do servidor: só devolve a sondagem
+                    replica.breaker.release_probe()
+                    self.balancer.release(replica, None, ok=True)
+                    raise
+
+                latency = time.perf_counter() - sent_at
+                if response.status_code not in RETRY_STATUS:
+                    replica.breaker.record_success()
+                    self.balancer.release(replica, latency, ok=True)
+                    self.retry_budget.record_success()
+                    break
+
+                replica.breaker.record_failure()
+                self.balancer.release(replica, latency, ok=False)
+                wait_for = retry_after_seconds(response.headers)
+                if self._should_retry(attempt, wait_for):
+                    response.close()
+                    self._sleep_before_retry(attempt, method, endpoint, wait_for, response.status_code)
+                    response = None
+                    continue
+                if attempt > 1:
+                    raise BoletoAPIError(
+                        "Servidor indisponível após múltiplas tentativas: "
+                        f"{method} {endpoint} -> {response.status_code}",
+                        status_code=500
+                    )
+                break
+
+            _raise_for_status(response)
+        except Exception as e:
+            if self.observers:
+                self._notify(method, endpoint, kwargs, bank, stream, response, start, attempt, e)
+            raise
+
+        if self.observers:
+            self._notify(method, endpoint, kwargs, bank, stream, response, start, attempt, None)
+        return response
+
+    def _should_retry(self, attempt: int, retry_after: Optional[float] = None) -> bool:
+        if attempt > self.retries:
+            return False
+        if retry_after is not None and retry_after > BACKOFF_MAX:
+            return False
+        return self.retry_budget.try_acquire()
+
+    def _sleep_before_retry(self, attempt: int, method: str, endpoint: str,
+                            retry_after: Optional[float], reason: Any) -> None:
+        delay = backoff_delay(attempt, self.backoff_factor)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        logger.debug(
+            "Retry %d/%d de %s %s em %.1fs (%s)",
+            attempt, self.retries, method, endpoint, delay, reason
+        )
+        if delay:
+            time.sleep(delay)
 
     # ==================== Consulta ====================
 
@@ -98,39 +402,76 @@ class BoletoClient:
 
     def info(self) -> Dict[str, Any]:
         """Versão, bancos suportados e formatos."""
-        return self._make_request('GET', '/api/info').json()
+        return self._conditional_json('/api/info')
 
     def metadata(self) -> Dict[str, Any]:
         """Metadados da API e gem brcobranca."""
-        return self._make_request('GET', '/api/metadata').json()
+        return self._conditional_json('/api/metadata')
 
     def bancos(self) -> List[Dict[str, Any]]:
         """Lista 18 bancos com capacidades (boleto, CNAB, PIX, carteiras)."""
-        return self._make_request('GET', '/api/bancos').json()
+        return self._conditional_json('/api/bancos')
 
     # ==================== Boleto ====================
 
     def validate(self, bank: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Valida dados do boleto sem gerar PDF."""
-        return self._make_request(
-            'GET', '/api/boleto/validate',
-            params={'bank': bank, 'data': json.dumps(data)}
-        ).json()
+        return self._cached_json('/api/boleto/validate', bank, data)
 
     def get_boleto_data(self, bank: str, data: Dict[str, Any]) -> BoletoResponse:
         """Obtém dados calculados (nosso_numero, código barras, linha digitável)."""
-        response = self._make_request(
-            'GET', '/api/boleto/data',
-            params={'bank': bank, 'data': json.dumps(data)}
-        )
-        return BoletoResponse(**response.json())
+        return BoletoResponse(**self._cached_json('/api/boleto/data', bank, data))
 
     def get_nosso_numero(self, bank: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Gera apenas nosso_numero, nosso_numero_formatado e nosso_numero_dv."""
-        return self._make_request(
-            'GET', '/api/boleto/nosso_numero',
-            params={'bank': bank, 'data': json.dumps(data)}
-        ).json()
+        return self._cached_json('/api/boleto/nosso_numero', bank, data)
+
+    def validate_many(
+        self,
+        items: Iterable[BatchItem],
+        bank: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Valida muitos boletos com poucas requisições (``/api/boleto/batch/validate``).
+
+        Args:
+            items: Pares ``(bank, data)`` ou dicts ``{'bank': ..., 'data': ...}``;
+                com ``bank`` informado, podem ser só os dicts de dados
+            bank: Banco comum a todos os itens
+            chunk_size: Itens por requisição (padrão ``batch_chunk_size``)
+            max_workers: Lotes enviados em paralelo (padrão ``pool_maxsize``)
+
+        Returns:
+            Um resultado por item, na ordem recebida: ``{'index', 'valid', ...}``
+            com ``errors``/``error`` quando inválido. ``index`` começa em 1.
+
+        Example:
+            >>> results = client.validate_many(boletos, bank='sicoob')
+            >>> ruins = [r for r in results if not r['valid']]
+        """
+        return self._batch_request('validate', items, bank, chunk_size, max_workers)
+
+    def data_many(
+        self,
+        items: Iterable[BatchItem],
+        bank: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Dados calculados de muitos boletos (``/api/boleto/batch/data``); ver ``validate_many``."""
+        return self._batch_request('data', items, bank, chunk_size, max_workers)
+
+    def nosso_numero_many(
+        self,
+        items: Iterable[BatchItem],
+        bank: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """nosso_numero de muitos boletos (``/api/boleto/batch/nosso_numero``); ver ``validate_many``."""
+        return self._batch_request('nosso_numero', items, bank, chunk_size, max_workers)
 
     def generate_boleto(
         self,
@@ -179,27 +520,150 @@ class BoletoClient:
         )
         return response.json()
 
-    def generate_multiple_boletos(
+    def generate_boleto_file(
         self,
-        boletos: List[Dict[str, Any]],
+        bank: str,
+        data: Dict[str, Any],
         file_type: str = 'pdf',
         template: str = 'rghost'
+    ) -> BoletoFile:
+        """
+        Gera boleto em bytes crus + metadados dos headers (include_data=headers).
+
+        Dados principais de ``generate_boleto_with_data``, sem base64: o arquivo
+        vem no corpo e os dados em ``X-Nosso-Numero*``, ``X-Codigo-Barras``,
+        ``X-Linha-Digitavel`` e nos campos escalares de ``BoletoFile.data``.
+
+        Example:
+            >>> boleto = client.generate_boleto_file('sicoob', dados)
+            >>> open('boleto.pdf', 'wb').write(boleto.content)
+            >>> boleto.linha_digitavel, boleto.data['valor']
+        """
+        response = self._make_request(
+            'GET', '/api/boleto',
+            params={
+                'bank': bank, 'type': file_type,
+                'template': template,
+                'include_data': 'headers',
+                'data': json.dumps(data)
+            }
+        )
+        return BoletoFile.from_response(response.content, response.headers)
+
+    def generate_multiple_boletos(
+        self,
+        boletos: Union[List[Dict[str, Any]], BoletoBatch],
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> bytes:
-        """Gera múltiplos boletos como bytes."""
-        return self._multi_request(boletos, file_type, template, include_data=False)
+        """
+        Gera múltiplos boletos como bytes.
+
+        Com ``chunk_size`` (ou ``multi_chunk_size`` do cliente), listas maiores
+        são divididas em lotes enviados em paralelo (até ``max_workers``,
+        padrão ``pool_maxsize``) e os PDFs são unidos localmente na ordem da
+        entrada. Requer ``pypdf`` (``pip install boleto-cnab-client[pdf]``).
+        """
+        return self._multi_request(
+            boletos, file_type, template, include_data=False,
+            chunk_size=chunk_size, max_workers=max_workers
+        )
 
     def generate_multiple_boletos_with_data(
         self,
-        boletos: List[Dict[str, Any]],
+        boletos: Union[List[Dict[str, Any]], BoletoBatch],
         file_type: str = 'pdf',
-        template: str = 'rghost'
+        template: str = 'rghost',
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Gera múltiplos boletos + dados em 1 chamada.
 
         Retorna dict com total, boletos (array de metadados), content_base64.
+        Aceita ``chunk_size``/``max_workers`` como ``generate_multiple_boletos``;
+        os metadados dos lotes são concatenados na ordem da entrada.
         """
-        return self._multi_request(boletos, file_type, template, include_data=True)
+        return self._multi_request(
+            boletos, file_type, template, include_data=True,
+            chunk_size=chunk_size, max_workers=max_workers
+        )
+
+    def generate_multiple_boletos_from_frame(
+        self,
+        frame: Any,
+        bank: Optional[str] = None,
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        include_data: bool = False,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Union[bytes, Dict[str, Any]]:
+        """
+        Gera múltiplos boletos a partir de um ``pandas.DataFrame`` ou ``pyarrow.Table``.
+
+        As colunas são lidas direto para um ``BoletoBatch`` e o JSON do
+        ``/multi`` é montado a partir delas, sem um dict por linha (ver
+        :func:`~boleto_cnab_client.columnar.batch_from_frame`).
+
+        Args:
+            frame: Uma linha por boleto, colunas = campos de ``BoletoDataDict``
+            bank: Banco de todas as linhas (ou uma coluna ``bank``)
+            include_data: Se True, retorna o dict de ``generate_multiple_boletos_with_data``
+
+        Example:
+            >>> df = pd.read_parquet('cobrancas.parquet')
+            >>> pdf = client.generate_multiple_boletos_from_frame(df, bank='sicoob')
+        """
+        return self._multi_request(
+            batch_from_frame(frame, bank), file_type, template, include_data,
+            chunk_size=chunk_size, max_workers=max_workers
+        )
+
+    def iter_generate(
+        self,
+        bank: str,
+        payloads: Iterable[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        include_data: bool = True
+    ) -> Iterator[Tuple[int, Union[Dict[str, Any], bytes, Exception]]]:
+        """
+        Gera boletos em lote com concorrência limitada, em streaming.
+
+        Consome ``payloads`` sob demanda (pode ser um gerador) e mantém no
+        máximo ``max_in_flight`` requisições em andamento num pool de threads
+        (padrão: ``pool_maxsize`` da sessão). Cada item é entregue assim que
+        termina, fora de ordem, como ``(indice, resultado_ou_excecao)`` — a
+        memória fica proporcional a ``max_in_flight``, não ao tamanho da
+        entrada. Erros de um boleto não interrompem o lote.
+
+        Args:
+            bank: Código do banco
+            payloads: Iterável de dados de boleto
+            max_in_flight: Requisições simultâneas (padrão: ``pool_maxsize``)
+            include_data: Se True usa ``generate_boleto_with_data`` (dict);
+                senão ``generate_boleto`` (bytes)
+
+        Example:
+            >>> for i, result in client.iter_generate('sicoob', ler_csv()):
+            ...     if isinstance(result, Exception):
+            ...         falhas.append(i)
+        """
+        max_in_flight = max_in_flight or self.pool_maxsize
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight deve ser >= 1")
+
+        generate = self.generate_boleto_with_data if include_data else self.generate_boleto
+
+        def call(item):
+            return generate(bank, item[1], file_type, template)
+
+        for (index, _), result in _bounded_map(call, enumerate(payloads), max_in_flight):
+            yield index, result
 
     # ==================== Remessa / Retorno ====================
 
@@ -222,53 +686,91 @@ class BoletoClient:
         Returns:
             Bytes do arquivo CNAB
         """
-        f = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        json.dump(data, f)
-        f.close()
-
-        try:
-            with open(f.name, 'rb') as fp:
-                response = self._make_request(
-                    'POST',
-                    f'/api/remessa?bank={bank}&type={cnab_type}&pix={str(pix).lower()}',
-                    files={'data': fp}
-                )
-            return response.content
-        finally:
-            os.unlink(f.name)
+        response = self._make_request(
+            'POST',
+            f'/api/remessa?bank={bank}&type={cnab_type}&pix={str(pix).lower()}',
+            files={'data': _json_upload('remessa.json', data)},
+            compress=True
+        )
+        return response.content
 
     def process_retorno(
         self,
         bank: str,
         cnab_type: str,
-        file_path: str
-    ) -> List[Dict[str, Any]]:
+        file_path: str,
+        as_table: TableFormat = False
+    ) -> Any:
         """
         Processa arquivo de retorno CNAB.
 
+        Args:
+            as_table: ``True``/``'arrow'``/``'pandas'`` para receber uma tabela
+                tipada (valores em reais, datas como data) em vez da lista;
+                requer o extra ``arrow`` ou ``pandas``
+
         Returns:
-            Lista de pagamentos parseados
+            Lista de pagamentos parseados (ou ``pyarrow.Table``/``pandas.DataFrame``)
         """
         with open(file_path, 'rb') as f:
             response = self._make_request(
                 'POST',
                 f'/api/retorno?bank={bank}&type={cnab_type}',
-                files={'data': f}
+                files={'data': f},
+                compress=True
             )
-        return response.json()
+        pagamentos = response.json()
+        if as_table:
+            return records_to_table(pagamentos, RETORNO_TYPES, as_table)
+        return pagamentos
+
+    def iter_retorno(
+        self,
+        bank: str,
+        cnab_type: str,
+        file_path: str,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Processa arquivo de retorno CNAB entregando um pagamento por vez.
+
+        O JSON da resposta é decodificado incrementalmente conforme chega, então
+        a conciliação começa antes do fim do download e a memória não cresce
+        com o número de linhas de detalhe.
+
+        Example:
+            >>> for pagamento in client.iter_retorno('sicoob', 'cnab240', 'ret.txt'):
+            ...     conciliar(pagamento)
+        """
+        with open(file_path, 'rb') as f:
+            response = self._make_request(
+                'POST',
+                f'/api/retorno?bank={bank}&type={cnab_type}',
+                files={'data': f},
+                stream=True,
+                compress=True
+            )
+        yield from self._iter_json_items(response, chunk_size)
 
     # ==================== OFX ====================
 
     def parse_ofx(
         self,
         file_path: str,
-        somente_creditos: bool = False
-    ) -> Dict[str, Any]:
+        somente_creditos: bool = False,
+        as_table: TableFormat = False
+    ) -> Any:
         """
         Parseia arquivo OFX (extrato bancário).
 
+        Args:
+            as_table: ``True``/``'arrow'``/``'pandas'`` para receber as
+                transações numa tabela tipada; banco, conta, período, saldo e
+                resumo vão nos metadados do schema Arrow (JSON) ou em
+                ``DataFrame.attrs``
+
         Returns:
-            Dict com banco, conta, transacoes, resumo
+            Dict com banco, conta, transacoes, resumo (ou a tabela de transações)
         """
         with open(file_path, 'rb') as f:
             response = self._make_request(
@@ -276,27 +778,396 @@ class BoletoClient:
                 files={'file': f},
                 data={'somente_creditos': str(somente_creditos).lower()}
             )
-        return response.json()
+        extrato = response.json()
+        if as_table:
+            transacoes = extrato.pop('transacoes', [])
+            return records_to_table(transacoes, OFX_TYPES, as_table, metadata=extrato)
+        return extrato
+
+    def iter_ofx_transacoes(
+        self,
+        file_path: str,
+        somente_creditos: bool = False,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parseia arquivo OFX entregando uma transação por vez.
+
+        Itera o array ``transacoes`` da resposta de forma incremental; os
+        demais campos (banco, conta, resumo) são ignorados — use ``parse_ofx``
+        se precisar deles.
+        """
+        with open(file_path, 'rb') as f:
+            response = self._make_request(
+                'POST', '/api/ofx/parse',
+                files={'file': f},
+                data={'somente_creditos': str(somente_creditos).lower()},
+                stream=True
+            )
+        yield from self._iter_json_items(response, chunk_size, key='transacoes')
+
+    # ==================== Saída em Arquivo (streaming) ====================
+
+    def generate_boleto_to_file(
+        self,
+        bank: str,
+        data: Dict[str, Any],
+        dest: Destination,
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Gera boleto gravando direto em ``dest`` (caminho ou stream binário).
+
+        A resposta é lida em blocos de ``chunk_size`` (padrão:
+        ``stream_chunk_size`` do cliente), sem bufferizar o arquivo inteiro.
+
+        Returns:
+            Número de bytes gravados
+        """
+        response = self._make_request(
+            'GET', '/api/boleto',
+            params={
+                'bank': bank, 'type': file_type,
+                'template': template,
+                'data': json.dumps(data)
+            },
+            stream=True
+        )
+        return self._stream_to(response, dest, chunk_size)
+
+    def generate_multiple_boletos_to_file(
+        self,
+        boletos: Union[List[Dict[str, Any]], BoletoBatch],
+        dest: Destination,
+        file_type: str = 'pdf',
+        template: str = 'rghost',
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Gera múltiplos boletos gravando direto em ``dest`` (uma chamada ao /multi).
+
+        Returns:
+            Número de bytes gravados
+        """
+        response = self._make_request(
+            'POST',
+            f'/api/boleto/multi?template={template}',
+            data={'type': file_type},
+            files={'data': _json_upload('boletos.json', boletos)},
+            stream=True,
+            compress=True,
+            bank=_common_bank(boletos)
+        )
+        return self._stream_to(response, dest, chunk_size)
+
+    def generate_remessa_to_file(
+        self,
+        bank: str,
+        cnab_type: str,
+        data: Dict[str, Any],
+        dest: Destination,
+        pix: bool = False,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Gera arquivo de remessa CNAB gravando direto em ``dest``.
+
+        Returns:
+            Número de bytes gravados
+        """
+        response = self._make_request(
+            'POST',
+            f'/api/remessa?bank={bank}&type={cnab_type}&pix={str(pix).lower()}',
+            files={'data': _json_upload('remessa.json', data)},
+            stream=True,
+            compress=True
+        )
+        return self._stream_to(response, dest, chunk_size)
 
     # ==================== Internos ====================
 
-    def _multi_request(self, boletos, file_type, template, include_data):
-        f = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        json.dump(boletos, f)
-        f.close()
+    def _notify(self, method: str, endpoint: str, kwargs: Dict[str, Any], bank: Optional[str],
+                stream: bool, response: Optional[requests.Response], start: float, attempts: int,
+                error: Optional[Exception]) -> None:
+        elapsed = time.perf_counter() - start
+        path, _, query = endpoint.partition('?')
+        params = kwargs.get('params') or {}
+        if bank is None and isinstance(params, dict):
+            bank = params.get('bank')
+        if bank is None and query:
+            bank = parse_qs(query).get('bank', [None])[0]
 
-        params = f'include_data=true&' if include_data else ''
+        status_code = bytes_sent = bytes_received = ttfb = None
+        if response is not None:
+            status_code = response.status_code
+            # requests mede ``elapsed`` do envio até o parse dos headers
+            ttfb = response.elapsed.total_seconds()
+            body = response.request.body if response.request is not None else None
+            bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+            if stream:
+                length = response.headers.get('Content-Length')
+                bytes_received = int(length) if length and length.isdigit() else None
+            else:
+                bytes_received = len(response.content)
+
+        event = RequestEvent(
+            method=method,
+            endpoint=path,
+            bank=bank,
+            status_code=status_code,
+            attempts=max(attempts, 1),
+            bytes_sent=bytes_sent or 0,
+            bytes_received=bytes_received,
+            ttfb=ttfb,
+            elapsed=elapsed,
+            error=type(error).__name__ if error is not None else None,
+        )
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("Observador %r falhou", observer)
+
+    def _conditional_json(self, endpoint: str) -> Any:
+        """GET de capacidades do engine via ``http_cache`` (ETag/Cache-Control)."""
+        if self.http_cache is None:
+            return self._make_request('GET', endpoint).json()
+
+        url = urljoin(self.base_url, endpoint)
+        body, headers = self.http_cache.lookup(url)
+        if body is not None:
+            return body
+        response = self._make_request('GET', endpoint, headers=headers)
+        body = self.http_cache.update(url, response)
+        if body is None:
+            body = self.http_cache.update(url, self._make_request('GET', endpoint))
+        return body
+
+    def _cached_json(self, endpoint: str, bank: str, data: Dict[str, Any]) -> Any:
+        """
+        Consulta determinística em ``(bank, data)``, passando pelo cache se houver.
+
+        Payloads acima de ``post_threshold`` vão no corpo (POST) em vez da URL.
+
+        Só respostas de sucesso são armazenadas; erros sempre vão à rede.
+        """
+        def fetch():
+            encoded = json.dumps(data)
+            if self.post_threshold is not None and len(encoded) > self.post_threshold:
+                return self._make_request(
+                    'POST', endpoint,
+                    data=_json_body(bank, data),
+                    headers={'Content-Type': 'application/json'},
+                    bank=bank
+                ).json()
+            return self._make_request(
+                'GET', endpoint,
+                params={'bank': bank, 'data': encoded}
+            ).json()
+
+        if self.cache is None:
+            return fetch()
+
+        key = cache_key(endpoint, bank, data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = fetch()
+        self.cache.set(key, copy.deepcopy(result))
+        return result
+
+    def _stream_to(
+        self,
+        response: requests.Response,
+        dest: Destination,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """Copia o corpo da resposta em blocos para um caminho ou stream."""
+        chunk_size = chunk_size or self.stream_chunk_size
+        written = 0
+        try:
+            if hasattr(dest, 'write'):
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    written += dest.write(chunk) or len(chunk)
+                return written
+
+            try:
+                with open(dest, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        written += f.write(chunk)
+            except BaseException:
+                # Não deixa arquivo truncado para trás
+                if os.path.exists(dest):
+                    os.unlink(dest)
+                raise
+            return written
+        except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError) as e:
+            raise BoletoConnectionError(f"Conexão interrompida durante download: {str(e)}") from e
+        finally:
+            response.close()
+
+    def _iter_json_items(
+        self,
+        response: requests.Response,
+        chunk_size: Optional[int] = None,
+        key: Optional[str] = None
+    ) -> Iterator[Any]:
+        """Itera um array JSON da resposta em streaming e fecha a conexão no fim."""
+        chunks = response.iter_content(chunk_size=chunk_size or self.stream_chunk_size)
         try:
-            with open(f.name, 'rb') as fp:
+            yield from iter_json_array(chunks, key=key)
+        except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError) as e:
+            raise BoletoConnectionError(f"Conexão interrompida durante download: {str(e)}") from e
+        except ValueError as e:
+            raise BoletoAPIError(f"Resposta JSON inválida: {str(e)}", response.status_code) from e
+        finally:
+            response.close()
+
+    def _multi_request(self, boletos, file_type, template, include_data,
+                       chunk_size=None, max_workers=None):
+        chunk_size = chunk_size or self.multi_chunk_size
+        if chunk_size and len(boletos) > chunk_size:
+            return self._chunked_multi_request(
+                boletos, file_type, template, include_data, chunk_size, max_workers
+            )
+
+        params = f'include_data=true&' if include_data else ''
+        response = self._make_request(
+            'POST',
+            f'/api/boleto/multi?{params}template={template}',
+            data={'type': file_type},
+            files={'data': _json_upload('boletos.json', boletos)},
+            compress=True,
+            bank=_common_bank(boletos)
+        )
+        return response.json() if include_data else response.content
+
+    def _chunked_multi_request(self, boletos, file_type, template, include_data,
+                               chunk_size, max_workers):
+        if file_type != 'pdf':
+            raise ValueError("Divisão em lotes suportada apenas para file_type='pdf'")
+        if template == 'carne':
+            # Carnê: 3 vias por folha A4; lotes múltiplos de 3 não quebram folhas
+            chunk_size = -(-chunk_size // 3) * 3
+
+        starts = range(0, len(boletos), chunk_size)
+
+        def send(start):
+            chunk = boletos[start:start + chunk_size]
+            try:
+                return self._multi_request(chunk, file_type, template, include_data)
+            except BoletoAPIError as e:
+                # Índices de erro do engine são relativos ao lote
+                raise type(e)(
+                    f"Lote {start + 1}-{start + len(chunk)}: {e.message}", e.status_code
+                ) from e
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize) as executor:
+            results = list(executor.map(send, starts))
+
+        if not include_data:
+            return merge_pdfs(results)
+
+        merged = dict(results[0])
+        merged['total'] = sum(r.get('total', 0) for r in results)
+        merged['boletos'] = [b for r in results for b in r.get('boletos', [])]
+        merged['content_base64'] = base64.b64encode(
+            merge_pdfs(base64.b64decode(r['content_base64']) for r in results)
+        ).decode('ascii')
+        return merged
+
+    def _batch_request(self, operation, items, bank, chunk_size, max_workers):
+        batch = [_batch_item(item, bank) for item in items]
+        if not batch:
+            return []
+        chunk_size = chunk_size or self.batch_chunk_size
+
+        def send(start):
+            chunk = batch[start:start + chunk_size]
+            try:
                 response = self._make_request(
-                    'POST',
-                    f'/api/boleto/multi?{params}template={template}',
-                    data={'type': file_type},
-                    files={'data': fp}
+                    'POST', f'/api/boleto/batch/{operation}',
+                    data=json.dumps({'items': chunk}, separators=(',', ':')).encode('utf-8'),
+                    headers={'Content-Type': 'application/json'},
+                    bank=_common_bank(chunk)
                 )
-            return response.json() if include_data else response.content
-        finally:
-            os.unlink(f.name)
+            except BoletoAPIError as e:
+                if len(batch) <= chunk_size:
+                    raise
+                raise type(e)(
+                    f"Lote {start + 1}-{start + len(chunk)}: {e.message}", e.status_code
+                ) from e
+            results = response.json()['results']
+            # Índices do engine são relativos ao lote
+            for result in results:
+                result['index'] = result.get('index', 0) + start
+            return results
+
+        starts = range(0, len(batch), chunk_size)
+        if len(starts) == 1:
+            return send(0)
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_maxsize) as executor:
+            return [r for results in executor.map(send, starts) for r in results]
 
     def __repr__(self) -> str:
+        if len(self.balancer.endpoints) > 1:
+            return f"<BoletoClient(base_urls={[e.url for e in self.balancer.endpoints]!r})>"
         return f"<BoletoClient(base_url='{self.base_url}')>"
+
+
+def _json_upload(filename: str, payload: Any) -> Tuple[str, bytes, str]:
+    """
+    Monta o campo multipart de upload JSON direto da memória.
+
+    O corpo é serializado uma única vez em bytes (sem arquivo temporário) e
+    pode ser reenviado pelo urllib3 em caso de retry. ``BoletoBatch`` é
+    serializado direto das colunas.
+    """
+    if isinstance(payload, BoletoBatch):
+        body = payload.to_json_bytes()
+    else:
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return (filename, body, 'application/json')
+
+
+def _gzip_body(body: Any, threshold: Optional[int]) -> Optional[bytes]:
+    """
+    Corpo comprimido com gzip, ou None se não compensa.
+
+    Só comprime corpos em memória a partir de ``threshold`` bytes (None
+    desliga) e descarta o resultado se não ficou menor. O multipart inteiro
+    é comprimido; o engine descomprime antes de parsear.
+    """
+    if threshold is None or not isinstance(body, (bytes, bytearray)) or len(body) < threshold:
+        return None
+    compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return compressed if len(compressed) < len(body) else None
+
+
+def _batch_item(item: BatchItem, bank: Optional[str]) -> Dict[str, Any]:
+    if isinstance(item, tuple):
+        return {'bank': item[0], 'data': item[1]}
+    if bank is not None:
+        return {'bank': bank, 'data': item}
+    if 'bank' in item and 'data' in item:
+        return {'bank': item['bank'], 'data': item['data']}
+    raise ValueError("Item sem banco: use (bank, data), {'bank', 'data'} ou bank=...")
+
+
+def _common_bank(items: Union[Iterable[Mapping[str, Any]], BoletoBatch]) -> Optional[str]:
+    """Banco comum a todos os itens de um lote/``/multi`` (None se misturados ou ausente)."""
+    if isinstance(items, BoletoBatch):
+        if 'bank' not in items.columns:
+            return items.bank
+        banks = {items.bank if bank is None else bank for bank in items.column('bank')}
+    else:
+        banks = {item.get('bank') for item in items}
+    return banks.pop() if len(banks) == 1 else None
+
+
+def _json_body(bank: str, data: Any) -> bytes:
+    """Corpo ``{"bank": ..., "data": {...}}`` dos endpoints POST de consulta."""
+    return json.dumps({'bank': bank, 'data': data}, separators=(',', ':')).encode('utf-8')
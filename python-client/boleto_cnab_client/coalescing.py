@@ -0,0 +1,161 @@
+"""
+Coalescência de requisições idênticas em voo (single-flight).
+
+Quando várias threads pedem o mesmo boleto ao mesmo tempo (ex.: vários
+refreshes do portal do cliente), só a primeira vai à rede; as demais esperam
+e recebem a mesma resposta. Requisições são idênticas se método, URL e
+payload canônico (``data`` JSON com chaves ordenadas, conteúdo dos uploads)
+coincidem. Por padrão o cliente só coalesce as leituras de
+``COALESCE_ENDPOINTS``; uploads (``/multi``, remessa) são opt-in.
+
+Exemplo:
+    >>> client = BoletoClient('http://localhost:9292')   # coalescência ligada
+    >>> client.single_flight.stats()
+    {'executed': 120, 'coalesced': 37, 'in_flight': 0}
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Leituras determinísticas em (bank, data): PDF, dados, nosso número e validação
+COALESCE_ENDPOINTS = frozenset({
+    '/api/boleto',
+    '/api/boleto/data',
+    '/api/boleto/nosso_numero',
+    '/api/boleto/validate',
+})
+
+# Entram na chave; os de _NEUTRAL_KWARGS não mudam a resposta. Qualquer outro
+# kwarg (``json=``, ...) torna a requisição não coalescível.
+_KEYED_KWARGS = frozenset({'params', 'headers', 'files', 'data'})
+_NEUTRAL_KWARGS = frozenset({'timeout', 'verify', 'compress', 'bank'})
+
+
+def _canonical(value: Any) -> Any:
+    # ``data`` vai como JSON em string: a ordem das chaves não deve contar
+    if isinstance(value, str) and value[:1] in '{[':
+        try:
+            return json.dumps(json.loads(value), sort_keys=True, separators=(',', ':'))
+        except ValueError:
+            return value
+    return value
+
+
+def request_key(method: str, url: str, kwargs: Mapping[str, Any]) -> Optional[str]:
+    """
+    Chave canônica de uma requisição, ou None se ela não pode ser coalescida.
+
+    Uploads só entram se o conteúdo está em memória (``bytes``/``str``);
+    arquivos abertos, respostas em streaming e kwargs que não entram na
+    chave não são compartilháveis.
+    """
+    if kwargs.get('stream'):
+        return None
+    if not kwargs.keys() <= _KEYED_KWARGS | _NEUTRAL_KWARGS | {'stream'}:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(f'{method.upper()} {url}'.encode('utf-8'))
+
+    params = kwargs.get('params') or {}
+    digest.update(json.dumps(
+        sorted((str(k), _canonical(v)) for k, v in dict(params).items()),
+        separators=(',', ':')
+    ).encode('utf-8'))
+
+    # Headers contam: um GET com If-None-Match pode receber 304 sem corpo
+    headers = kwargs.get('headers') or {}
+    digest.update(json.dumps(
+        sorted((str(k).lower(), str(v)) for k, v in dict(headers).items()),
+        separators=(',', ':')
+    ).encode('utf-8'))
+
+    for name, value in sorted((kwargs.get('files') or {}).items()):
+        content = value[1] if isinstance(value, tuple) else value
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if not isinstance(content, bytes):
+            return None
+        digest.update(name.encode('utf-8'))
+        digest.update(hashlib.sha256(content).digest())
+
+    data = kwargs.get('data')
+    if data is not None:
+        if isinstance(data, Mapping):
+            data = json.dumps(sorted((str(k), str(v)) for k, v in data.items()))
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if not isinstance(data, bytes):
+            return None
+        digest.update(data)
+
+    return digest.hexdigest()
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Executa cada chave uma vez por vez; chamadas simultâneas esperam a primeira."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Executa ``fn`` ou aguarda a execução em voo com a mesma ``key``.
+
+        Quem espera recebe o mesmo resultado — ou a mesma exceção.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Execuções reais, chamadas que pegaram carona e chaves em voo."""
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+            }
+
+    def __repr__(self) -> str:
+        return f"<SingleFlight(executed={self.executed}, coalesced={self.coalesced})>"
@@ -0,0 +1,310 @@
+"""
+Adaptadores colunares (Apache Arrow / pandas) para o cliente Boleto CNAB.
+
+Saída: ``process_retorno(..., as_table=True)`` e ``parse_ofx(..., as_table=True)``
+devolvem tabelas tipadas em vez de listas de dicts — valores monetários em
+``float64``, datas em ``date32``/``datetime64``, o resto em texto. Os valores
+de retorno CNAB vêm do engine como no arquivo (centavos com zeros à
+esquerda, datas ``DDMMAA``) e são convertidos coluna a coluna.
+
+Entrada: ``generate_multiple_boletos_from_frame(df)`` lê as colunas do
+DataFrame/Table direto para um :class:`~boleto_cnab_client.batch.BoletoBatch`
+(conversões vetorizadas, sem um dict por linha) e serializa o ``/multi``
+a partir delas.
+
+Dependências opcionais: ``pip install boleto-cnab-client[arrow]`` (pyarrow)
+e/ou ``pip install boleto-cnab-client[pandas]``.
+
+Exemplo:
+    >>> pagamentos = client.process_retorno('sicoob', 'cnab240', 'ret.txt', as_table='pandas')
+    >>> pagamentos.groupby('data_credito')['valor_recebido'].sum()
+    >>> pdf = client.generate_multiple_boletos_from_frame(df, bank='sicoob')
+"""
+import json
+import math
+from array import array
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+    pc = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - dependência opcional
+    pd = None
+
+from .batch import NUMERIC_FIELDS, BoletoBatch
+
+# as_table: True (Arrow se instalado, senão pandas), 'arrow' ou 'pandas'
+TableFormat = Union[bool, str]
+
+# Tipos lógicos das colunas: 'money' (float64), 'date', 'string'
+RETORNO_TYPES: Dict[str, str] = {
+    **{name: 'money' for name in (
+        'valor_titulo', 'valor_pago', 'valor_tarifa', 'valor_recebido', 'valor_abatimento',
+        'valor_lancamento', 'valor_ajuste', 'desconto', 'iof', 'outras_despesas',
+        'juros_desconto', 'iof_desconto', 'desconto_concedito', 'juros_mora',
+        'outros_recebimento', 'abatimento_nao_aproveitado',
+    )},
+    **{name: 'date' for name in (
+        'data_ocorrencia', 'data_liquidacao', 'data_vencimento', 'data_credito',
+    )},
+}
+
+OFX_TYPES: Dict[str, str] = {
+    'fitid': 'string',
+    'tipo': 'string',
+    'data': 'date',
+    'valor': 'money',
+    'memo': 'string',
+    'name': 'string',
+    'checknum': 'string',
+    'refnum': 'string',
+    'nosso_numero_extraido': 'string',
+}
+
+_DATE_FORMATS = {6: '%d%m%y', 8: '%d%m%Y'}
+
+
+# =============================================================================
+# Conversão de valores do retorno CNAB
+# =============================================================================
+
+def cnab_valor(value: Any) -> Optional[float]:
+    """
+    Valor monetário em reais.
+
+    Strings só de dígitos são centavos (``'0000000015050'`` → ``150.5``), como
+    no arquivo CNAB; números e strings com separador decimal são usados como
+    estão.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text) / 100
+    try:
+        return float(text.replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def cnab_data(value: Any) -> Optional[date]:
+    """Data de ``DDMMAA``, ``DDMMAAAA`` ou ISO (``AAAA-MM-DD``); zeros/inválida → None."""
+    if value is None or isinstance(value, date):
+        return value
+    text = str(value).strip()
+    try:
+        if text.isdigit():
+            if not text.strip('0') or len(text) not in _DATE_FORMATS:
+                return None
+            return datetime.strptime(text, _DATE_FORMATS[len(text)]).date()
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        return None
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'money': cnab_valor,
+    'date': cnab_data,
+    'string': _text,
+}
+
+
+# =============================================================================
+# Registros -> tabela
+# =============================================================================
+
+def _backend(as_table: TableFormat) -> str:
+    if as_table is True:
+        if pa is not None:
+            return 'arrow'
+        if pd is not None:
+            return 'pandas'
+        raise ImportError(
+            "as_table requer pyarrow ou pandas. "
+            "Instale com: pip install boleto-cnab-client[arrow]"
+        )
+    if as_table == 'arrow':
+        if pa is None:
+            raise ImportError("as_table='arrow' requer pyarrow. Instale com: pip install boleto-cnab-client[arrow]")
+        return 'arrow'
+    if as_table == 'pandas':
+        if pd is None:
+            raise ImportError("as_table='pandas' requer pandas. Instale com: pip install boleto-cnab-client[pandas]")
+        return 'pandas'
+    raise ValueError(f"as_table deve ser True, 'arrow' ou 'pandas', recebido {as_table!r}")
+
+
+def _columns(records: Sequence[Mapping[str, Any]], types: Mapping[str, str]) -> Dict[str, List[Any]]:
+    # Colunas na ordem em que aparecem; campos ausentes numa linha viram None
+    names: Dict[str, None] = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in records]
+        convert = _CONVERTERS.get(types.get(name, ''))
+        columns[name] = [convert(v) for v in values] if convert else values
+    return columns
+
+
+def _arrow_array(values: List[Any], kind: Optional[str]) -> 'pa.Array':
+    if kind == 'money':
+        return pa.array(values, type=pa.float64())
+    if kind == 'date':
+        return pa.array(values, type=pa.date32())
+    if kind == 'string':
+        return pa.array(values, type=pa.string())
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Tipos misturados numa coluna sem tipo conhecido: texto
+        return pa.array([_text(v) for v in values], type=pa.string())
+
+
+def _pandas_series(values: List[Any], kind: Optional[str]) -> 'pd.Series':
+    if kind == 'money':
+        return pd.Series(values, dtype='float64')
+    if kind == 'date':
+        return pd.to_datetime(pd.Series(values, dtype='object'))
+    if kind == 'string':
+        return pd.Series(values, dtype='string')
+    return pd.Series(values)
+
+
+def records_to_table(
+    records: Sequence[Mapping[str, Any]],
+    types: Mapping[str, str],
+    as_table: TableFormat = True,
+    metadata: Optional[Mapping[str, Any]] = None
+) -> Any:
+    """
+    Converte registros JSON do engine numa tabela tipada.
+
+    Args:
+        records: Lista de dicts (pagamentos do retorno, transações do OFX)
+        types: Tipo lógico por coluna (``'money'``, ``'date'``, ``'string'``);
+            colunas fora do mapa têm o tipo inferido
+        as_table: ``True`` (Arrow se instalado, senão pandas), ``'arrow'`` ou ``'pandas'``
+        metadata: Dados do cabeçalho (ex. conta do OFX); vão nos metadados
+            do schema Arrow (JSON) ou em ``DataFrame.attrs``
+
+    Returns:
+        ``pyarrow.Table`` ou ``pandas.DataFrame``
+    """
+    backend = _backend(as_table)
+    columns = _columns(records, types)
+    # Colunas tipadas ausentes na resposta aparecem vazias (schema estável)
+    for name in types:
+        columns.setdefault(name, [None] * len(records))
+
+    if backend == 'arrow':
+        table = pa.table({name: _arrow_array(values, types.get(name)) for name, values in columns.items()})
+        if metadata:
+            table = table.replace_schema_metadata({
+                key: json.dumps(value, ensure_ascii=False) for key, value in metadata.items()
+            })
+        return table
+
+    frame = pd.DataFrame({name: _pandas_series(values, types.get(name)) for name, values in columns.items()})
+    if metadata:
+        frame.attrs.update(metadata)
+    return frame
+
+
+# =============================================================================
+# DataFrame/Table -> BoletoBatch
+# =============================================================================
+
+def _pandas_columns(frame: 'pd.DataFrame') -> Dict[str, Sequence[Any]]:
+    from pandas.api import types as ptypes
+
+    columns: Dict[str, Sequence[Any]] = {}
+    for name in frame.columns:
+        series = frame[name]
+        if name in NUMERIC_FIELDS:
+            values = array('d')
+            values.frombytes(series.to_numpy(dtype='float64', na_value=math.nan).tobytes())
+            columns[str(name)] = values
+            continue
+        if ptypes.is_datetime64_any_dtype(series):
+            series = series.dt.strftime('%Y/%m/%d')
+        elif ptypes.is_bool_dtype(series):
+            pass
+        elif ptypes.is_integer_dtype(series):
+            series = series.astype('string')
+        elif ptypes.is_float_dtype(series):
+            # Inteiros com ausentes viram float no pandas (123 -> 123.0)
+            present = series.dropna()
+            integral = bool(((present % 1) == 0).all())
+            series = series.astype('Int64' if integral else 'float64').astype('string')
+        elif ptypes.is_object_dtype(series):
+            series = series.map(_date_text, na_action='ignore')
+        series = series.astype(object)
+        columns[str(name)] = series.where(series.notna(), None).tolist()
+    return columns
+
+
+def _arrow_columns(table: 'pa.Table') -> Dict[str, Sequence[Any]]:
+    columns: Dict[str, Sequence[Any]] = {}
+    for name, column in zip(table.column_names, table.columns):
+        kind = column.type
+        if name in NUMERIC_FIELDS:
+            values = pc.cast(column, pa.float64()).to_pylist()
+            columns[name] = array('d', (math.nan if v is None else v for v in values))
+            continue
+        if pa.types.is_date(kind):
+            column = pc.strftime(pc.cast(column, pa.timestamp('s')), format='%Y/%m/%d')
+        elif pa.types.is_timestamp(kind):
+            column = pc.strftime(column, format='%Y/%m/%d')
+        elif pa.types.is_floating(kind):
+            present = pc.drop_null(column)
+            if len(present) == 0 or pc.all(pc.equal(pc.floor(present), present)).as_py():
+                column = pc.cast(column, pa.int64())
+            column = pc.cast(column, pa.string())
+        elif pa.types.is_integer(kind) or pa.types.is_decimal(kind):
+            column = pc.cast(column, pa.string())
+        columns[name] = column.to_pylist()
+    return columns
+
+
+def _date_text(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.strftime('%Y/%m/%d')
+    return value
+
+
+def batch_from_frame(frame: Any, bank: Optional[str] = None) -> BoletoBatch:
+    """
+    ``BoletoBatch`` a partir de um ``pandas.DataFrame`` ou ``pyarrow.Table``.
+
+    Colunas = campos de ``BoletoDataDict`` (mais ``bank`` opcional). ``valor``
+    vai para ``array('d')``; datas viram ``AAAA/MM/DD``; colunas inteiras
+    (agência, conta, nosso número) viram texto; ausentes (NaN/None/NaT) são
+    omitidos no JSON.
+    """
+    if pa is not None and isinstance(frame, pa.Table):
+        columns = _arrow_columns(frame)
+    elif pd is not None and isinstance(frame, pd.DataFrame):
+        columns = _pandas_columns(frame)
+    elif hasattr(frame, 'to_arrow') and pa is not None:
+        # polars e afins
+        columns = _arrow_columns(frame.to_arrow())
+    else:
+        raise TypeError(
+            f"Esperado pandas.DataFrame ou pyarrow.Table, recebido {type(frame).__name__} "
+            "(pip install boleto-cnab-client[arrow] ou [pandas])"
+        )
+    return BoletoBatch.from_columns(columns, bank=bank)
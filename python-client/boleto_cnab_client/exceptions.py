@@ -30,3 +30,8 @@ class BoletoConnectionError(BoletoAPIError):
 class BoletoTimeoutError(BoletoAPIError):
     """Timeout na requisição"""
     pass
+
+
+class BoletoCircuitOpenError(BoletoConnectionError):
+    """Circuito aberto: a API falhou repetidamente e a chamada nem foi feita"""
+    pass
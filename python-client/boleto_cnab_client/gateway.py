@@ -0,0 +1,382 @@
+"""
+Cliente do gateway de cobrança (boleto-api-python, FastAPI).
+
+O gateway registra cobranças nos bancos (C6, Sicoob) ou no engine
+brcobrança, por tenant, e devolve uma resposta normalizada. Este módulo
+traz os modelos do contrato (``CobrancaIn``/``CobrancaOut``, ``CarneIn``/
+``CarneOut``) e o :class:`GatewayClient` síncrono, com pool keep-alive e
+helpers em lote com concorrência limitada (``registrar_many``,
+``consultar_many``). A versão asyncio está em :mod:`.async_gateway`.
+
+Exemplo:
+    >>> gateway = GatewayClient('http://gateway:8000')
+    >>> out = gateway.registrar(CobrancaIn(
+    ...     tenant_id='imob_123', provider='sicoob',
+    ...     account_config={'cooperativa': '3073', 'conta': '12345'},
+    ...     cobranca=Cobranca(valor='1000.00', vencimento=date(2026, 7, 10),
+    ...                       pagador=Pagador(nome='Fulano', documento='12345678901')),
+    ... ))
+    >>> out.status, out.linha_digitavel
+"""
+import base64
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+from urllib.parse import quote, urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .exceptions import (
+    BoletoAPIError,
+    BoletoConnectionError,
+    BoletoTimeoutError,
+    BoletoValidationError
+)
+from .resilience import BACKOFF_MAX, RETRY_STATUS, backoff_delay, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# Providers aceitos pelo gateway; 'brcobranca' = offline/CNAB via engine Ruby
+PROVIDERS = ('brcobranca', 'c6', 'sicoob')
+
+# Status normalizados de CobrancaOut (iguais para qualquer banco)
+STATUS = ('registrado', 'pendente', 'liquidado', 'baixado', 'erro')
+
+# Só métodos idempotentes são repetidos: um POST /cobranca repetido pode
+# registrar o título duas vezes no banco
+IDEMPOTENT_METHODS = ('GET', 'DELETE')
+
+
+# =============================================================================
+# Modelos do contrato
+# =============================================================================
+
+def _compact(data: Mapping[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if v is not None}
+
+
+@dataclass
+class Pagador:
+    """Pagador da cobrança (``documento`` = CPF/CNPJ só dígitos)."""
+    nome: str
+    documento: str
+    endereco: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return _compact(self.__dict__)
+
+
+@dataclass
+class Cobranca:
+    """
+    Cobrança no formato canônico do gateway.
+
+    ``valor`` aceita ``Decimal``, ``str`` ou número e vai como string (o
+    gateway usa ``Decimal``); ``vencimento`` aceita ``date`` ou ISO.
+    """
+    valor: Union[Decimal, str, float]
+    vencimento: Union[date, str]
+    pagador: Union[Pagador, Dict[str, Any]]
+    nosso_numero: Optional[str] = None
+    seu_numero: Optional[str] = None
+    multa: Optional[Dict[str, Any]] = None
+    juros: Optional[Dict[str, Any]] = None
+    desconto: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = _compact(self.__dict__)
+        data['valor'] = str(self.valor)
+        if isinstance(self.vencimento, date):
+            data['vencimento'] = self.vencimento.isoformat()
+        if isinstance(self.pagador, Pagador):
+            data['pagador'] = self.pagador.to_dict()
+        return data
+
+
+@dataclass
+class CobrancaIn:
+    """Corpo de ``POST /cobranca``: tenant, provider, conta e a cobrança."""
+    tenant_id: str
+    provider: str
+    cobranca: Union[Cobranca, Dict[str, Any]]
+    account_config: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tenant_id': self.tenant_id,
+            'provider': self.provider,
+            'account_config': self.account_config,
+            'cobranca': _to_dict(self.cobranca),
+        }
+
+
+@dataclass
+class CobrancaOut:
+    """Resposta normalizada do gateway (mesmo shape para qualquer provider)."""
+    status: str
+    id: Optional[str] = None
+    linha_digitavel: Optional[str] = None
+    codigo_barras: Optional[str] = None
+    pix_copia_cola: Optional[str] = None
+    pdf_base64: Optional[str] = None
+    raw: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'CobrancaOut':
+        """Cria a partir do JSON do gateway, ignorando campos desconhecidos."""
+        return cls(**{k: data.get(k) for k in cls.__dataclass_fields__ if k in data})
+
+    @property
+    def pdf(self) -> Optional[bytes]:
+        """PDF do boleto decodificado, quando o provider devolve."""
+        return base64.b64decode(self.pdf_base64) if self.pdf_base64 else None
+
+
+@dataclass
+class CarneIn:
+    """Corpo de ``POST /carne``: parcelas registradas uma a uma e renderizadas em ``bank``."""
+    tenant_id: str
+    provider: str
+    bank: str
+    parcelas: List[Union[Cobranca, Dict[str, Any]]]
+    account_config: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tenant_id': self.tenant_id,
+            'provider': self.provider,
+            'account_config': self.account_config,
+            'bank': self.bank,
+            'parcelas': [_to_dict(p) for p in self.parcelas],
+        }
+
+
+@dataclass
+class CarneOut:
+    """Carnê 3-vias em base64 e uma ``CobrancaOut`` por parcela."""
+    carne_pdf_base64: Optional[str] = None
+    cobrancas: List[CobrancaOut] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'CarneOut':
+        return cls(
+            carne_pdf_base64=data.get('carne_pdf_base64'),
+            cobrancas=[CobrancaOut.from_dict(c) for c in data.get('cobrancas') or []],
+        )
+
+    @property
+    def pdf(self) -> Optional[bytes]:
+        return base64.b64decode(self.carne_pdf_base64) if self.carne_pdf_base64 else None
+
+
+def _to_dict(value: Any) -> Dict[str, Any]:
+    return value.to_dict() if hasattr(value, 'to_dict') else dict(value)
+
+
+def _cobranca_path(cobranca_id: str) -> str:
+    return '/cobranca/' + quote(str(cobranca_id), safe='')
+
+
+def _raise_for_gateway_status(status_code: int, body: Any, text: str) -> None:
+    """Erros do gateway vêm como ``{"detail": ...}`` (FastAPI)."""
+    if status_code < 400:
+        return
+    detail = body.get('detail', text) if isinstance(body, dict) else text
+    message = detail if isinstance(detail, str) else json.dumps(detail, ensure_ascii=False)
+    # 422: payload inválido (pydantic); 400: rejeitado pelo banco/engine
+    if status_code in (400, 422):
+        raise BoletoValidationError(message, status_code)
+    raise BoletoAPIError(message, status_code)
+
+
+def _json_or_none(response: Any) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# Cliente síncrono
+# =============================================================================
+
+class GatewayClient:
+    """
+    Cliente síncrono do gateway de cobrança.
+
+    Uma ``requests.Session`` com pool de ``pool_maxsize`` conexões keep-alive
+    é compartilhada por todas as chamadas (e pelas threads dos helpers em
+    lote). ``consultar``/``baixar`` são repetidos em erro de conexão e em
+    429/5xx (respeitando ``Retry-After``); ``registrar`` e ``gerar_carne``
+    não, para não registrar o mesmo título duas vezes.
+
+    Args:
+        base_url: URL do gateway (ex. ``http://gateway:8000``)
+        headers: Headers fixos (ex. ``Authorization`` do proxy na frente)
+        max_in_flight: Requisições simultâneas em ``*_many`` (padrão ``pool_maxsize``)
+
+    Example:
+        >>> with GatewayClient('http://gateway:8000') as gateway:
+        ...     resultados = gateway.registrar_many(cobrancas, max_in_flight=8)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30,
+        retries: int = 3,
+        pool_maxsize: int = 10,
+        backoff_factor: float = 0.5,
+        headers: Optional[Mapping[str, str]] = None,
+        max_in_flight: Optional[int] = None,
+        verify_ssl: bool = True
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.pool_maxsize = pool_maxsize
+        self.backoff_factor = backoff_factor
+        self.max_in_flight = max_in_flight or pool_maxsize
+        self.verify_ssl = verify_ssl
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> 'GatewayClient':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        url = urljoin(self.base_url + '/', path.lstrip('/'))
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, verify=self.verify_ssl, **kwargs
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                # Falha de conexão antes do envio é segura para qualquer método
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout) or _not_sent(e)
+                if retryable and attempt <= self.retries:
+                    time.sleep(backoff_delay(attempt, self.backoff_factor))
+                    continue
+                if isinstance(e, requests.Timeout):
+                    raise BoletoTimeoutError(f"Timeout após {self.timeout}s") from e
+                raise BoletoConnectionError(f"Erro de conexão: {str(e)}") from e
+
+            if idempotent and response.status_code in RETRY_STATUS and attempt <= self.retries:
+                wait_for = retry_after_seconds(response.headers)
+                if wait_for is None or wait_for <= BACKOFF_MAX:
+                    delay = backoff_delay(attempt, self.backoff_factor)
+                    if wait_for is not None:
+                        delay = max(delay, wait_for)
+                    logger.debug("Retry %d/%d de %s %s em %.1fs (status %d)",
+                                 attempt, self.retries, method, path, delay, response.status_code)
+                    response.close()
+                    time.sleep(delay)
+                    continue
+
+            body = _json_or_none(response)
+            _raise_for_gateway_status(response.status_code, body, response.text)
+            return body
+
+    # ==================== Operações ====================
+
+    def health(self) -> Dict[str, str]:
+        """``GET /health`` do gateway."""
+        return self._request('GET', '/health')
+
+    def registrar(self, cobranca: Union[CobrancaIn, Mapping[str, Any]]) -> CobrancaOut:
+        """Registra uma cobrança (``POST /cobranca``)."""
+        return CobrancaOut.from_dict(self._request('POST', '/cobranca', json=_to_dict(cobranca)))
+
+    def consultar(self, cobranca_id: str, tenant_id: str, provider: str) -> CobrancaOut:
+        """Consulta o status de uma cobrança (``GET /cobranca/{id}``)."""
+        return CobrancaOut.from_dict(self._request(
+            'GET', _cobranca_path(cobranca_id), params={'tenant_id': tenant_id, 'provider': provider}
+        ))
+
+    def baixar(self, cobranca_id: str, tenant_id: str, provider: str) -> CobrancaOut:
+        """Baixa/cancela uma cobrança (``DELETE /cobranca/{id}``)."""
+        return CobrancaOut.from_dict(self._request(
+            'DELETE', _cobranca_path(cobranca_id), params={'tenant_id': tenant_id, 'provider': provider}
+        ))
+
+    def gerar_carne(self, carne: Union[CarneIn, Mapping[str, Any]]) -> CarneOut:
+        """Registra as parcelas e monta o carnê 3-vias (``POST /carne``)."""
+        return CarneOut.from_dict(self._request('POST', '/carne', json=_to_dict(carne)))
+
+    # ==================== Em lote ====================
+
+    def registrar_many(
+        self,
+        cobrancas: Iterable[Union[CobrancaIn, Mapping[str, Any]]],
+        max_in_flight: Optional[int] = None
+    ) -> List[Union[CobrancaOut, BoletoAPIError]]:
+        """
+        Registra várias cobranças com no máximo ``max_in_flight`` em voo.
+
+        Returns:
+            Um item por cobrança, na ordem recebida: ``CobrancaOut`` ou a
+            exceção daquela cobrança (as demais seguem)
+
+        Example:
+            >>> resultados = gateway.registrar_many(cobrancas)
+            >>> falhas = [(i, r) for i, r in enumerate(resultados) if isinstance(r, Exception)]
+        """
+        return self._map(self.registrar, list(cobrancas), max_in_flight)
+
+    def consultar_many(
+        self,
+        cobranca_ids: Iterable[str],
+        tenant_id: str,
+        provider: str,
+        max_in_flight: Optional[int] = None
+    ) -> List[Union[CobrancaOut, BoletoAPIError]]:
+        """Consulta várias cobranças do mesmo tenant/provider; ver ``registrar_many``."""
+        return self._map(
+            lambda cobranca_id: self.consultar(cobranca_id, tenant_id, provider),
+            list(cobranca_ids), max_in_flight
+        )
+
+    def _map(self, fn, items, max_in_flight):
+        max_in_flight = max_in_flight or self.max_in_flight
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight deve ser >= 1")
+        if not items:
+            return []
+
+        def call(item):
+            try:
+                return fn(item)
+            except BoletoAPIError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_in_flight, len(items))) as executor:
+            return list(executor.map(call, items))
+
+    def __repr__(self) -> str:
+        return f"<GatewayClient(base_url='{self.base_url}')>"
+
+
+def _not_sent(error: Exception) -> bool:
+    # urllib3 sinaliza falha ao abrir a conexão com NewConnectionError
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return type(reason).__name__ in ('NewConnectionError', 'NameResolutionError', 'ConnectTimeoutError')
@@ -0,0 +1,203 @@
+"""
+Instrumentação do cliente Boleto CNAB: eventos por chamada e agregador.
+
+Cada requisição do ``BoletoClient`` gera um :class:`RequestEvent` entregue aos
+observadores registrados (``observers=[...]`` ou ``client.add_observer``). O
+:class:`MetricsCollector` é um observador pronto, com histograma de latência e
+percentis por endpoint e exportação no formato texto do Prometheus.
+
+Exemplo:
+    >>> metrics = MetricsCollector()
+    >>> client = BoletoClient('http://localhost:9292', observers=[metrics])
+    >>> client.health_check()
+    >>> metrics.percentiles('/api/health')
+    {'p50': 0.004, 'p90': 0.004, 'p99': 0.004}
+    >>> print(metrics.to_prometheus())
+"""
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Limites (segundos) do histograma de latência
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class RequestEvent:
+    """
+    Uma chamada do cliente à API, após terminar (com sucesso ou erro).
+
+    Attributes:
+        method: Método HTTP
+        endpoint: Caminho sem query string (ex.: ``/api/boleto/multi``)
+        bank: Banco da chamada, quando houver
+        status_code: Status HTTP final (None se não houve resposta)
+        attempts: Tentativas feitas, incluindo retries
+        bytes_sent: Tamanho do corpo enviado
+        bytes_received: Tamanho do corpo recebido (None se desconhecido, ex.: streaming)
+        ttfb: Tempo até o primeiro byte/headers da resposta, em segundos
+        elapsed: Latência total da chamada, em segundos
+        error: Nome da exceção levantada ao chamador, se houver
+    """
+    method: str
+    endpoint: str
+    bank: Optional[str]
+    status_code: Optional[int]
+    attempts: int
+    bytes_sent: int
+    bytes_received: Optional[int]
+    ttfb: Optional[float]
+    elapsed: float
+    error: Optional[str] = None
+
+
+Observer = Callable[[RequestEvent], None]
+
+
+class _EndpointStats:
+    __slots__ = ('count', 'errors', 'retries', 'latency_sum', 'bucket_counts',
+                 'bytes_sent', 'bytes_received', 'statuses', 'samples')
+
+    def __init__(self, buckets: int, window: int):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * buckets
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.statuses: Dict[str, int] = {}
+        self.samples: Deque[float] = deque(maxlen=window)
+
+
+class MetricsCollector:
+    """
+    Agregador de :class:`RequestEvent` por endpoint, seguro entre threads.
+
+    Args:
+        buckets: Limites superiores do histograma de latência (segundos)
+        window: Quantas latências recentes manter por endpoint para os percentis
+        namespace: Prefixo das métricas no formato Prometheus
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        window: int = 2048,
+        namespace: str = 'boleto_client'
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.window = window
+        self.namespace = namespace
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats(len(self.buckets), self.window)
+            stats.count += 1
+            stats.retries += max(event.attempts - 1, 0)
+            stats.latency_sum += event.elapsed
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received or 0
+            stats.samples.append(event.elapsed)
+            if event.error is not None:
+                stats.errors += 1
+            status = str(event.status_code) if event.status_code is not None else 'error'
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            for i, bound in enumerate(self.buckets):
+                if event.elapsed <= bound:
+                    stats.bucket_counts[i] += 1
+                    break
+
+    def percentiles(
+        self,
+        endpoint: str,
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+        method: Optional[str] = None
+    ) -> Dict[str, float]:
+        """Percentis de latência (segundos) sobre a janela recente do endpoint."""
+        with self._lock:
+            samples = sorted(
+                s for (m, e), stats in self._stats.items()
+                if e == endpoint and (method is None or m == method)
+                for s in stats.samples
+            )
+        if not samples:
+            return {}
+        result = {}
+        for q in quantiles:
+            index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+            result[f'p{q * 100:g}'] = samples[index]
+        return result
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Resumo por endpoint: contagens, erros, retries, bytes e percentis."""
+        with self._lock:
+            keys = list(self._stats)
+        result = []
+        for method, endpoint in keys:
+            with self._lock:
+                stats = self._stats[(method, endpoint)]
+                row = {
+                    'method': method,
+                    'endpoint': endpoint,
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'retries': stats.retries,
+                    'bytes_sent': stats.bytes_sent,
+                    'bytes_received': stats.bytes_received,
+                    'statuses': dict(stats.statuses),
+                    'latency_avg': stats.latency_sum / stats.count if stats.count else 0.0,
+                }
+            row.update(self.percentiles(endpoint, method=method))
+            result.append(row)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self) -> str:
+        """Métricas no formato texto de exposição do Prometheus."""
+        ns = self.namespace
+        lines = [
+            f'# HELP {ns}_request_duration_seconds Latência das chamadas à API Boleto CNAB.',
+            f'# TYPE {ns}_request_duration_seconds histogram',
+        ]
+        with self._lock:
+            items = sorted(self._stats.items())
+            for (method, endpoint), stats in items:
+                labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, stats.bucket_counts):
+                    cumulative += count
+                    lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+                lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f'{ns}_request_duration_seconds_sum{{{labels}}} {stats.latency_sum:.6f}')
+                lines.append(f'{ns}_request_duration_seconds_count{{{labels}}} {stats.count}')
+
+            counters = (
+                ('requests_total', 'Chamadas por status HTTP final.',
+                 lambda s: [(f',status="{k}"', v) for k, v in sorted(s.statuses.items())]),
+                ('retries_total', 'Retries feitos pelo cliente.', lambda s: [('', s.retries)]),
+                ('bytes_sent_total', 'Bytes de corpo enviados.', lambda s: [('', s.bytes_sent)]),
+                ('bytes_received_total', 'Bytes de corpo recebidos.', lambda s: [('', s.bytes_received)]),
+            )
+            for name, help_text, values in counters:
+                lines.append(f'# HELP {ns}_{name} {help_text}')
+                lines.append(f'# TYPE {ns}_{name} counter')
+                for (method, endpoint), stats in items:
+                    labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                    for extra, value in values(stats):
+                        lines.append(f'{ns}_{name}{{{labels}{extra}}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
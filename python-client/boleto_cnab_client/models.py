@@ -1,9 +1,9 @@
 """
 Modelos de dados para o cliente Boleto CNAB
 """
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping, Tuple
 
 
 @dataclass
@@ -110,3 +110,168 @@ class BoletoResponse:
             f"  Linha Digitável: {self.linha_digitavel or 'N/A'}\n"
             f"  Valor: R$ {self.valor:.2f}"
         )
+
+
+class _CompactModel:
+    """
+    Base dos modelos compactos: ``__slots__`` (sem ``__dict__`` por instância)
+    e ``to_dict``/``from_dict`` diretos sobre os slots.
+
+    Subclasses definem ``__slots__`` (ordem dos campos), ``_required`` e
+    ``_defaults``, derivados do dataclass equivalente.
+    """
+    __slots__ = ()
+    _required: Tuple[str, ...] = ()
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if len(args) > len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} recebeu argumentos posicionais demais")
+        values = dict(zip(self.__slots__, args))
+        for name, value in kwargs.items():
+            if name not in self._defaults and name not in self._required:
+                raise TypeError(f"{type(self).__name__} não tem o campo '{name}'")
+            if name in values:
+                raise TypeError(f"{type(self).__name__} recebeu '{name}' duas vezes")
+            values[name] = value
+        missing = [name for name in self._required if name not in values]
+        if missing:
+            raise TypeError(f"{type(self).__name__} sem campos obrigatórios: {', '.join(missing)}")
+        defaults = self._defaults
+        for name in self.__slots__:
+            setattr(self, name, values[name] if name in values else defaults[name])
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Any:
+        """Cria a partir de um dict (ex.: resposta da API), ignorando chaves extras."""
+        missing = [name for name in cls._required if name not in data]
+        if missing:
+            raise TypeError(f"{cls.__name__} sem campos obrigatórios: {', '.join(missing)}")
+        obj = cls.__new__(cls)
+        get = data.get
+        defaults = cls._defaults
+        for name in cls.__slots__:
+            setattr(obj, name, get(name, defaults.get(name)))
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário, omitindo valores None"""
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+
+def _compact_model(name: str, model: type, doc: str, **namespace: Any) -> type:
+    """Cria a variante compacta de um dataclass: mesmos campos e defaults."""
+    specs = fields(model)
+    namespace.update(
+        __doc__=doc,
+        __module__=__name__,
+        __slots__=tuple(f.name for f in specs),
+        _required=tuple(f.name for f in specs if f.default is MISSING),
+        _defaults={f.name: f.default for f in specs if f.default is not MISSING},
+    )
+    return type(name, (_CompactModel,), namespace)
+
+
+CompactBoletoData = _compact_model(
+    'CompactBoletoData', BoletoData,
+    """
+    Variante compacta de :class:`BoletoData` (``__slots__``), para lotes grandes.
+
+    Mesmos campos, defaults e ``to_dict``; usa menos memória por instância.
+    """
+)
+
+CompactBoletoResponse = _compact_model(
+    'CompactBoletoResponse', BoletoResponse,
+    """Variante compacta de :class:`BoletoResponse` (``__slots__``).""",
+    __str__=BoletoResponse.__str__
+)
+
+
+# Header do include_data=headers -> chave do include_data=true
+_INFO_HEADERS = {
+    'X-Banco': 'bank',
+    'X-Valor': 'valor',
+    'X-Data-Vencimento': 'data_vencimento',
+    'X-Agencia-Conta': 'agencia_conta_boleto',
+    'X-Carteira': 'carteira',
+}
+
+
+@dataclass
+class BoletoFile:
+    """
+    Arquivo do boleto (bytes crus) + metadados lidos dos headers da resposta.
+
+    Retornado por ``generate_boleto_file``: evita o base64 do
+    ``include_data=true`` (~33% a mais de bytes e encode/decode por chamada).
+
+    Attributes:
+        content: Bytes do arquivo (PDF/JPG/PNG/TIF)
+        content_type: MIME type da resposta
+        filename: Nome sugerido (Content-Disposition)
+        nosso_numero: Nosso número (X-Nosso-Numero)
+        nosso_numero_formatado: Nosso número impresso (X-Nosso-Numero-Formatado)
+        nosso_numero_dv: Dígito verificador (X-Nosso-Numero-DV)
+        codigo_barras: Código de barras (X-Codigo-Barras)
+        linha_digitavel: Linha digitável (X-Linha-Digitavel)
+        data: Campos escalares dos headers ``X-Banco``, ``X-Valor``,
+            ``X-Data-Vencimento``, ``X-Agencia-Conta`` e ``X-Carteira``, com as
+            chaves do include_data (``bank``, ``valor``, ...); texto livre
+            (instruções, sacado) não vem em headers
+    """
+    content: bytes
+    content_type: Optional[str] = None
+    filename: Optional[str] = None
+    nosso_numero: Optional[str] = None
+    nosso_numero_formatado: Optional[str] = None
+    nosso_numero_dv: Optional[str] = None
+    codigo_barras: Optional[str] = None
+    linha_digitavel: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(cls, content: bytes, headers: Mapping[str, str]) -> 'BoletoFile':
+        """Monta a partir do corpo binário e dos headers X-* da API."""
+        def header(name: str) -> Optional[str]:
+            return headers.get(name) or None
+
+        filename = None
+        disposition = headers.get('Content-Disposition', '')
+        if 'filename=' in disposition:
+            filename = disposition.split('filename=', 1)[1].strip('"; ')
+
+        data: Dict[str, Any] = {}
+        for name, key in _INFO_HEADERS.items():
+            value = header(name)
+            if value is not None:
+                data[key] = value
+        if 'valor' in data:
+            try:
+                data['valor'] = float(data['valor'])
+            except ValueError:
+                pass
+        return cls(
+            content=content,
+            content_type=header('Content-Type'),
+            filename=filename,
+            nosso_numero=header('X-Nosso-Numero'),
+            nosso_numero_formatado=header('X-Nosso-Numero-Formatado'),
+            nosso_numero_dv=header('X-Nosso-Numero-DV'),
+            codigo_barras=header('X-Codigo-Barras'),
+            linha_digitavel=header('X-Linha-Digitavel'),
+            data=data
+        )
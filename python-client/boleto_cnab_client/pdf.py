@@ -0,0 +1,35 @@
+"""
+Utilitários de PDF do cliente Boleto CNAB.
+
+Requer ``pypdf``: ``pip install boleto-cnab-client[pdf]``.
+"""
+import io
+from typing import Iterable
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pragma: no cover - dependência opcional
+    PdfReader = PdfWriter = None
+
+
+def merge_pdfs(parts: Iterable[bytes]) -> bytes:
+    """
+    Concatena PDFs, na ordem recebida, num único documento.
+
+    Example:
+        >>> pdf = merge_pdfs([lote1, lote2, lote3])
+    """
+    if PdfWriter is None:
+        raise ImportError(
+            "merge_pdfs requer pypdf. "
+            "Instale com: pip install boleto-cnab-client[pdf]"
+        )
+
+    writer = PdfWriter()
+    for part in parts:
+        for page in PdfReader(io.BytesIO(part)).pages:
+            writer.add_page(page)
+
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
@@ -0,0 +1,238 @@
+"""
+Política de retry adaptativa do cliente Boleto CNAB.
+
+Substitui o ``Retry`` fixo do urllib3 por três peças:
+
+- :class:`RetryBudget`: limita os retries a uma fração do tráfego bem-sucedido
+  recente, para que um engine sobrecarregado não receba carga multiplicada;
+- :class:`CircuitBreaker`: após falhas consecutivas, falha rápido (sem rede)
+  até o fim do período de recuperação, e então libera uma sondagem;
+- :func:`retry_after_seconds`: respeita o header ``Retry-After`` de 429/503.
+
+Exemplo:
+    >>> client = BoletoClient('http://engine:9292')
+    >>> client.circuit_breaker is CircuitBreaker.for_url('http://engine:9292')
+    True
+    >>> client.circuit_breaker.state
+    'closed'
+"""
+import email.utils
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Mapping, Optional
+
+# Status que indicam sobrecarga/indisponibilidade transitória
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Teto de espera entre tentativas (mesmo padrão do urllib3)
+BACKOFF_MAX = 120.0
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def backoff_delay(attempt: int, factor: float, maximum: float = BACKOFF_MAX) -> float:
+    """Espera antes do retry ``attempt`` (1, 2, ...): 0, 2*f, 4*f, ... até ``maximum``."""
+    if attempt <= 1:
+        return 0.0
+    return min(maximum, factor * (2 ** (attempt - 1)))
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Segundos pedidos pelo header ``Retry-After`` (inteiro ou data HTTP).
+
+    Returns:
+        None se o header não existe ou é inválido
+    """
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """
+    Orçamento de retries proporcional ao tráfego bem-sucedido recente.
+
+    Um retry só é permitido se, na janela de ``window`` segundos, o número de
+    retries ficar abaixo de ``min_retries + ratio * sucessos``. Com o engine
+    saudável quase nunca limita; com o engine caído, os sucessos somem e os
+    retries param logo após ``min_retries``.
+
+    Args:
+        ratio: Fração dos sucessos que pode virar retry (0.2 = 20%)
+        min_retries: Retries sempre permitidos por janela (tráfego baixo)
+        window: Tamanho da janela, em segundos
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._successes: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        limit = now - self.window
+        for events in (self._successes, self._retries):
+            while events and events[0] < limit:
+                events.popleft()
+
+    def record_success(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._successes.append(now)
+
+    def try_acquire(self) -> bool:
+        """Reserva um retry; False se o orçamento da janela acabou."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._successes):
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.monotonic())
+            successes, retries = len(self._successes), len(self._retries)
+        return {
+            'successes': successes,
+            'retries': retries,
+            'available': max(0, int(self.min_retries + self.ratio * successes) - retries),
+        }
+
+    def __repr__(self) -> str:
+        return f"<RetryBudget(ratio={self.ratio}, min_retries={self.min_retries}, window={self.window})>"
+
+
+class CircuitBreaker:
+    """
+    Disjuntor por URL base: ``closed`` → ``open`` → ``half_open`` → ``closed``.
+
+    Os clientes usam por padrão :meth:`for_url`: clientes de vida curta da
+    mesma URL no processo compartilham o estado de falhas.
+
+    Args:
+        failure_threshold: Falhas consecutivas (5xx/429, timeout, conexão)
+            que abrem o circuito
+        recovery_timeout: Segundos com o circuito aberto antes de liberar
+            uma sondagem (``half_open``)
+        half_open_max: Requisições simultâneas liberadas em ``half_open``
+    """
+
+    _registry: Dict[str, 'CircuitBreaker'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max = half_open_max
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._times_opened = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_url(cls, base_url: str, **kwargs: Any) -> 'CircuitBreaker':
+        """Disjuntor compartilhado no processo para ``base_url`` (criado na 1ª chamada)."""
+        key = base_url.rstrip('/')
+        with cls._registry_lock:
+            breaker = cls._registry.get(key)
+            if breaker is None:
+                breaker = cls._registry[key] = cls(**kwargs)
+            return breaker
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        """``'closed'``, ``'open'`` ou ``'half_open'``."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def retry_in(self) -> float:
+        """Segundos até o circuito aberto liberar uma sondagem (0 se não está aberto)."""
+        with self._lock:
+            if self._current_state(time.monotonic()) != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """True se a requisição pode seguir; False para falhar rápido."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._half_open_in_flight < self.half_open_max:
+                self._half_open_in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._half_open_in_flight = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != OPEN:
+                    self._times_opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_in_flight = 0
+
+    def release_probe(self) -> None:
+        """
+        Requisição autorizada por ``allow()`` terminou sem resultado do servidor.
+
+        Erro local (URL inválida, cancelamento, bug de adapter) não conta como
+        sucesso nem falha, mas precisa devolver a vaga de sondagem do
+        half-open — senão o disjuntor fica recusando tudo para sempre.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado para monitoramento."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'times_opened': self._times_opened,
+            }
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker(state={self.state!r}, failure_threshold={self.failure_threshold})>"
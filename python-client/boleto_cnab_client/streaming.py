@@ -0,0 +1,125 @@
+"""
+Decodificação incremental de arrays JSON para o cliente Boleto CNAB.
+
+Permite consumir respostas grandes (retorno CNAB, extrato OFX) item a item,
+conforme os bytes chegam, sem montar a lista inteira em memória. Só usa a
+biblioteca padrão (``json.JSONDecoder.raw_decode``).
+"""
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """Buffer de texto alimentado sob demanda por um iterável de bytes."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder('utf-8')().decode
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Lê mais um bloco; retorna False no fim do stream."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                # Descarta o que já foi consumido antes de crescer o buffer
+                self.text = self.text[self.pos:] + self._decode(chunk)
+                self.pos = 0
+                return True
+        self.text = self.text[self.pos:] + self._decode(b'', final=True)
+        self.pos = 0
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Próximo caractere não-branco (sem consumir), ou '' no fim."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"JSON inesperado: esperado {char!r}, encontrado {found or 'fim'!r}"
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decodifica o próximo valor JSON completo."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Números/literais no fim do buffer podem estar truncados ("12" de "123")
+            if end == len(self.text) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(buf: _Buffer) -> Iterator[Any]:
+    buf.expect('[')
+    if buf.peek() == ']':
+        buf.pos += 1
+        return
+    while True:
+        yield buf.value()
+        if buf.peek() == ',':
+            buf.pos += 1
+            continue
+        buf.expect(']')
+        return
+
+
+def iter_json_array(chunks: Iterable[bytes], key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Itera os elementos de um array JSON, decodificando incrementalmente.
+
+    Args:
+        chunks: Iterável de blocos de bytes (ex.: ``response.iter_content()``)
+        key: Se informado, o documento é um objeto e o array iterado é o valor
+            dessa chave (nível superior); as demais chaves são ignoradas
+
+    Example:
+        >>> list(iter_json_array([b'[{"a": 1}, ', b'{"a": 2}]']))
+        [{'a': 1}, {'a': 2}]
+        >>> list(iter_json_array([b'{"total": 1, "itens": [3]}'], key='itens'))
+        [3]
+    """
+    buf = _Buffer(chunks)
+    if key is None:
+        yield from _iter_array(buf)
+        return
+
+    buf.expect('{')
+    if buf.peek() == '}':
+        return
+    while True:
+        name = buf.value()
+        buf.expect(':')
+        if name == key:
+            yield from _iter_array(buf)
+            return
+        buf.value()
+        if buf.peek() == ',':
+            buf.pos += 1
+            continue
+        buf.expect('}')
+        return
@@ -0,0 +1,201 @@
+"""
+Transportes HTTP plugáveis do BoletoClient.
+
+O ``BoletoClient`` envia tudo por uma ``requests.Session``; o transporte é o
+adapter montado nela. O padrão (``transport='requests'``) é o ``HTTPAdapter``
+do urllib3, só HTTP/1.1: cada requisição em voo ocupa uma conexão TCP (+TLS).
+Com ``transport='http2'`` o :class:`HTTPXAdapter` envia pelo ``httpx`` com
+HTTP/2, multiplexando as requisições simultâneas em poucas conexões.
+
+Retries, balanceamento, coalescência, cache e streaming continuam no cliente;
+só a ida à rede muda.
+
+Requer ``httpx[http2]``: ``pip install boleto-cnab-client[http2]``.
+
+Exemplo:
+    >>> client = BoletoClient('https://boletos.exemplo.com.br', transport='http2')
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependência opcional
+    httpx = None
+
+TRANSPORTS = ('requests', 'http2')
+
+# Headers por conexão: o httpx cuida deles e o HTTP/2 os proíbe
+_HOP_BY_HOP = frozenset((
+    'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'
+))
+
+
+class _StreamBody:
+    """``response.raw`` do requests sobre o corpo em streaming do httpx."""
+
+    def __init__(self, response: 'httpx.Response'):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = bytearray()
+        self.version = response.http_version
+
+    def read(self, amt: Optional[int] = None, **kwargs: Any) -> bytes:
+        try:
+            while amt is None or len(self._buffer) < amt:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer += chunk
+        except httpx.TransportError as e:
+            self.close()
+            raise requests.ConnectionError(e) from e
+        amt = len(self._buffer) if amt is None else amt
+        data = bytes(self._buffer[:amt])
+        del self._buffer[:amt]
+        if not data:
+            self.close()
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def _timeout(timeout: Union[None, float, Tuple[float, float]]) -> 'httpx.Timeout':
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class HTTPXAdapter(BaseAdapter):
+    """
+    Adapter do ``requests`` que envia pelo ``httpx`` (HTTP/2 por padrão).
+
+    Um ``httpx.Client`` por combinação de ``verify``/``cert``, criado na
+    primeira requisição. Proxies vêm do ambiente (``HTTPS_PROXY`` etc.).
+
+    Args:
+        http2: Negocia HTTP/2 (ALPN em ``https``)
+        http1: Aceita HTTP/1.1; com ``http1=False`` o ``http`` puro usa
+            HTTP/2 direto ("prior knowledge"), ex. atrás de um proxy h2c
+        max_connections: Conexões simultâneas no pool
+        transport: Transporte ``httpx`` customizado (ex. ``httpx.MockTransport``)
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 10,
+        transport: Optional[Any] = None
+    ):
+        if httpx is None:
+            raise ImportError(
+                "HTTPXAdapter requer httpx. "
+                "Instale com: pip install boleto-cnab-client[http2]"
+            )
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 requer o pacote h2. "
+                    "Instale com: pip install boleto-cnab-client[http2]"
+                ) from None
+        super().__init__()
+        self.http2 = http2
+        self.http1 = http1
+        self.max_connections = max_connections
+        self.transport = transport
+        self._clients: Dict[Any, 'httpx.Client'] = {}
+        self._lock = threading.Lock()
+
+    def _client(self, verify: Union[bool, str], cert: Any) -> 'httpx.Client':
+        key = (verify, cert)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.Client(
+                    http1=self.http1,
+                    http2=self.http2,
+                    verify=verify,
+                    cert=cert,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections
+                    ),
+                    transport=self.transport
+                )
+            return client
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[float, float]] = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        client = self._client(verify, cert)
+        outgoing = client.build_request(
+            request.method,
+            request.url,
+            headers=[(k, v) for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP],
+            content=request.body,
+            timeout=_timeout(timeout)
+        )
+        try:
+            # Sempre em streaming: sem stream=True o Session lê o corpo em seguida
+            upstream = client.send(outgoing, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+
+        response = requests.Response()
+        response.status_code = upstream.status_code
+        response.headers = CaseInsensitiveDict(upstream.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = upstream.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _StreamBody(upstream)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def __repr__(self) -> str:
+        return f"<HTTPXAdapter(http2={self.http2}, max_connections={self.max_connections})>"
+
+
+def make_adapter(transport: Union[str, BaseAdapter], pool_maxsize: int) -> BaseAdapter:
+    """
+    Adapter da sessão a partir do parâmetro ``transport`` do ``BoletoClient``.
+
+    Args:
+        transport: ``'requests'`` (urllib3, HTTP/1.1), ``'http2'`` (httpx) ou
+            um ``requests.adapters.BaseAdapter`` já configurado
+        pool_maxsize: Conexões mantidas no pool
+    """
+    if isinstance(transport, BaseAdapter):
+        return transport
+    if transport == 'requests':
+        # Retries ficam a cargo do BoletoClient
+        return HTTPAdapter(max_retries=0, pool_maxsize=pool_maxsize)
+    if transport == 'http2':
+        return HTTPXAdapter(http2=True, max_connections=pool_maxsize)
+    raise ValueError(f"transport deve ser um de {TRANSPORTS} ou um BaseAdapter, recebido {transport!r}")
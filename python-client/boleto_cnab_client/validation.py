@@ -0,0 +1,305 @@
+"""
+Pré-validação local de lotes de boletos, antes de qualquer chamada à API.
+
+Um boleto inválido num ``/api/boleto/multi`` derruba o lote inteiro com 400.
+``validate_batch`` verifica o lote todo de uma vez — campos obrigatórios de
+``BoletoDataDict``, dígitos verificadores de CPF/CNPJ, faixa de valor e datas —
+e devolve máscaras de erro por linha, para separar as linhas ruins antes do
+envio. Com NumPy instalado (``pip install boleto-cnab-client[numpy]``), as
+verificações numéricas e de CPF/CNPJ são vetorizadas.
+
+Exemplo:
+    >>> report = validate_batch(boletos)
+    >>> validos, invalidos = report.split(boletos)
+    >>> client.generate_multiple_boletos(validos)
+    >>> for i, erros in invalidos:
+    ...     print(i, erros)
+"""
+import math
+import re
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependência opcional
+    np = None
+
+from .batch import BoletoBatch
+
+# Campos obrigatórios de BoletoDataDict
+REQUIRED_FIELDS = (
+    'agencia',
+    'conta_corrente',
+    'nosso_numero',
+    'valor',
+    'cedente',
+    'documento_cedente',
+    'sacado',
+    'sacado_documento',
+)
+DOCUMENT_FIELDS = ('documento_cedente', 'sacado_documento')
+DATE_FIELDS = ('data_vencimento', 'data_documento', 'data_processamento')
+DATE_FORMATS = ('%Y/%m/%d', '%Y-%m-%d', '%d/%m/%Y')
+
+# O campo valor do código de barras tem 10 dígitos (centavos)
+VALOR_MIN = 0.01
+VALOR_MAX = 99_999_999.99
+
+_CPF_WEIGHTS = (tuple(range(10, 1, -1)), tuple(range(11, 1, -1)))
+_CNPJ_WEIGHTS = ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+_NON_DIGITS = re.compile(r'\D')
+
+Rows = Union[Sequence[Mapping[str, Any]], BoletoBatch]
+
+
+# =============================================================================
+# CPF / CNPJ
+# =============================================================================
+
+def _only_digits(value: Any) -> str:
+    """Dígitos de ``value`` sem a máscara; vazio se houver dígitos não ASCII (ex.: ``'٣'``)."""
+    digits = _NON_DIGITS.sub('', str(value)) if value is not None else ''
+    return digits if digits.isascii() else ''
+
+
+def _check_digit(digits: Sequence[int], weights: Sequence[int]) -> int:
+    dv = 11 - sum(d * w for d, w in zip(digits, weights)) % 11
+    return 0 if dv >= 10 else dv
+
+
+def documento_valido(documento: Any) -> bool:
+    """
+    Valida CPF (11 dígitos) ou CNPJ (14 dígitos), com ou sem máscara.
+
+    Example:
+        >>> documento_valido('529.982.247-25')
+        True
+    """
+    digits = [int(c) for c in _only_digits(documento)]
+    if len(digits) == 11:
+        weights = _CPF_WEIGHTS
+    elif len(digits) == 14:
+        weights = _CNPJ_WEIGHTS
+    else:
+        return False
+    if len(set(digits)) == 1:
+        return False
+    base = len(digits) - 2
+    return (
+        digits[base] == _check_digit(digits[:base], weights[0])
+        and digits[base + 1] == _check_digit(digits[:base + 1], weights[1])
+    )
+
+
+def _documents_valid_numpy(values: Sequence[Any]) -> 'np.ndarray':
+    docs = [_only_digits(v) for v in values]
+    lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+    valid = np.zeros(len(docs), dtype=bool)
+
+    for size, weights in ((11, _CPF_WEIGHTS), (14, _CNPJ_WEIGHTS)):
+        idx = np.flatnonzero(lengths == size)
+        if not len(idx):
+            continue
+        # Matriz (linhas x dígitos) a partir dos bytes ASCII
+        matrix = (
+            np.frombuffer(''.join(docs[i] for i in idx).encode('ascii'), dtype=np.uint8)
+            .reshape(len(idx), size)
+            .astype(np.int64) - 48
+        )
+        ok = ~(matrix == matrix[:, :1]).all(axis=1)
+        base = size - 2
+        for pos, w in ((base, weights[0]), (base + 1, weights[1])):
+            dv = 11 - (matrix[:, :pos] @ np.array(w, dtype=np.int64)) % 11
+            dv[dv >= 10] = 0
+            ok &= matrix[:, pos] == dv
+        valid[idx] = ok
+    return valid
+
+
+# =============================================================================
+# Relatório
+# =============================================================================
+
+class ValidationReport:
+    """
+    Resultado da pré-validação de um lote.
+
+    Attributes:
+        masks: Por campo, máscara por linha (True = linha com erro no campo).
+            ``numpy.ndarray`` de bool com NumPy instalado; senão lista de bool.
+        invalid: Máscara combinada (True = linha inválida)
+    """
+
+    _MESSAGES = {
+        'valor': f'deve ser número entre {VALOR_MIN} e {VALOR_MAX}',
+        'documento_cedente': 'CPF/CNPJ inválido',
+        'sacado_documento': 'CPF/CNPJ inválido',
+    }
+
+    def __init__(self, size: int, masks: Dict[str, Sequence[bool]], missing: Dict[str, Sequence[bool]]):
+        self.size = size
+        self.masks = masks
+        self._missing = missing
+        if np is not None:
+            invalid = np.zeros(size, dtype=bool)
+            for mask in masks.values():
+                invalid |= mask
+            self.invalid: Sequence[bool] = invalid
+        else:
+            self.invalid = [any(col) for col in zip(*masks.values())] if masks else [False] * size
+
+    @property
+    def valid(self) -> bool:
+        """True se nenhuma linha tem erro."""
+        return not any(self.invalid)
+
+    @property
+    def invalid_indices(self) -> List[int]:
+        return [i for i, bad in enumerate(self.invalid) if bad]
+
+    @property
+    def valid_indices(self) -> List[int]:
+        return [i for i, bad in enumerate(self.invalid) if not bad]
+
+    def errors(self, index: int) -> Dict[str, str]:
+        """Erros da linha ``index`` por campo (vazio se válida)."""
+        result = {}
+        for name, mask in self.masks.items():
+            if not mask[index]:
+                continue
+            if name in self._missing and self._missing[name][index]:
+                result[name] = 'obrigatório'
+            elif name in DATE_FIELDS:
+                result[name] = 'data inválida (use AAAA/MM/DD)'
+            else:
+                result[name] = self._MESSAGES.get(name, 'inválido')
+        return result
+
+    def split(self, rows: Rows) -> Tuple[List[Any], List[Tuple[int, Dict[str, str]]]]:
+        """
+        Separa as linhas válidas das inválidas.
+
+        Returns:
+            ``(validas, [(indice, erros), ...])`` — ``validas`` é um
+            ``BoletoBatch`` se ``rows`` for um lote, senão lista de dicts
+        """
+        valid_idx = self.valid_indices
+        if isinstance(rows, BoletoBatch):
+            valid = rows.take(valid_idx)
+        else:
+            valid = [rows[i] for i in valid_idx]
+        return valid, [(i, self.errors(i)) for i in self.invalid_indices]
+
+    def __repr__(self) -> str:
+        return f"<ValidationReport(size={self.size}, invalid={len(self.invalid_indices)})>"
+
+
+# =============================================================================
+# Validação
+# =============================================================================
+
+def _column(rows: Rows, name: str) -> Sequence[Any]:
+    if isinstance(rows, BoletoBatch):
+        if name in rows.columns:
+            return rows.column(name)
+        return [None] * len(rows)
+    return [row.get(name) for row in rows]
+
+
+def _is_blank(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return isinstance(value, str) and not value.strip()
+
+
+def _valid_date(value: Any) -> bool:
+    for fmt in DATE_FORMATS:
+        try:
+            datetime.strptime(str(value), fmt)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _valor_bad(values: Sequence[Any]) -> Sequence[bool]:
+    if np is not None:
+        if isinstance(values, array):
+            # Coluna numérica do BoletoBatch: sem cópia
+            numbers = np.frombuffer(values, dtype=float)
+        else:
+            numbers = np.fromiter((_to_float(v) for v in values), dtype=float, count=len(values))
+        with np.errstate(invalid='ignore'):
+            return ~((numbers >= VALOR_MIN) & (numbers <= VALOR_MAX))
+    return [not (VALOR_MIN <= _to_float(v) <= VALOR_MAX) for v in values]
+
+
+def _as_mask(values: Sequence[bool]) -> Sequence[bool]:
+    return np.asarray(values, dtype=bool) if np is not None else list(values)
+
+
+def _mask_or(a: Sequence[bool], b: Sequence[bool]) -> Sequence[bool]:
+    if np is not None:
+        return np.asarray(a, dtype=bool) | np.asarray(b, dtype=bool)
+    return [x or y for x, y in zip(a, b)]
+
+
+def _mask_not(a: Sequence[bool]) -> Sequence[bool]:
+    if np is not None:
+        return ~np.asarray(a, dtype=bool)
+    return [not x for x in a]
+
+
+def validate_batch(rows: Rows, check_documents: bool = True) -> ValidationReport:
+    """
+    Valida um lote inteiro localmente, sem chamadas de rede.
+
+    Args:
+        rows: Lista de dicts (``BoletoDataDict``) ou ``BoletoBatch``
+        check_documents: Verifica dígitos de CPF/CNPJ em
+            ``documento_cedente``/``sacado_documento``
+
+    Returns:
+        :class:`ValidationReport` com máscaras de erro por campo e por linha
+    """
+    size = len(rows)
+    masks: Dict[str, Sequence[bool]] = {}
+    missing: Dict[str, Sequence[bool]] = {}
+
+    for name in REQUIRED_FIELDS:
+        column = _column(rows, name)
+        blank = _as_mask([_is_blank(v) for v in column])
+        bad = blank
+
+        if name == 'valor':
+            bad = _mask_or(blank, _valor_bad(column))
+        elif name in DOCUMENT_FIELDS and check_documents:
+            if np is not None:
+                doc_ok = _documents_valid_numpy(column)
+            else:
+                doc_ok = [documento_valido(v) for v in column]
+            bad = _mask_or(blank, _mask_not(doc_ok))
+
+        masks[name] = bad
+        missing[name] = blank
+
+    for name in DATE_FIELDS:
+        column = _column(rows, name)
+        bad = [not _is_blank(v) and not _valid_date(v) for v in column]
+        if any(bad):
+            masks[name] = _as_mask(bad)
+
+    return ValidationReport(size, masks, missing)
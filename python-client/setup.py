@@ -42,12 +42,37 @@ setup(
         'Tracker': 'https://github.com/Maxwbh/boleto_cnab_api/issues',
     },
     packages=find_packages(),
+    entry_points={
+        'console_scripts': [
+            'boleto-cnab=boleto_cnab_client.cli:main',
+        ],
+    },
     python_requires='>=3.7',
     install_requires=[
         'requests>=2.25.0',
     ],
     extras_require={
+        'async': [
+            'httpx>=0.24.0',
+        ],
+        'http2': [
+            'httpx[http2]>=0.24.0',
+        ],
+        'pdf': [
+            'pypdf>=3.0.0',
+        ],
+        'numpy': [
+            'numpy>=1.20.0',
+        ],
+        'arrow': [
+            'pyarrow>=8.0.0',
+        ],
+        'pandas': [
+            'pandas>=1.3.0',
+        ],
         'dev': [
+            'httpx>=0.24.0',
+            'pypdf>=3.0.0',
             'pytest>=6.0.0',
             'pytest-cov>=2.10.0',
             'black>=21.0',
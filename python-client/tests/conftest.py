@@ -2,7 +2,15 @@
 Fixtures compartilhadas para testes
 """
 import pytest
-from boleto_cnab_client import BoletoClient
+from boleto_cnab_client import BoletoClient, CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def _isolated_circuit_breakers():
+    """Disjuntores compartilhados por URL não vazam estado entre testes"""
+    CircuitBreaker._registry.clear()
+    yield
+    CircuitBreaker._registry.clear()
 
 
 @pytest.fixture
@@ -0,0 +1,304 @@
+"""
+Testes para AsyncBoletoClient
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from boleto_cnab_client import AsyncBoletoClient, CircuitBreaker, HTTPCache
+from boleto_cnab_client.exceptions import (
+    BoletoAPIError,
+    BoletoCircuitOpenError,
+    BoletoValidationError,
+    BoletoConnectionError,
+    BoletoTimeoutError
+)
+
+
+def make_client(base_url, handler, **kwargs):
+    """Cliente assíncrono com transporte mockado (sem rede)"""
+    kwargs.setdefault('retries', 1)
+    kwargs.setdefault('backoff_factor', 0)
+    return AsyncBoletoClient(base_url, transport=httpx.MockTransport(handler), **kwargs)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncClientInit:
+    """Testes de inicialização do cliente assíncrono"""
+
+    def test_init_default_values(self, base_url):
+        """Testa valores padrão"""
+        client = AsyncBoletoClient(base_url + "/")
+        assert client.base_url == base_url
+        assert client.timeout == 30
+        assert client.max_concurrency == 100
+        run(client.aclose())
+
+    def test_repr(self, base_url):
+        """Testa representação string"""
+        client = AsyncBoletoClient(base_url)
+        assert "AsyncBoletoClient" in repr(client)
+        run(client.aclose())
+
+
+class TestAsyncRequests:
+    """Testes das chamadas assíncronas"""
+
+    def test_health_check(self, base_url):
+        """Testa health check"""
+        def handler(request):
+            assert request.url.path == "/api/health"
+            return httpx.Response(200, json={"status": "OK"})
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                return await client.health_check()
+
+        assert run(scenario())["status"] == "OK"
+
+    def test_generate_boleto_with_data_params(self, base_url, valid_boleto_data):
+        """Testa envio de include_data e data serializado"""
+        def handler(request):
+            assert request.url.params["include_data"] == "true"
+            assert json.loads(request.url.params["data"]) == valid_boleto_data
+            return httpx.Response(200, json={"nosso_numero": "123", "content_base64": ""})
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                return await client.generate_boleto_with_data("banco_brasil", valid_boleto_data)
+
+        assert run(scenario())["nosso_numero"] == "123"
+
+    def test_multi_uploads_json(self, base_url, valid_boleto_data):
+        """Testa upload multipart do /multi"""
+        def handler(request):
+            assert request.url.path == "/api/boleto/multi"
+            body = request.read()
+            assert b'name="type"' in body
+            assert b'[{"agencia":"3073"' in body
+            return httpx.Response(200, content=b"%PDF-1.4")
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                return await client.generate_multiple_boletos([valid_boleto_data])
+
+        assert run(scenario()) == b"%PDF-1.4"
+
+    def test_multi_gzip_upload(self, base_url, valid_boleto_data):
+        """Testa upload do /multi comprimido acima do limite"""
+        import gzip
+
+        def handler(request):
+            assert request.headers["Content-Encoding"] == "gzip"
+            assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+            assert b'[{"agencia":"3073"' in gzip.decompress(request.read())
+            return httpx.Response(200, content=b"%PDF-1.4")
+
+        async def scenario():
+            async with make_client(base_url, handler, compress_threshold=1024) as client:
+                return await client.generate_multiple_boletos([valid_boleto_data] * 50)
+
+        assert run(scenario()) == b"%PDF-1.4"
+
+    def test_concurrency_limit(self, base_url):
+        """Testa que o semáforo limita requisições em voo"""
+        state = {"current": 0, "peak": 0}
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+                await asyncio.sleep(0.01)
+                state["current"] -= 1
+                return httpx.Response(200, json={"status": "OK"})
+
+        async def scenario():
+            client = AsyncBoletoClient(base_url, transport=SlowTransport(), max_concurrency=3)
+            async with client:
+                await asyncio.gather(*[client.health_check() for _ in range(12)])
+
+        run(scenario())
+        assert state["peak"] == 3
+
+    def test_backoff_libera_o_semaforo(self, base_url):
+        """Testa que quem espera Retry-After não segura a vaga dos outros"""
+        order = []
+
+        def handler(request):
+            if request.url.path == "/api/health" and "throttled" not in order:
+                order.append("throttled")
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            order.append(request.url.path)
+            return httpx.Response(200, json={"status": "OK"})
+
+        async def scenario():
+            async with make_client(base_url, handler, retries=2, max_concurrency=1) as client:
+                first = asyncio.create_task(client.health_check())
+                await asyncio.sleep(0.05)
+                await asyncio.wait_for(client.info(), timeout=0.5)
+                order.append("outro terminou")
+                await first
+
+        run(scenario())
+        assert order.index("outro terminou") < order.index("/api/health")
+
+
+class TestAsyncErrorHandling:
+    """Testes do mapeamento de erros (mesmo do BoletoClient)"""
+
+    def test_validation_error_400(self, base_url, invalid_boleto_data):
+        """Testa erro 400 de validação"""
+        def handler(request):
+            return httpx.Response(400, json={"error": "Dados inválidos"})
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                await client.validate("banco_brasil", invalid_boleto_data)
+
+        with pytest.raises(BoletoValidationError) as exc_info:
+            run(scenario())
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.message == "Dados inválidos"
+
+    def test_retries_then_server_error(self, base_url):
+        """Testa retry em 503 e erro após esgotar tentativas"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="Service Unavailable")
+
+        async def scenario():
+            async with make_client(base_url, handler, retries=2) as client:
+                await client.health_check()
+
+        with pytest.raises(BoletoAPIError) as exc_info:
+            run(scenario())
+        assert exc_info.value.status_code == 500
+        assert len(calls) == 3
+
+    def test_retry_recovers(self, base_url):
+        """Testa sucesso após falha transitória"""
+        responses_iter = iter([
+            httpx.Response(502),
+            httpx.Response(200, json={"status": "OK"}),
+        ])
+
+        async def scenario():
+            async with make_client(base_url, lambda r: next(responses_iter)) as client:
+                return await client.health_check()
+
+        assert run(scenario())["status"] == "OK"
+
+    def test_not_found_404(self, base_url):
+        """Testa erro 404 genérico"""
+        async def scenario():
+            async with make_client(base_url, lambda r: httpx.Response(404, text="nope")) as client:
+                await client.info()
+
+        with pytest.raises(BoletoAPIError) as exc_info:
+            run(scenario())
+        assert exc_info.value.status_code == 404
+
+    def test_connection_error(self, base_url):
+        """Testa erro de conexão"""
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                await client.health_check()
+
+        with pytest.raises(BoletoConnectionError):
+            run(scenario())
+
+    def test_timeout_error(self, base_url):
+        """Testa timeout"""
+        def handler(request):
+            raise httpx.ReadTimeout("timed out")
+
+        async def scenario():
+            async with make_client(base_url, handler) as client:
+                await client.health_check()
+
+        with pytest.raises(BoletoTimeoutError):
+            run(scenario())
+
+    def test_circuit_open_fails_fast(self, base_url):
+        """Testa falha rápida com o circuito aberto"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        async def scenario():
+            breaker = CircuitBreaker(failure_threshold=1)
+            async with make_client(base_url, handler, retries=0, circuit_breaker=breaker) as client:
+                with pytest.raises(BoletoAPIError):
+                    await client.health_check()
+                await client.health_check()
+
+        with pytest.raises(BoletoCircuitOpenError):
+            run(scenario())
+        assert len(calls) == 1
+
+    def test_local_error_releases_half_open_probe(self, base_url):
+        """Testa que erro local numa sondagem não deixa o disjuntor preso em half-open"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.DecodingError("corpo inválido")
+            return httpx.Response(200, json={"status": "OK"})
+
+        async def scenario():
+            breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+            breaker.record_failure()
+            async with make_client(base_url, handler, retries=0, circuit_breaker=breaker) as client:
+                with pytest.raises(httpx.DecodingError):
+                    await client.health_check()
+                assert breaker.state == "half_open"
+                assert await client.health_check() == {"status": "OK"}
+            return breaker.state
+
+        assert run(scenario()) == "closed"
+
+    def test_large_payload_uses_post_body(self, base_url, valid_boleto_data):
+        """Testa POST com corpo JSON acima de post_threshold"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"valid": True})
+
+        async def scenario():
+            async with make_client(base_url, handler, post_threshold=10) as client:
+                return await client.validate("banco_brasil", valid_boleto_data)
+
+        assert run(scenario()) == {"valid": True}
+        assert seen[0].method == "POST"
+        assert json.loads(seen[0].content)["data"] == valid_boleto_data
+
+    def test_info_revalidated_with_etag(self, base_url):
+        """Testa cache condicional de info com 304"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"name": "API"}, headers={"ETag": '"v1"', "Cache-Control": "max-age=0"})
+
+        async def scenario():
+            async with make_client(base_url, handler, http_cache=HTTPCache()) as client:
+                return [await client.info(), await client.info()]
+
+        assert run(scenario()) == [{"name": "API"}] * 2
+        assert len(seen) == 2
@@ -0,0 +1,137 @@
+"""
+Testes para o balanceamento entre réplicas do engine
+"""
+import pytest
+import requests
+import responses
+
+from boleto_cnab_client import BoletoClient, CircuitBreaker, LoadBalancer
+from boleto_cnab_client.exceptions import BoletoCircuitOpenError
+
+URLS = ["http://engine-1:9292", "http://engine-2:9292"]
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("boleto_cnab_client.client.time.sleep", lambda s: None)
+
+
+class TestLoadBalancer:
+    """Testes para a seleção de réplicas"""
+
+    def test_least_outstanding(self):
+        """Testa que a réplica ocupada fica para depois"""
+        balancer = LoadBalancer(URLS)
+        busy = balancer.acquire()
+        other = balancer.acquire()
+        assert other is not busy
+        balancer.release(other, 0.01, ok=True)
+        assert balancer.acquire() is other
+
+    def test_round_robin_when_idle(self):
+        """Testa alternância entre réplicas sem carga"""
+        balancer = LoadBalancer(URLS)
+        picked = []
+        for _ in range(4):
+            endpoint = balancer.acquire()
+            picked.append(endpoint.url)
+            balancer.release(endpoint, 0.01, ok=True)
+        assert set(picked) == set(URLS)
+
+    def test_ewma_prefers_faster_replica(self):
+        """Testa preferência pela menor latência EWMA"""
+        balancer = LoadBalancer(URLS, strategy="ewma")
+        slow, fast = balancer.endpoints
+        slow.ewma, fast.ewma = 0.5, 0.05
+        for _ in range(3):
+            endpoint = balancer.acquire()
+            assert endpoint is fast
+            balancer.release(endpoint, 0.05, ok=True)
+
+    def test_error_rate_ejects(self):
+        """Testa ejeção por taxa de erro e uso como último recurso"""
+        balancer = LoadBalancer(URLS, min_samples=3)
+        bad, good = balancer.endpoints
+        for _ in range(3):
+            bad.outstanding += 1
+            balancer.release(bad, None, ok=False)
+        assert balancer.stats()[0]["ejected"]
+        assert balancer.acquire() is good
+        assert balancer.acquire() is good
+
+        balancer.mark_health(good, False)
+        # Com todas ejetadas, ainda há a quem recorrer
+        assert balancer.acquire() is not None
+
+    def test_all_breakers_open(self):
+        """Testa None quando todos os disjuntores estão abertos"""
+        balancer = LoadBalancer(URLS, breaker_factory=lambda url: CircuitBreaker(failure_threshold=1))
+        for endpoint in balancer.endpoints:
+            endpoint.breaker.record_failure()
+        assert balancer.acquire() is None
+
+    def test_invalid_strategy(self):
+        with pytest.raises(ValueError):
+            LoadBalancer(URLS, strategy="aleatorio")
+
+
+class TestClientBalancing:
+    """Testes do BoletoClient com várias réplicas"""
+
+    @responses.activate
+    def test_spreads_requests(self):
+        """Testa que as chamadas se distribuem entre as réplicas"""
+        for url in URLS:
+            responses.add(responses.GET, f"{url}/api/health", json={"status": "OK"})
+        client = BoletoClient(URLS, retries=0)
+
+        for _ in range(4):
+            client.health_check()
+
+        hosts = {call.request.url.split("/api")[0] for call in responses.calls}
+        assert hosts == set(URLS)
+
+    @responses.activate
+    def test_fails_over_to_other_replica(self, no_sleep):
+        """Testa que o retry vai para outra réplica"""
+        responses.add(responses.GET, f"{URLS[0]}/api/health", body=requests.ConnectionError("fora"))
+        responses.add(responses.GET, f"{URLS[1]}/api/health", json={"status": "OK"})
+        balancer = LoadBalancer(URLS)
+        balancer.endpoints[1].outstanding = 1  # força a 1ª réplica na primeira tentativa
+        client = BoletoClient(URLS, retries=1, balancer=balancer)
+
+        assert client.health_check() == {"status": "OK"}
+        assert [c.request.url for c in responses.calls] == [
+            f"{URLS[0]}/api/health", f"{URLS[1]}/api/health"
+        ]
+
+    @responses.activate
+    def test_check_health_ejects(self):
+        """Testa ejeção pelo /api/health"""
+        responses.add(responses.GET, f"{URLS[0]}/api/health", status=503)
+        responses.add(responses.GET, f"{URLS[1]}/api/health", json={"status": "OK"})
+        client = BoletoClient(URLS, retries=0)
+
+        assert client.check_health() == {URLS[0]: False, URLS[1]: True}
+        assert [s["ejected"] for s in client.balancer.stats()] == [True, False]
+
+    @responses.activate
+    def test_all_replicas_open(self):
+        """Testa falha rápida com todas as réplicas em circuito aberto"""
+        balancer = LoadBalancer(URLS, breaker_factory=lambda url: CircuitBreaker(failure_threshold=1))
+        for endpoint in balancer.endpoints:
+            endpoint.breaker.record_failure()
+        client = BoletoClient(URLS, balancer=balancer)
+
+        with pytest.raises(BoletoCircuitOpenError):
+            client.health_check()
+        assert len(responses.calls) == 0
+
+    def test_circuit_breaker_requires_single_url(self):
+        with pytest.raises(ValueError):
+            BoletoClient(URLS, circuit_breaker=CircuitBreaker())
+
+    def test_close_stops_health_thread(self):
+        client = BoletoClient(URLS, health_check_interval=60)
+        client.close()
+        assert not client._health_thread.is_alive()
@@ -0,0 +1,85 @@
+"""
+Testes para BoletoBatch (lote colunar)
+"""
+import json
+from array import array
+
+import responses
+
+from boleto_cnab_client import BoletoBatch
+
+
+class TestBoletoBatch:
+    """Testes para BoletoBatch"""
+
+    def test_columns_and_rows(self, valid_boleto_data):
+        """Testa armazenamento em colunas e leitura por linha"""
+        batch = BoletoBatch([valid_boleto_data, dict(valid_boleto_data, valor=99.9)])
+
+        assert len(batch) == 2
+        assert isinstance(batch.column("valor"), array)
+        assert list(batch.column("valor")) == [150.0, 99.9]
+        assert batch[1]["valor"] == 99.9
+        assert batch[-1]["nosso_numero"] == valid_boleto_data["nosso_numero"]
+
+    def test_json_matches_dicts(self, valid_boleto_data):
+        """Testa que a serialização colunar equivale a json.dumps das linhas"""
+        rows = [
+            valid_boleto_data,
+            dict(valid_boleto_data, sacado="João Ação", instrucao1="Não receber"),
+            {"nosso_numero": "9", "valor": 1, "parcela_atual": 2},
+        ]
+        batch = BoletoBatch(rows, bank="sicoob")
+
+        decoded = json.loads(batch.to_json_bytes())
+
+        assert decoded == [dict(row, bank="sicoob", valor=float(row["valor"])) for row in rows]
+        assert decoded == list(batch)
+
+    def test_bank_column_falls_back_to_default(self):
+        """Testa coluna bank parcial: linhas sem valor usam o bank do lote"""
+        batch = BoletoBatch([{"bank": "itau", "valor": 1}, {"valor": 2}], bank="sicoob")
+
+        decoded = json.loads(batch.to_json_bytes())
+
+        assert decoded == [{"bank": "itau", "valor": 1.0}, {"bank": "sicoob", "valor": 2.0}]
+        assert decoded == list(batch)
+
+    def test_slice_returns_batch(self, valid_boleto_data):
+        """Testa fatias (usadas na divisão em lotes do /multi)"""
+        batch = BoletoBatch(
+            [dict(valid_boleto_data, nosso_numero=str(i)) for i in range(5)], bank="sicoob"
+        )
+
+        part = batch[1:3]
+
+        assert isinstance(part, BoletoBatch)
+        assert len(part) == 2
+        assert [row["nosso_numero"] for row in part] == ["1", "2"]
+
+    def test_from_columns(self):
+        """Testa construção direto de colunas, sem linhas intermediárias"""
+        batch = BoletoBatch.from_columns(
+            {"nosso_numero": ["1", "2"], "valor": [10, None], "sacado": ["Ana", None]}, bank="itau"
+        )
+
+        assert isinstance(batch.column("valor"), array)
+        assert batch.column("cedente") == [None, None]
+        assert list(batch) == [
+            {"bank": "itau", "nosso_numero": "1", "valor": 10.0, "sacado": "Ana"},
+            {"bank": "itau", "nosso_numero": "2"},
+        ]
+
+    @responses.activate
+    def test_multi_upload(self, client, base_url, valid_boleto_data):
+        """Testa envio de um lote colunar ao /multi"""
+        responses.add(
+            responses.POST, f"{base_url}/api/boleto/multi",
+            body=b"%PDF-1.4", status=200
+        )
+        batch = BoletoBatch([valid_boleto_data] * 3, bank="banco_brasil")
+
+        client.generate_multiple_boletos(batch)
+
+        body = responses.calls[0].request.body
+        assert batch.to_json_bytes() in body
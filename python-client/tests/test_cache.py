@@ -0,0 +1,207 @@
+"""
+Testes para o cache de resultados determinísticos
+"""
+import pytest
+import responses
+
+from boleto_cnab_client import BoletoClient, MemoryCache, DiskCache, HTTPCache
+from boleto_cnab_client.cache import cache_key
+from boleto_cnab_client.exceptions import BoletoValidationError
+
+
+class TestCacheKey:
+    """Testes para a chave canônica"""
+
+    def test_key_ignores_dict_order(self):
+        """Testa que a ordem das chaves não muda o hash"""
+        a = cache_key("/api/boleto/data", "sicoob", {"a": 1, "b": 2})
+        b = cache_key("/api/boleto/data", "sicoob", {"b": 2, "a": 1})
+        assert a == b
+
+    def test_key_depends_on_endpoint_and_bank(self):
+        """Testa que endpoint e banco fazem parte da chave"""
+        data = {"a": 1}
+        assert cache_key("/api/boleto/data", "sicoob", data) != cache_key("/api/boleto/validate", "sicoob", data)
+        assert cache_key("/api/boleto/data", "sicoob", data) != cache_key("/api/boleto/data", "itau", data)
+
+
+class TestMemoryCache:
+    """Testes para MemoryCache"""
+
+    def test_lru_eviction(self):
+        """Testa descarte da entrada menos usada"""
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiration(self, monkeypatch):
+        """Testa expiração por TTL"""
+        import boleto_cnab_client.cache as cache_module
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+        cache = MemoryCache(ttl=10)
+        cache.set("a", 1)
+        now[0] += 11
+
+        assert cache.get("a") is None
+
+    def test_stats(self):
+        """Testa contadores de hit/miss"""
+        cache = MemoryCache()
+        cache.get("x")
+        cache.set("x", {"ok": True})
+        cache.get("x")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+class TestDiskCache:
+    """Testes para DiskCache"""
+
+    def test_roundtrip_and_clear(self, tmp_path):
+        """Testa gravação, leitura e limpeza"""
+        cache = DiskCache(str(tmp_path / "cache"))
+        cache.set("k", {"valid": True})
+
+        assert DiskCache(str(tmp_path / "cache")).get("k") == {"valid": True}
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_expired_entry(self, tmp_path):
+        """Testa que entrada expirada é ignorada"""
+        cache = DiskCache(str(tmp_path), ttl=-1)
+        cache.set("k", 1)
+        assert cache.get("k") is None
+
+
+class TestClientCache:
+    """Testes do cache integrado ao BoletoClient"""
+
+    @responses.activate
+    def test_get_boleto_data_cached(self, base_url, valid_boleto_data):
+        """Testa que a segunda consulta não vai à rede"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto/data",
+            json={
+                "bank": "banco_brasil",
+                "nosso_numero": "12345678-9",
+                "codigo_barras": "0019",
+                "valor": 150.00,
+                "cedente": "Empresa",
+                "sacado": "Cliente"
+            },
+            status=200
+        )
+        client = BoletoClient(base_url, cache=MemoryCache())
+
+        first = client.get_boleto_data("banco_brasil", valid_boleto_data)
+        second = client.get_boleto_data("banco_brasil", dict(reversed(list(valid_boleto_data.items()))))
+
+        assert first == second
+        assert len(responses.calls) == 1
+        assert client.cache.stats()["hits"] == 1
+
+    @responses.activate
+    def test_cached_result_is_isolated(self, base_url, valid_boleto_data):
+        """Testa que alterar o retorno não corrompe o cache"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto/validate",
+            json={"valid": True},
+            status=200
+        )
+        client = BoletoClient(base_url, cache=MemoryCache())
+
+        client.validate("banco_brasil", valid_boleto_data)["valid"] = False
+
+        assert client.validate("banco_brasil", valid_boleto_data) == {"valid": True}
+
+    @responses.activate
+    def test_errors_not_cached(self, base_url, invalid_boleto_data):
+        """Testa que erros sempre vão à rede"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto/nosso_numero",
+            json={"error": "Dados inválidos"},
+            status=400
+        )
+        client = BoletoClient(base_url, cache=MemoryCache())
+
+        for _ in range(2):
+            with pytest.raises(BoletoValidationError):
+                client.get_nosso_numero("banco_brasil", invalid_boleto_data)
+
+        assert len(responses.calls) == 2
+        assert len(client.cache) == 0
+
+
+class TestHTTPCache:
+    """Testes do cache condicional de info/bancos/metadata"""
+
+    INFO = {"name": "Boleto CNAB API", "supported_banks": ["sicoob"]}
+
+    @responses.activate
+    def test_served_within_max_age(self, base_url):
+        """Testa que dentro do max-age não há ida à rede"""
+        responses.add(
+            responses.GET, f"{base_url}/api/info", json=self.INFO,
+            headers={"ETag": '"v1"', "Cache-Control": "public, max-age=300"}
+        )
+        client = BoletoClient(base_url, http_cache=HTTPCache())
+
+        assert client.info() == self.INFO
+        client.info()["name"] = "alterado"
+        assert client.info() == self.INFO
+        assert len(responses.calls) == 1
+        assert client.http_cache.stats() == {"hits": 2, "revalidated": 0, "misses": 1, "size": 1}
+
+    @responses.activate
+    def test_revalidates_with_etag(self, base_url):
+        """Testa If-None-Match após o max-age e reuso da cópia no 304"""
+        responses.add(
+            responses.GET, f"{base_url}/api/bancos", json=[{"codigo": "756"}],
+            headers={"ETag": '"v1"', "Cache-Control": "max-age=0"}
+        )
+        responses.add(responses.GET, f"{base_url}/api/bancos", status=304)
+        client = BoletoClient(base_url, http_cache=HTTPCache())
+
+        assert client.bancos() == [{"codigo": "756"}]
+        assert client.bancos() == [{"codigo": "756"}]
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert client.http_cache.stats()["revalidated"] == 1
+
+    @responses.activate
+    def test_shared_between_clients(self, base_url):
+        """Testa que clientes com o mesmo cache compartilham a cópia"""
+        responses.add(
+            responses.GET, f"{base_url}/api/metadata", json={"api": {}},
+            headers={"ETag": '"v1"', "Cache-Control": "max-age=60"}
+        )
+        cache = HTTPCache()
+
+        BoletoClient(base_url, http_cache=cache).metadata()
+        BoletoClient(base_url, http_cache=cache).metadata()
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_no_store_and_disabled(self, base_url):
+        """Testa que no-store e http_cache=None sempre vão à rede"""
+        responses.add(
+            responses.GET, f"{base_url}/api/info", json=self.INFO,
+            headers={"ETag": '"v1"', "Cache-Control": "no-store"}
+        )
+        for client in (BoletoClient(base_url, http_cache=HTTPCache()), BoletoClient(base_url, http_cache=None)):
+            client.info()
+            client.info()
+
+        assert len(responses.calls) == 4
+        assert "If-None-Match" not in responses.calls[1].request.headers
@@ -0,0 +1,175 @@
+"""
+Testes para a linha de comando boleto-cnab
+"""
+import json
+import zipfile
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from boleto_cnab_client.cli import main, map_row, output_name, parse_valor, read_rows
+
+URL = "http://localhost:9292"
+
+
+def _pdf_callback(fail_banks=()):
+    """Responde um PDF com o nosso_numero no corpo (400 para os bancos em fail_banks)"""
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        if query["bank"][0] in fail_banks:
+            return 400, {}, '{"error": "dados inválidos"}'
+        data = json.loads(query["data"][0])
+        return 200, {"Content-Type": "application/pdf"}, f"%PDF {data['nosso_numero']}".encode()
+    return callback
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "boletos.csv"
+    path.write_text(
+        "bank;numero;valor;sacado\n"
+        "sicoob;1;1.234,56;Ana\n"
+        "itau;2;10,00;Bruno\n"
+        "sicoob;3;99.90;Carla\n",
+        encoding="utf-8"
+    )
+    return path
+
+
+class TestMapping:
+    """Testes da conversão de linhas em BoletoDataDict"""
+
+    def test_parse_valor(self):
+        assert parse_valor("1.234,56") == 1234.56
+        assert parse_valor("R$ 150,00") == 150.0
+        assert parse_valor("99.90") == 99.9
+
+    def test_map_row_renames_and_drops_blank(self):
+        bank, data = map_row({"cpf": "123", "valor": "10,5", "obs": ""}, {"cpf": "sacado_documento"}, "itau")
+        assert bank == "itau"
+        assert data == {"sacado_documento": "123", "valor": 10.5}
+
+    def test_map_row_nested_jsonl(self):
+        assert map_row({"bank": "caixa", "data": {"valor": 1}}) == ("caixa", {"valor": 1.0})
+
+    def test_map_row_without_bank(self):
+        with pytest.raises(ValueError):
+            map_row({"valor": "1"})
+
+    def test_read_rows_detects_delimiter(self, csv_file):
+        with open(csv_file, encoding="utf-8") as f:
+            rows = list(read_rows(f, "csv"))
+        assert rows[0] == {"bank": "sicoob", "numero": "1", "valor": "1.234,56", "sacado": "Ana"}
+
+    def test_output_name_is_sanitized(self):
+        assert output_name("{bank}/{nosso_numero}", 7, "itau", {"nosso_numero": "12 3"}, "pdf") == "itau_12_3.pdf"
+
+
+class TestMain:
+    """Testes de ponta a ponta com o engine mockado"""
+
+    @responses.activate
+    def test_csv_to_directory(self, csv_file, tmp_path):
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback())
+        out = tmp_path / "pdfs"
+
+        code = main([str(csv_file), "--out", str(out), "--map", "numero=nosso_numero", "--quiet"])
+
+        assert code == 0
+        assert (out / "000001.pdf").read_bytes() == b"%PDF 1"
+        assert sorted(p.name for p in out.glob("*.pdf")) == ["000001.pdf", "000002.pdf", "000003.pdf"]
+        sent = [json.loads(parse_qs(urlparse(c.request.url).query)["data"][0]) for c in responses.calls]
+        assert {d["valor"] for d in sent} == {1234.56, 10.0, 99.9}
+
+    @responses.activate
+    def test_jsonl_to_zip(self, tmp_path):
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback())
+        source = tmp_path / "boletos.jsonl"
+        source.write_text(
+            '{"bank": "sicoob", "data": {"nosso_numero": "10"}}\n\n'
+            '{"nosso_numero": "11"}\n',
+            encoding="utf-8"
+        )
+        target = tmp_path / "boletos.zip"
+
+        code = main([str(source), "--zip", str(target), "--bank", "itau", "--name", "{bank}-{nosso_numero}", "--quiet"])
+
+        assert code == 0
+        with zipfile.ZipFile(target) as zf:
+            assert sorted(zf.namelist()) == ["itau-11.pdf", "sicoob-10.pdf"]
+            assert zf.read("sicoob-10.pdf") == b"%PDF 10"
+
+    @responses.activate
+    def test_failures_then_resume(self, csv_file, tmp_path):
+        """Testa que a retomada refaz só as linhas que falharam"""
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback(fail_banks=("itau",)))
+        out = tmp_path / "pdfs"
+        args = [str(csv_file), "--out", str(out), "--map", "numero=nosso_numero", "--retries", "0", "--quiet"]
+
+        assert main(args) == 1
+        checkpoint = [json.loads(line) for line in (out / ".boleto-cnab-checkpoint.jsonl").read_text().splitlines()]
+        assert [e["row"] for e in checkpoint if "error" in e] == [2]
+
+        responses.replace(responses.GET, f"{URL}/api/boleto", body=b"%PDF 2")
+        responses.calls.reset()
+        assert main(args + ["--resume"]) == 0
+
+        assert len(responses.calls) == 1
+        assert (out / "000002.pdf").read_bytes() == b"%PDF 2"
+
+    @responses.activate
+    def test_resume_redoes_missing_file(self, csv_file, tmp_path):
+        """Testa que linha no checkpoint sem arquivo na saída é gerada de novo"""
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback())
+        out = tmp_path / "pdfs"
+        args = [str(csv_file), "--out", str(out), "--map", "numero=nosso_numero", "--quiet"]
+        main(args)
+        (out / "000003.pdf").unlink()
+        responses.calls.reset()
+
+        assert main(args + ["--resume"]) == 0
+        assert len(responses.calls) == 1
+        assert (out / "000003.pdf").exists()
+
+    @responses.activate
+    def test_resume_zip_does_not_duplicate_entries(self, csv_file, tmp_path):
+        """Testa retomada com entrada no ZIP que o checkpoint não chegou a registrar"""
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback())
+        target = tmp_path / "boletos.zip"
+        args = [str(csv_file), "--zip", str(target), "--map", "numero=nosso_numero", "--quiet"]
+        main(args)
+        checkpoint = tmp_path / "boletos.zip.checkpoint.jsonl"
+        checkpoint.write_text("".join(checkpoint.read_text().splitlines(keepends=True)[:-1]))
+
+        assert main(args + ["--resume"]) == 0
+        with zipfile.ZipFile(target) as zf:
+            assert sorted(zf.namelist()) == ["000001.pdf", "000002.pdf", "000003.pdf"]
+
+    @pytest.mark.parametrize("output", ["--out", "--zip"])
+    @responses.activate
+    def test_name_collision_fails_the_row(self, csv_file, tmp_path, output):
+        """Testa que duas linhas com o mesmo --name não se sobrescrevem"""
+        responses.add_callback(responses.GET, f"{URL}/api/boleto", callback=_pdf_callback())
+        target = tmp_path / ("pdfs" if output == "--out" else "boletos.zip")
+        checkpoint = tmp_path / "checkpoint.jsonl"
+
+        code = main([
+            str(csv_file), output, str(target), "--map", "numero=nosso_numero",
+            "--name", "{bank}", "--checkpoint", str(checkpoint), "--quiet"
+        ])
+
+        assert code == 1
+        entries = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+        errors = [e for e in entries if "error" in e]
+        assert len(errors) == 1 and "já usado pela linha" in errors[0]["error"]
+        assert sorted(e["file"] for e in entries if "file" in e) == ["itau.pdf", "sicoob.pdf"]
+        if output == "--out":
+            assert sorted(p.name for p in target.iterdir()) == ["itau.pdf", "sicoob.pdf"]
+        else:
+            with zipfile.ZipFile(target) as zf:
+                assert sorted(zf.namelist()) == ["itau.pdf", "sicoob.pdf"]
+
+    def test_requires_output(self, csv_file):
+        with pytest.raises(SystemExit):
+            main([str(csv_file)])
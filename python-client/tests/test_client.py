@@ -234,3 +234,503 @@ class TestErrorHandling:
             client.validate("banco_brasil", invalid_boleto_data)
 
         assert exc_info.value.status_code == 400
+
+
+class TestIterGenerate:
+    """Testes para geração em lote com iter_generate"""
+
+    @responses.activate
+    def test_iter_generate_yields_all(self, client, base_url, valid_boleto_data):
+        """Testa que todos os índices são entregues com resultado"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto",
+            json={"nosso_numero": "123", "content_base64": ""},
+            status=200
+        )
+
+        payloads = [dict(valid_boleto_data, nosso_numero=str(i)) for i in range(20)]
+        results = dict(client.iter_generate("banco_brasil", payloads, max_in_flight=4))
+
+        assert sorted(results) == list(range(20))
+        assert all(r["nosso_numero"] == "123" for r in results.values())
+
+    @responses.activate
+    def test_iter_generate_yields_exceptions(self, client, base_url, valid_boleto_data):
+        """Testa que erros por item são entregues sem interromper o lote"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto",
+            json={"error": "Dados inválidos"},
+            status=400
+        )
+
+        results = list(client.iter_generate("banco_brasil", [valid_boleto_data] * 3))
+
+        assert len(results) == 3
+        assert all(isinstance(r, BoletoValidationError) for _, r in results)
+
+    @responses.activate
+    def test_iter_generate_pulls_lazily(self, client, base_url, valid_boleto_data):
+        """Testa que a entrada é consumida sob demanda"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto",
+            body=b"%PDF-1.4",
+            status=200
+        )
+        pulled = []
+
+        def payloads():
+            for i in range(1000):
+                pulled.append(i)
+                yield valid_boleto_data
+
+        it = client.iter_generate(
+            "banco_brasil", payloads(), max_in_flight=2, include_data=False
+        )
+        index, result = next(it)
+        it.close()
+
+        assert result == b"%PDF-1.4"
+        assert len(pulled) <= 3
+
+    def test_iter_generate_default_pool_size(self, base_url):
+        """Testa que max_in_flight padrão segue o pool da sessão"""
+        client = BoletoClient(base_url, pool_maxsize=32)
+        assert client.pool_maxsize == 32
+        assert client.session.get_adapter(base_url)._pool_maxsize == 32
+
+
+class TestMultipartUpload:
+    """Testes para uploads multipart sem arquivo temporário"""
+
+    @responses.activate
+    def test_multi_uploads_from_memory(self, client, base_url, valid_boleto_data, monkeypatch):
+        """Testa que /multi envia o JSON sem tocar no disco"""
+        import tempfile
+
+        def no_tempfile(*args, **kwargs):
+            raise AssertionError("não deveria criar arquivo temporário")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_tempfile)
+        responses.add(
+            responses.POST,
+            f"{base_url}/api/boleto/multi",
+            body=b"%PDF-1.4",
+            status=200
+        )
+
+        result = client.generate_multiple_boletos([valid_boleto_data] * 2)
+
+        body = responses.calls[0].request.body
+        assert result == b"%PDF-1.4"
+        assert b'filename="boletos.json"' in body
+        assert b'Content-Type: application/json' in body
+        assert b'[{"agencia":"3073"' in body
+
+    @responses.activate
+    def test_remessa_uploads_from_memory(self, client, base_url):
+        """Testa upload do JSON da remessa direto da memória"""
+        responses.add(
+            responses.POST,
+            f"{base_url}/api/remessa",
+            body=b"01REMESSA",
+            status=200
+        )
+
+        result = client.generate_remessa("sicoob", "cnab240", {"pagamentos": []})
+
+        body = responses.calls[0].request.body
+        assert result == b"01REMESSA"
+        assert b'{"pagamentos":[]}' in body
+        assert "pix=false" in responses.calls[0].request.url
+
+
+class TestGzipUpload:
+    """Testes para uploads comprimidos com gzip"""
+
+    @responses.activate
+    def test_multi_compressed_above_threshold(self, base_url, valid_boleto_data):
+        """Testa que o multipart inteiro vai em gzip acima do limite"""
+        import gzip
+
+        responses.add(responses.POST, f"{base_url}/api/boleto/multi", body=b"%PDF-1.4")
+        client = BoletoClient(base_url, compress_threshold=1024)
+
+        client.generate_multiple_boletos([valid_boleto_data] * 50)
+
+        request = responses.calls[0].request
+        body = gzip.decompress(request.body)
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert request.headers["Content-Length"] == str(len(request.body))
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert b'[{"agencia":"3073"' in body
+        assert len(request.body) * 5 < len(body)
+
+    @responses.activate
+    def test_retorno_small_file_not_compressed(self, base_url, tmp_path):
+        """Testa que arquivos abaixo do limite vão sem compressão"""
+        responses.add(responses.POST, f"{base_url}/api/retorno", json=[])
+        path = tmp_path / "retorno.ret"
+        path.write_bytes(b"0" * 240)
+        client = BoletoClient(base_url, compress_threshold=64 * 1024)
+
+        client.process_retorno("sicoob", "cnab240", str(path))
+
+        assert "Content-Encoding" not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_disabled_by_default(self, client, base_url):
+        """Testa que sem compress_threshold nada é comprimido"""
+        responses.add(responses.POST, f"{base_url}/api/remessa", body=b"01REMESSA")
+
+        client.generate_remessa("sicoob", "cnab240", {"pagamentos": [{"valor": 1}] * 1000})
+
+        assert "Content-Encoding" not in responses.calls[0].request.headers
+
+
+def _pdf_with_widths(widths):
+    """PDF de teste com uma página em branco por largura (para checar ordem)"""
+    import io
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for width in widths:
+        writer.add_blank_page(width=width, height=100)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _page_widths(pdf):
+    import io
+    from pypdf import PdfReader
+
+    return [int(page.mediabox.width) for page in PdfReader(io.BytesIO(pdf)).pages]
+
+
+class TestChunkedMulti:
+    """Testes para generate_multiple_boletos dividido em lotes"""
+
+    @staticmethod
+    def _multi_callback(include_data):
+        def callback(request):
+            import base64
+            import re
+            match = re.search(rb'(\[.*\])\r\n', request.body, re.S)
+            chunk = json.loads(match.group(1))
+            pdf = _pdf_with_widths([int(b["nosso_numero"]) for b in chunk])
+            if not include_data:
+                return (200, {}, pdf)
+            body = {
+                "total": len(chunk),
+                "boletos": [{"nosso_numero": b["nosso_numero"]} for b in chunk],
+                "content_base64": base64.b64encode(pdf).decode(),
+                "content_type": "application/pdf",
+                "filename": "boletos-multi.pdf"
+            }
+            return (200, {}, json.dumps(body))
+        return callback
+
+    @responses.activate
+    def test_chunks_merged_in_order(self, client, base_url, valid_boleto_data):
+        """Testa divisão em lotes e união dos PDFs na ordem da entrada"""
+        responses.add_callback(
+            responses.POST, f"{base_url}/api/boleto/multi",
+            callback=self._multi_callback(include_data=False)
+        )
+        boletos = [dict(valid_boleto_data, nosso_numero=str(100 + i)) for i in range(7)]
+
+        pdf = client.generate_multiple_boletos(boletos, chunk_size=3, max_workers=3)
+
+        assert len(responses.calls) == 3
+        assert _page_widths(pdf) == list(range(100, 107))
+
+    @responses.activate
+    def test_chunks_merge_metadata(self, base_url, valid_boleto_data):
+        """Testa união dos metadados no modo include_data"""
+        import base64
+        responses.add_callback(
+            responses.POST, f"{base_url}/api/boleto/multi",
+            callback=self._multi_callback(include_data=True)
+        )
+        client = BoletoClient(base_url, retries=1, multi_chunk_size=2)
+        boletos = [dict(valid_boleto_data, nosso_numero=str(200 + i)) for i in range(5)]
+
+        result = client.generate_multiple_boletos_with_data(boletos)
+
+        assert len(responses.calls) == 3
+        assert result["total"] == 5
+        assert [b["nosso_numero"] for b in result["boletos"]] == [str(200 + i) for i in range(5)]
+        assert _page_widths(base64.b64decode(result["content_base64"])) == list(range(200, 205))
+
+    @responses.activate
+    def test_small_list_single_request(self, client, base_url, valid_boleto_data):
+        """Testa que listas menores que o lote vão numa chamada só"""
+        responses.add(
+            responses.POST, f"{base_url}/api/boleto/multi",
+            body=b"%PDF-1.4", status=200
+        )
+
+        assert client.generate_multiple_boletos([valid_boleto_data] * 2, chunk_size=5) == b"%PDF-1.4"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_chunk_error_reports_range(self, client, base_url, valid_boleto_data):
+        """Testa que erro de um lote indica o intervalo da entrada"""
+        responses.add(
+            responses.POST, f"{base_url}/api/boleto/multi",
+            json={"error": "1 boleto(s) com erros de validação"}, status=400
+        )
+
+        with pytest.raises(BoletoValidationError) as exc_info:
+            client.generate_multiple_boletos([valid_boleto_data] * 4, chunk_size=2)
+
+        assert "Lote 1-2" in exc_info.value.message
+
+    def test_chunking_requires_pdf(self, client, valid_boleto_data):
+        """Testa que imagens não podem ser divididas em lotes"""
+        with pytest.raises(ValueError):
+            client.generate_multiple_boletos([valid_boleto_data] * 4, file_type="png", chunk_size=2)
+
+
+class TestGenerateBoletoFile:
+    """Testes para o modo binário + metadados em headers"""
+
+    @responses.activate
+    def test_generate_boleto_file(self, client, base_url, valid_boleto_data):
+        """Testa bytes crus + metadados lidos dos headers"""
+        responses.add(
+            responses.GET,
+            f"{base_url}/api/boleto",
+            body=b"%PDF-1.4",
+            status=200,
+            content_type="application/pdf",
+            headers={
+                "Content-Disposition": "attachment; filename=boleto-banco_brasil.pdf",
+                "X-Nosso-Numero": "000000123",
+                "X-Nosso-Numero-Formatado": "01234567000000123",
+                "X-Nosso-Numero-DV": "9",
+                "X-Codigo-Barras": "00196131200001500000000000123456700000012318",
+                "X-Linha-Digitavel": "00190.00009 00123.456709 00000.123182 6 13120000150000",
+                "X-Banco": "banco_brasil",
+                "X-Valor": "150.0",
+                "X-Data-Vencimento": "2025-12-31",
+            },
+            match=[matchers.query_param_matcher(
+                {"include_data": "headers"}, strict_match=False
+            )]
+        )
+
+        result = client.generate_boleto_file("banco_brasil", valid_boleto_data)
+
+        assert result.content == b"%PDF-1.4"
+        assert result.content_type == "application/pdf"
+        assert result.filename == "boleto-banco_brasil.pdf"
+        assert result.nosso_numero_formatado == "01234567000000123"
+        assert result.nosso_numero_dv == "9"
+        assert result.codigo_barras.startswith("0019")
+        assert result.data == {"bank": "banco_brasil", "valor": 150.0, "data_vencimento": "2025-12-31"}
+
+
+class TestStreamToFile:
+    """Testes para as variantes *_to_file (download em streaming)"""
+
+    @responses.activate
+    def test_generate_boleto_to_path(self, client, base_url, valid_boleto_data, tmp_path):
+        """Testa gravação em caminho com blocos pequenos"""
+        content = b"%PDF-1.4 " + b"x" * 1000
+        responses.add(responses.GET, f"{base_url}/api/boleto", body=content, status=200)
+        dest = tmp_path / "boleto.pdf"
+
+        written = client.generate_boleto_to_file(
+            "banco_brasil", valid_boleto_data, str(dest), chunk_size=64
+        )
+
+        assert written == len(content)
+        assert dest.read_bytes() == content
+
+    @responses.activate
+    def test_generate_multiple_to_stream(self, client, base_url, valid_boleto_data):
+        """Testa gravação num stream binário já aberto"""
+        import io
+        responses.add(responses.POST, f"{base_url}/api/boleto/multi", body=b"%PDF-multi", status=200)
+        buffer = io.BytesIO()
+
+        written = client.generate_multiple_boletos_to_file([valid_boleto_data], buffer)
+
+        assert written == 10
+        assert buffer.getvalue() == b"%PDF-multi"
+
+    @responses.activate
+    def test_generate_remessa_to_file(self, client, base_url, tmp_path):
+        """Testa gravação da remessa CNAB"""
+        responses.add(responses.POST, f"{base_url}/api/remessa", body=b"01REMESSA", status=200)
+        dest = tmp_path / "remessa.rem"
+
+        client.generate_remessa_to_file("sicoob", "cnab240", {"pagamentos": []}, dest)
+
+        assert dest.read_bytes() == b"01REMESSA"
+
+    @responses.activate
+    def test_error_does_not_create_file(self, client, base_url, invalid_boleto_data, tmp_path):
+        """Testa que erro da API não deixa arquivo para trás"""
+        responses.add(
+            responses.GET, f"{base_url}/api/boleto",
+            json={"error": "Dados inválidos"}, status=400
+        )
+        dest = tmp_path / "boleto.pdf"
+
+        with pytest.raises(BoletoValidationError):
+            client.generate_boleto_to_file("banco_brasil", invalid_boleto_data, str(dest))
+
+        assert not dest.exists()
+
+
+class TestIncrementalParsing:
+    """Testes para iter_retorno e iter_ofx_transacoes"""
+
+    @responses.activate
+    def test_iter_retorno(self, base_url, tmp_path):
+        """Testa pagamentos entregues um a um"""
+        pagamentos = [{"nosso_numero": str(i), "valor_pago": i * 10.0} for i in range(50)]
+        responses.add(responses.POST, f"{base_url}/api/retorno", json=pagamentos, status=200)
+        retorno = tmp_path / "retorno.ret"
+        retorno.write_bytes(b"02RETORNO")
+        client = BoletoClient(base_url, retries=1, stream_chunk_size=16)
+
+        it = client.iter_retorno("sicoob", "cnab240", str(retorno))
+
+        assert next(it) == pagamentos[0]
+        assert list(it) == pagamentos[1:]
+
+    @responses.activate
+    def test_iter_ofx_transacoes(self, client, base_url, tmp_path):
+        """Testa iteração do array transacoes do OFX"""
+        body = {
+            "banco": {"org": "SICOOB"},
+            "conta": {"numero": "123"},
+            "transacoes": [{"valor": 10.0}, {"valor": -5.0}],
+            "resumo": {"total_transacoes": 2}
+        }
+        responses.add(responses.POST, f"{base_url}/api/ofx/parse", json=body, status=200)
+        ofx = tmp_path / "extrato.ofx"
+        ofx.write_bytes(b"OFXHEADER:100")
+
+        result = list(client.iter_ofx_transacoes(str(ofx), somente_creditos=True))
+
+        assert result == body["transacoes"]
+        assert b"somente_creditos" in responses.calls[0].request.body
+
+    @responses.activate
+    def test_iter_retorno_error(self, client, base_url, tmp_path):
+        """Testa erro 400 propagado no primeiro next()"""
+        responses.add(
+            responses.POST, f"{base_url}/api/retorno",
+            json={"error": "Erro ao processar retorno"}, status=400
+        )
+        retorno = tmp_path / "retorno.ret"
+        retorno.write_bytes(b"")
+
+        with pytest.raises(BoletoValidationError):
+            next(client.iter_retorno("sicoob", "cnab240", str(retorno)))
+
+
+class TestPostBodyQueries:
+    """Testes para validate/data/nosso_numero via POST com payload grande"""
+
+    @responses.activate
+    def test_small_payload_uses_get(self, client, base_url, valid_boleto_data):
+        """Testa que payload pequeno continua no GET"""
+        responses.add(responses.GET, f"{base_url}/api/boleto/validate", json={"valid": True})
+
+        client.validate("banco_brasil", valid_boleto_data)
+
+        assert responses.calls[0].request.method == "GET"
+
+    @responses.activate
+    def test_large_payload_uses_post_body(self, client, base_url, valid_boleto_data):
+        """Testa que payload acima do limite vai no corpo JSON"""
+        responses.add(responses.POST, f"{base_url}/api/boleto/nosso_numero", json={"nosso_numero": "1"})
+        data = dict(valid_boleto_data, instrucao1="Não receber após o vencimento. " * 200)
+
+        result = client.get_nosso_numero("banco_brasil", data)
+
+        request = responses.calls[0].request
+        assert result == {"nosso_numero": "1"}
+        assert request.method == "POST"
+        assert "data=" not in request.url
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"bank": "banco_brasil", "data": data}
+
+    @responses.activate
+    def test_threshold_configurable(self, base_url, valid_boleto_data):
+        """Testa post_threshold=0 (sempre POST) e None (sempre GET)"""
+        responses.add(responses.POST, f"{base_url}/api/boleto/validate", json={"valid": True})
+        responses.add(responses.GET, f"{base_url}/api/boleto/validate", json={"valid": True})
+
+        BoletoClient(base_url, post_threshold=0).validate("banco_brasil", valid_boleto_data)
+        BoletoClient(base_url, post_threshold=None).validate("banco_brasil", {"x": "y" * 10000})
+
+        assert [c.request.method for c in responses.calls] == ["POST", "GET"]
+
+
+class TestBatchQueries:
+    """Testes para validate_many / data_many / nosso_numero_many"""
+
+    @staticmethod
+    def _echo(request):
+        items = json.loads(request.body)["items"]
+        results = [
+            {"index": i + 1, "valid": item["bank"] != "invalido", "nosso_numero": item["data"]["nosso_numero"]}
+            for i, item in enumerate(items)
+        ]
+        return 200, {}, json.dumps({"total": len(results), "results": results})
+
+    @responses.activate
+    def test_single_request_for_small_batch(self, client, base_url, valid_boleto_data):
+        """Testa um POST só para lotes até o tamanho do chunk"""
+        responses.add_callback(responses.POST, f"{base_url}/api/boleto/batch/validate", callback=self._echo)
+
+        results = client.validate_many([
+            ("banco_brasil", valid_boleto_data),
+            {"bank": "invalido", "data": valid_boleto_data},
+        ])
+
+        assert [r["valid"] for r in results] == [True, False]
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert body["items"][0] == {"bank": "banco_brasil", "data": valid_boleto_data}
+
+    @responses.activate
+    def test_chunks_preserve_order_and_index(self, base_url, valid_boleto_data):
+        """Testa divisão em lotes com ordem e índices globais"""
+        responses.add_callback(responses.POST, f"{base_url}/api/boleto/batch/data", callback=self._echo)
+        client = BoletoClient(base_url, retries=0, batch_chunk_size=3)
+        boletos = [dict(valid_boleto_data, nosso_numero=str(i)) for i in range(8)]
+
+        results = client.data_many(boletos, bank="banco_brasil")
+
+        assert len(responses.calls) == 3
+        assert [r["nosso_numero"] for r in results] == [str(i) for i in range(8)]
+        assert [r["index"] for r in results] == list(range(1, 9))
+
+    @responses.activate
+    def test_chunk_error_names_range(self, base_url, valid_boleto_data):
+        """Testa erro de um lote com o intervalo de itens"""
+        responses.add(
+            responses.POST, f"{base_url}/api/boleto/batch/nosso_numero",
+            json={"error": "Lote com 3 itens excede o máximo"}, status=400
+        )
+        client = BoletoClient(base_url, retries=0)
+
+        with pytest.raises(BoletoValidationError, match="Lote 1-3"):
+            client.nosso_numero_many([valid_boleto_data] * 5, bank="sicoob", chunk_size=3)
+
+    def test_item_without_bank(self, client, valid_boleto_data):
+        with pytest.raises(ValueError):
+            client.validate_many([valid_boleto_data])
+
+    def test_empty(self, client):
+        assert client.validate_many([]) == []
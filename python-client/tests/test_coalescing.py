@@ -0,0 +1,195 @@
+"""
+Testes para a coalescência de requisições idênticas (single-flight)
+"""
+import threading
+import time
+
+import responses
+
+from boleto_cnab_client import BoletoClient
+from boleto_cnab_client.coalescing import SingleFlight, request_key
+from boleto_cnab_client.exceptions import BoletoValidationError
+
+URL = "http://localhost:9292/api/boleto/data"
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condição não atingida")
+        time.sleep(0.001)
+
+
+def _run_threads(n, target):
+    results, errors = [None] * n, [None] * n
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    return threads, results, errors
+
+
+class TestRequestKey:
+    """Testes para a chave canônica da requisição"""
+
+    def test_data_key_order_does_not_matter(self):
+        a = request_key("GET", URL, {"params": {"bank": "sicoob", "data": '{"a": 1, "b": 2}'}})
+        b = request_key("GET", URL, {"params": {"data": '{"b": 2, "a": 1}', "bank": "sicoob"}})
+        assert a == b
+
+    def test_payload_changes_key(self):
+        a = request_key("GET", URL, {"params": {"bank": "sicoob", "data": '{"a": 1}'}})
+        b = request_key("GET", URL, {"params": {"bank": "itau", "data": '{"a": 1}'}})
+        c = request_key("POST", URL, {"params": {"bank": "sicoob", "data": '{"a": 1}'}})
+        assert len({a, b, c}) == 3
+
+    def test_in_memory_upload(self):
+        a = request_key("POST", URL, {"files": {"data": ("d.json", b"[1]", "application/json")}})
+        b = request_key("POST", URL, {"files": {"data": ("d.json", b"[2]", "application/json")}})
+        assert a is not None and a != b
+
+    def test_not_coalescible(self, tmp_path):
+        path = tmp_path / "ret.txt"
+        path.write_bytes(b"x")
+        with open(path, "rb") as f:
+            assert request_key("POST", URL, {"files": {"data": f}}) is None
+        assert request_key("GET", URL, {"stream": True}) is None
+
+    def test_unkeyed_kwarg_is_not_coalescible(self):
+        """Testa que kwargs fora da chave (ex.: json=) desligam a coalescência"""
+        assert request_key("POST", URL, {"json": {"a": 1}}) is None
+        assert request_key("POST", URL, {"data": b"{}", "bank": "sicoob", "compress": True}) is not None
+
+
+class TestSingleFlight:
+    """Testes para o SingleFlight"""
+
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait()
+            return "pdf"
+
+        threads, results, _ = _run_threads(5, lambda: flight.do("k", work))
+        _wait_for(lambda: flight.stats()["coalesced"] == 4)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == ["pdf"] * 5
+        assert len(calls) == 1
+        assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_error_reaches_all_waiters(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def work():
+            release.wait()
+            raise ValueError("falhou")
+
+        threads, _, errors = _run_threads(3, lambda: flight.do("k", work))
+        _wait_for(lambda: flight.stats()["coalesced"] == 2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert all(isinstance(e, ValueError) for e in errors)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.stats()["coalesced"] == 0
+
+
+class TestClientCoalescing:
+    """Testes do BoletoClient com coalescência"""
+
+    @responses.activate
+    def test_refresh_storm_hits_network_once(self, base_url, valid_boleto_data):
+        """Testa várias threads pedindo o mesmo boleto ao mesmo tempo"""
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return 200, {}, '{"nosso_numero": "123"}'
+
+        responses.add_callback(responses.GET, f"{base_url}/api/boleto/nosso_numero", callback=callback)
+        client = BoletoClient(base_url, retries=0)
+
+        threads, results, errors = _run_threads(
+            4, lambda: client.get_nosso_numero("banco_brasil", dict(valid_boleto_data))
+        )
+        _wait_for(lambda: client.single_flight.stats()["coalesced"] == 3)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert errors == [None] * 4
+        assert results == [{"nosso_numero": "123"}] * 4
+        assert len({id(r) for r in results}) == 4  # cada chamador recebe seu dict
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_error_shared(self, base_url, invalid_boleto_data):
+        """Testa que o erro da chamada compartilhada chega a todos"""
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return 400, {}, '{"error": "inválido"}'
+
+        responses.add_callback(responses.GET, f"{base_url}/api/boleto/validate", callback=callback)
+        client = BoletoClient(base_url, retries=0)
+
+        threads, _, errors = _run_threads(3, lambda: client.validate("banco_brasil", invalid_boleto_data))
+        _wait_for(lambda: client.single_flight.stats()["coalesced"] == 2)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert all(isinstance(e, BoletoValidationError) for e in errors)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_uploads_are_opt_in(self, base_url, valid_boleto_data):
+        """Testa que /multi só é coalescido com coalesce_uploads=True"""
+        release = threading.Event()
+        seen = []
+
+        def callback(request):
+            seen.append(1)
+            release.wait()
+            return 200, {}, b"%PDF"
+
+        responses.add_callback(responses.POST, f"{base_url}/api/boleto/multi", callback=callback)
+
+        for coalesce_uploads, network_calls in ((False, 2), (True, 1)):
+            release.clear()
+            seen.clear()
+            client = BoletoClient(base_url, retries=0, coalesce_uploads=coalesce_uploads)
+            threads, results, _ = _run_threads(
+                2, lambda: client.generate_multiple_boletos([valid_boleto_data])
+            )
+            _wait_for(lambda: len(seen) + client.single_flight.stats()["coalesced"] == 2)
+            release.set()
+            for t in threads:
+                t.join()
+
+            assert results == [b"%PDF"] * 2
+            assert len(seen) == network_calls
+
+    def test_disabled(self, base_url):
+        assert BoletoClient(base_url, coalesce=False).single_flight is None
@@ -0,0 +1,128 @@
+"""
+Testes para os adaptadores colunares (Arrow/pandas)
+"""
+import json
+from datetime import date
+
+import pytest
+import responses
+
+from boleto_cnab_client.columnar import batch_from_frame, cnab_data, cnab_valor, records_to_table, RETORNO_TYPES
+
+PAGAMENTOS = [
+    {"nosso_numero": "00000000123", "valor_titulo": "0000000015050", "valor_recebido": "0000000015050",
+     "data_ocorrencia": "150125", "data_credito": "000000", "codigo_ocorrencia": "06"},
+    {"nosso_numero": "00000000124", "valor_titulo": "0000000009990", "valor_recebido": None,
+     "data_ocorrencia": "16012025", "codigo_ocorrencia": "02"},
+]
+
+OFX = {
+    "banco": {"codigo": "756"},
+    "conta": {"agencia": "3073", "numero": "12345"},
+    "transacoes": [
+        {"fitid": "1", "tipo": "CREDIT", "data": "2025-01-15", "valor": 150.5, "memo": "PIX"},
+        {"fitid": "2", "tipo": "DEBIT", "data": "2025-01-16", "valor": -20.0, "memo": "TARIFA"},
+    ],
+    "resumo": {"total_creditos": 150.5},
+}
+
+
+class TestConversions:
+    """Testes da conversão de valores do retorno CNAB"""
+
+    def test_cnab_valor(self):
+        assert cnab_valor("0000000015050") == 150.5
+        assert cnab_valor("150.50") == 150.5
+        assert cnab_valor(12) == 12.0
+        assert cnab_valor("") is None
+
+    def test_cnab_data(self):
+        assert cnab_data("150125") == date(2025, 1, 15)
+        assert cnab_data("15012025") == date(2025, 1, 15)
+        assert cnab_data("2025-01-15") == date(2025, 1, 15)
+        assert cnab_data("000000") is None
+        assert cnab_data("991399") is None
+
+
+class TestArrow:
+    """Testes com pyarrow"""
+
+    pa = pytest.importorskip("pyarrow")
+
+    def test_retorno_table_is_typed(self):
+        table = records_to_table(PAGAMENTOS, RETORNO_TYPES, "arrow")
+
+        assert table.schema.field("valor_titulo").type == self.pa.float64()
+        assert table.schema.field("data_ocorrencia").type == self.pa.date32()
+        assert table.column("valor_titulo").to_pylist() == [150.5, 99.9]
+        assert table.column("valor_recebido").to_pylist() == [150.5, None]
+        assert table.column("data_credito").to_pylist() == [None, None]
+        assert table.column("nosso_numero").to_pylist() == ["00000000123", "00000000124"]
+
+    @responses.activate
+    def test_parse_ofx_as_table(self, client, base_url, tmp_path):
+        responses.add(responses.POST, f"{base_url}/api/ofx/parse", json=OFX)
+        path = tmp_path / "extrato.ofx"
+        path.write_bytes(b"OFXHEADER:100")
+
+        table = client.parse_ofx(str(path), as_table="arrow")
+
+        assert table.column("valor").to_pylist() == [150.5, -20.0]
+        assert table.column("data").to_pylist() == [date(2025, 1, 15), date(2025, 1, 16)]
+        assert json.loads(table.schema.metadata[b"conta"]) == {"agencia": "3073", "numero": "12345"}
+
+    @responses.activate
+    def test_multi_from_table(self, client, base_url):
+        responses.add(responses.POST, f"{base_url}/api/boleto/multi", body=b"%PDF-1.4")
+        table = self.pa.table({
+            "nosso_numero": [1, 2],
+            "valor": [150.0, None],
+            "data_vencimento": self.pa.array([date(2025, 12, 31), None], type=self.pa.date32()),
+        })
+
+        batch = batch_from_frame(table, bank="sicoob")
+        client.generate_multiple_boletos_from_frame(table, bank="sicoob")
+
+        assert list(batch) == [
+            {"bank": "sicoob", "nosso_numero": "1", "valor": 150.0, "data_vencimento": "2025/12/31"},
+            {"bank": "sicoob", "nosso_numero": "2"},
+        ]
+        assert batch.to_json_bytes() in responses.calls[0].request.body
+
+
+class TestPandas:
+    """Testes com pandas"""
+
+    pd = pytest.importorskip("pandas")
+
+    @responses.activate
+    def test_process_retorno_as_dataframe(self, client, base_url, tmp_path):
+        responses.add(responses.POST, f"{base_url}/api/retorno", json=PAGAMENTOS)
+        path = tmp_path / "retorno.ret"
+        path.write_bytes(b"0" * 240)
+
+        frame = client.process_retorno("sicoob", "cnab240", str(path), as_table="pandas")
+
+        assert str(frame["valor_titulo"].dtype) == "float64"
+        assert frame["valor_titulo"].sum() == pytest.approx(250.4)
+        assert frame["data_ocorrencia"].dt.day.tolist() == [15, 16]
+        assert frame["data_credito"].isna().all()
+
+    def test_batch_from_dataframe(self):
+        frame = self.pd.DataFrame({
+            "nosso_numero": [10, None],
+            "valor": [1.5, 2.0],
+            "data_vencimento": self.pd.to_datetime(["2025-12-31", None]),
+            "sacado": ["Ana", None],
+        })
+
+        batch = batch_from_frame(frame, bank="itau")
+
+        assert list(batch) == [
+            {"bank": "itau", "nosso_numero": "10", "valor": 1.5, "data_vencimento": "2025/12/31", "sacado": "Ana"},
+            {"bank": "itau", "valor": 2.0},
+        ]
+
+    def test_rejects_unknown_input(self):
+        with pytest.raises(TypeError):
+            batch_from_frame([{"valor": 1}])
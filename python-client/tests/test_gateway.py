@@ -0,0 +1,172 @@
+"""
+Testes para GatewayClient e AsyncGatewayClient (gateway FastAPI)
+"""
+import asyncio
+import json
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+
+import httpx
+import pytest
+import responses
+
+from boleto_cnab_client import (
+    AsyncGatewayClient,
+    CarneIn,
+    Cobranca,
+    CobrancaIn,
+    CobrancaOut,
+    GatewayClient,
+    Pagador
+)
+from boleto_cnab_client.exceptions import BoletoAPIError, BoletoValidationError
+
+URL = "http://gateway:8000"
+
+REGISTRADO = {"id": "123", "status": "registrado", "linha_digitavel": "75691.43271", "extra": 1}
+
+
+def cobranca_in(seu_numero="1"):
+    return CobrancaIn(
+        tenant_id="imob_123",
+        provider="sicoob",
+        account_config={"cooperativa": "3073"},
+        cobranca=Cobranca(
+            valor=Decimal("1000.00"),
+            vencimento=date(2026, 7, 10),
+            seu_numero=seu_numero,
+            pagador=Pagador(nome="Fulano", documento="12345678901"),
+        ),
+    )
+
+
+class TestModels:
+    """Testes da serialização dos modelos"""
+
+    def test_cobranca_in_to_dict(self):
+        assert cobranca_in().to_dict() == {
+            "tenant_id": "imob_123",
+            "provider": "sicoob",
+            "account_config": {"cooperativa": "3073"},
+            "cobranca": {
+                "valor": "1000.00",
+                "vencimento": "2026-07-10",
+                "seu_numero": "1",
+                "pagador": {"nome": "Fulano", "documento": "12345678901"},
+            },
+        }
+
+    def test_cobranca_out_ignores_unknown_fields(self):
+        out = CobrancaOut.from_dict(REGISTRADO)
+        assert out.id == "123"
+        assert out.status == "registrado"
+        assert out.pdf is None
+
+
+class TestGatewayClient:
+    """Testes do cliente síncrono"""
+
+    @responses.activate
+    def test_registrar(self):
+        responses.add(responses.POST, f"{URL}/cobranca", json=REGISTRADO)
+
+        out = GatewayClient(URL).registrar(cobranca_in())
+
+        assert out.linha_digitavel == "75691.43271"
+        assert json.loads(responses.calls[0].request.body)["cobranca"]["valor"] == "1000.00"
+
+    @responses.activate
+    def test_consultar_quotes_id_and_retries(self):
+        responses.add(responses.GET, f"{URL}/cobranca/a%2Fb", status=503)
+        responses.add(responses.GET, f"{URL}/cobranca/a%2Fb", json={"id": "a/b", "status": "liquidado"})
+
+        out = GatewayClient(URL, backoff_factor=0).consultar("a/b", "imob_123", "c6")
+
+        assert out.status == "liquidado"
+        assert len(responses.calls) == 2
+        assert "tenant_id=imob_123" in responses.calls[1].request.url
+
+    @responses.activate
+    def test_registrar_is_not_retried(self):
+        responses.add(responses.POST, f"{URL}/cobranca", status=502, json={"detail": "banco fora"})
+
+        with pytest.raises(BoletoAPIError) as exc:
+            GatewayClient(URL, backoff_factor=0).registrar(cobranca_in())
+
+        assert exc.value.status_code == 502
+        assert exc.value.message == "banco fora"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_422_is_validation_error(self):
+        responses.add(responses.POST, f"{URL}/carne", status=422, json={"detail": [{"loc": ["body", "bank"]}]})
+
+        with pytest.raises(BoletoValidationError):
+            GatewayClient(URL).gerar_carne(CarneIn("imob_123", "c6", "banco_c6", [cobranca_in().cobranca]))
+
+    @responses.activate
+    def test_registrar_many_bounded_and_ordered(self):
+        """Testa ordem, falha por item e limite de requisições em voo"""
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def callback(request):
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.02)
+            with lock:
+                state["now"] -= 1
+            seu_numero = json.loads(request.body)["cobranca"]["seu_numero"]
+            if seu_numero == "3":
+                return 424, {}, json.dumps({"detail": "credenciais ausentes"})
+            return 200, {}, json.dumps({"id": seu_numero, "status": "registrado"})
+
+        responses.add_callback(responses.POST, f"{URL}/cobranca", callback=callback)
+
+        results = GatewayClient(URL).registrar_many([cobranca_in(str(i)) for i in range(8)], max_in_flight=2)
+
+        assert [r.id for r in results if isinstance(r, CobrancaOut)] == ["0", "1", "2", "4", "5", "6", "7"]
+        assert isinstance(results[3], BoletoAPIError) and results[3].status_code == 424
+        assert state["peak"] <= 2
+
+
+class TestAsyncGatewayClient:
+    """Testes do cliente assíncrono"""
+
+    def test_consultar_many(self):
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            cobranca_id = request.url.path.rsplit("/", 1)[1]
+            if cobranca_id == "x":
+                return httpx.Response(404, json={"detail": "não encontrada"})
+            return httpx.Response(200, json={"id": cobranca_id, "status": "registrado"})
+
+        async def scenario():
+            async with AsyncGatewayClient(URL, transport=httpx.MockTransport(handler)) as gateway:
+                return await gateway.consultar_many(["1", "x", "3", "4"], "imob_123", "c6", max_in_flight=2)
+
+        results = asyncio.run(scenario())
+
+        assert [getattr(r, "id", None) for r in results] == ["1", None, "3", "4"]
+        assert results[1].status_code == 404
+        assert in_flight["peak"] <= 2
+
+    def test_registrar(self):
+        def handler(request):
+            assert request.url.path == "/cobranca"
+            assert json.loads(request.content)["tenant_id"] == "imob_123"
+            return httpx.Response(200, json=REGISTRADO)
+
+        async def scenario():
+            async with AsyncGatewayClient(URL, transport=httpx.MockTransport(handler)) as gateway:
+                return await gateway.registrar(cobranca_in().to_dict())
+
+        assert asyncio.run(scenario()).id == "123"
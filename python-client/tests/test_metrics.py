@@ -0,0 +1,174 @@
+"""
+Testes para a instrumentação por chamada (observadores e MetricsCollector)
+"""
+import pytest
+import requests
+import responses
+
+from boleto_cnab_client import BoletoBatch, BoletoClient, MetricsCollector, RequestEvent
+from boleto_cnab_client.exceptions import BoletoConnectionError, BoletoValidationError
+
+
+def _event(endpoint="/api/health", elapsed=0.1, status=200, attempts=1, error=None):
+    return RequestEvent(
+        method="GET", endpoint=endpoint, bank=None, status_code=status,
+        attempts=attempts, bytes_sent=10, bytes_received=20,
+        ttfb=elapsed / 2, elapsed=elapsed, error=error
+    )
+
+
+class TestObservers:
+    """Testes para os eventos emitidos pelo BoletoClient"""
+
+    @responses.activate
+    def test_event_on_success(self, base_url, valid_boleto_data):
+        """Testa endpoint, banco, status e bytes do evento"""
+        responses.add(responses.GET, f"{base_url}/api/boleto/validate", json={"valid": True})
+        events = []
+        client = BoletoClient(base_url, retries=1, observers=[events.append])
+
+        client.validate("banco_brasil", valid_boleto_data)
+
+        assert len(events) == 1
+        event = events[0]
+        assert event.method == "GET"
+        assert event.endpoint == "/api/boleto/validate"
+        assert event.bank == "banco_brasil"
+        assert event.status_code == 200
+        assert event.attempts == 1
+        assert event.bytes_received == len(b'{"valid": true}')
+        assert event.ttfb is not None and event.elapsed >= 0
+        assert event.error is None
+
+    @responses.activate
+    def test_bank_from_query_string_and_bytes_sent(self, base_url):
+        """Testa banco extraído da URL e tamanho do upload"""
+        responses.add(responses.POST, f"{base_url}/api/remessa", body=b"CNAB")
+        events = []
+        client = BoletoClient(base_url, retries=1)
+        client.add_observer(events.append)
+
+        client.generate_remessa("sicoob", "cnab240", {"pagamentos": []})
+
+        assert events[0].endpoint == "/api/remessa"
+        assert events[0].bank == "sicoob"
+        assert events[0].bytes_sent > 0
+        assert events[0].bytes_received == 4
+
+    @responses.activate
+    def test_bank_from_body_batch_and_multi(self, base_url, valid_boleto_data):
+        """Testa banco de chamadas com o banco no corpo (POST, lote e /multi)"""
+        responses.add(responses.POST, f"{base_url}/api/boleto/validate", json={"valid": True})
+        responses.add(responses.POST, f"{base_url}/api/boleto/batch/validate", json={"results": []})
+        responses.add(responses.POST, f"{base_url}/api/boleto/multi", body=b"%PDF")
+        events = []
+        client = BoletoClient(base_url, retries=1, post_threshold=0, observers=[events.append])
+
+        client.validate("sicoob", valid_boleto_data)
+        client.validate_many([valid_boleto_data] * 2, bank="itau")
+        client.generate_multiple_boletos([dict(valid_boleto_data, bank="caixa")])
+        client.validate_many([("itau", valid_boleto_data), ("caixa", valid_boleto_data)])
+        client.generate_multiple_boletos(BoletoBatch([dict(valid_boleto_data, bank="itau"), {}], bank="caixa"))
+
+        assert [e.bank for e in events] == ["sicoob", "itau", "caixa", None, None]
+
+    @responses.activate
+    def test_event_on_http_error(self, client, base_url, invalid_boleto_data):
+        """Testa evento com status e nome da exceção em 400"""
+        responses.add(
+            responses.GET, f"{base_url}/api/boleto/validate",
+            json={"error": "inválido"}, status=400
+        )
+        events = []
+        client.add_observer(events.append)
+
+        with pytest.raises(BoletoValidationError):
+            client.validate("banco_brasil", invalid_boleto_data)
+
+        assert events[0].status_code == 400
+        assert events[0].error == "BoletoValidationError"
+
+    @responses.activate
+    def test_event_on_connection_error(self, client, base_url):
+        """Testa evento sem resposta em erro de conexão"""
+        responses.add(
+            responses.GET, f"{base_url}/api/health",
+            body=requests.ConnectionError("recusada")
+        )
+        events = []
+        client.add_observer(events.append)
+
+        with pytest.raises(BoletoConnectionError):
+            client.health_check()
+
+        assert events[0].status_code is None
+        assert events[0].error == "BoletoConnectionError"
+
+    @responses.activate
+    def test_failing_observer_does_not_break_request(self, client, base_url):
+        """Testa que exceção do observador não chega ao chamador"""
+        responses.add(responses.GET, f"{base_url}/api/health", json={"status": "OK"})
+
+        def broken(event):
+            raise RuntimeError("observador quebrado")
+
+        client.add_observer(broken)
+        assert client.health_check() == {"status": "OK"}
+
+
+class TestMetricsCollector:
+    """Testes para o agregador de métricas"""
+
+    def test_percentiles_per_endpoint(self):
+        """Testa percentis sobre as latências de um endpoint"""
+        metrics = MetricsCollector()
+        for i in range(1, 101):
+            metrics(_event(elapsed=i / 100))
+        metrics(_event(endpoint="/api/info", elapsed=5.0))
+
+        p = metrics.percentiles("/api/health")
+        assert p["p50"] == pytest.approx(0.5)
+        assert p["p90"] == pytest.approx(0.9)
+        assert p["p99"] == pytest.approx(0.99)
+        assert metrics.percentiles("/api/nada") == {}
+
+    def test_snapshot_counts_errors_and_retries(self):
+        """Testa contagens de erros, retries e status"""
+        metrics = MetricsCollector()
+        metrics(_event(attempts=3))
+        metrics(_event(status=None, error="BoletoTimeoutError"))
+
+        row = metrics.snapshot()[0]
+        assert row["count"] == 2
+        assert row["errors"] == 1
+        assert row["retries"] == 2
+        assert row["statuses"] == {"200": 1, "error": 1}
+
+    def test_prometheus_histogram_is_cumulative(self):
+        """Testa buckets cumulativos e contadores no formato Prometheus"""
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        metrics(_event(elapsed=0.05))
+        metrics(_event(elapsed=0.5))
+        metrics(_event(elapsed=2.0))
+
+        text = metrics.to_prometheus()
+        labels = 'method="GET",endpoint="/api/health"'
+        assert f'boleto_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'boleto_client_request_duration_seconds_bucket{{{labels},le="1"}} 2' in text
+        assert f'boleto_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f'boleto_client_request_duration_seconds_count{{{labels}}} 3' in text
+        assert f'boleto_client_requests_total{{{labels},status="200"}} 3' in text
+        assert "# TYPE boleto_client_request_duration_seconds histogram" in text
+
+    @responses.activate
+    def test_collector_as_client_observer(self, base_url):
+        """Testa o coletor plugado no cliente"""
+        responses.add(responses.GET, f"{base_url}/api/health", json={"status": "OK"})
+        metrics = MetricsCollector()
+        client = BoletoClient(base_url, retries=1, observers=[metrics])
+
+        client.health_check()
+        client.health_check()
+
+        assert metrics.snapshot()[0]["count"] == 2
+        assert "p50" in metrics.percentiles("/api/health")
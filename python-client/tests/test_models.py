@@ -154,3 +154,75 @@ class TestBoletoResponse:
 
         str_repr = str(response)
         assert "N/A" in str_repr
+
+
+class TestBoletoFile:
+    """Testes para BoletoFile"""
+
+    def test_from_response_without_info(self):
+        """Testa headers vazios viram None e data fica vazio"""
+        from boleto_cnab_client.models import BoletoFile
+
+        result = BoletoFile.from_response(b"%PDF", {
+            "X-Nosso-Numero": "123",
+            "X-Linha-Digitavel": "",
+        })
+
+        assert result.nosso_numero == "123"
+        assert result.linha_digitavel is None
+        assert result.filename is None
+        assert result.data == {}
+
+
+class TestCompactModels:
+    """Testes para CompactBoletoData e CompactBoletoResponse"""
+
+    MINIMAL = dict(
+        agencia="1234",
+        conta_corrente="12345678",
+        nosso_numero="123",
+        valor=100.00,
+        cedente="Empresa",
+        documento_cedente="12345678000199",
+        sacado="Cliente",
+        sacado_documento="12345678901"
+    )
+
+    def test_same_to_dict_as_dataclass(self):
+        """Testa que to_dict é igual ao do dataclass"""
+        from boleto_cnab_client.models import CompactBoletoData
+
+        compact = CompactBoletoData(convenio="654321", **self.MINIMAL)
+        regular = BoletoData(convenio="654321", **self.MINIMAL)
+
+        assert compact.to_dict() == regular.to_dict()
+        assert not hasattr(compact, "__dict__")
+
+    def test_missing_required_field(self):
+        """Testa erro sem campo obrigatório"""
+        from boleto_cnab_client.models import CompactBoletoData
+
+        data = dict(self.MINIMAL)
+        del data["valor"]
+        with pytest.raises(TypeError):
+            CompactBoletoData(**data)
+        with pytest.raises(TypeError):
+            CompactBoletoData.from_dict(data)
+
+    def test_response_from_dict_ignores_extra(self):
+        """Testa from_dict da resposta com chaves extras da API"""
+        from boleto_cnab_client.models import CompactBoletoResponse
+
+        response = CompactBoletoResponse.from_dict({
+            "bank": "sicoob",
+            "nosso_numero": "1",
+            "codigo_barras": "7569",
+            "valor": 10.0,
+            "cedente": "Empresa",
+            "sacado": "Cliente",
+            "nosso_numero_formatado": "0000001-5",
+        })
+
+        assert response.bank == "sicoob"
+        assert response.linha_digitavel is None
+        assert "Boleto SICOOB" in str(response)
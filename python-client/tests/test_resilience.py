@@ -0,0 +1,228 @@
+"""
+Testes para a política de retry adaptativa (orçamento, disjuntor, Retry-After)
+"""
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+import responses
+
+from boleto_cnab_client import BoletoClient, CircuitBreaker, RetryBudget
+from boleto_cnab_client.exceptions import (
+    BoletoAPIError,
+    BoletoCircuitOpenError,
+    BoletoConnectionError
+)
+from boleto_cnab_client.resilience import backoff_delay, retry_after_seconds
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Captura as esperas entre tentativas sem dormir de verdade"""
+    calls = []
+    monkeypatch.setattr("boleto_cnab_client.client.time.sleep", calls.append)
+    return calls
+
+
+class TestRetryAfter:
+    """Testes para o parse do header Retry-After"""
+
+    def test_seconds(self):
+        assert retry_after_seconds({"Retry-After": "7"}) == 7.0
+
+    def test_http_date(self):
+        header = formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= retry_after_seconds({"Retry-After": header}) <= 30
+
+    def test_missing_or_invalid(self):
+        assert retry_after_seconds({}) is None
+        assert retry_after_seconds({"Retry-After": "amanhã"}) is None
+
+    def test_backoff_progression(self):
+        assert [backoff_delay(n, 1) for n in (1, 2, 3)] == [0, 2, 4]
+        assert backoff_delay(20, 1) == 120
+
+
+class TestRetryBudget:
+    """Testes para o orçamento de retries"""
+
+    def test_min_retries_then_denied(self):
+        budget = RetryBudget(ratio=0.5, min_retries=2)
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+    def test_successes_grow_budget(self):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+        assert not budget.try_acquire()
+        for _ in range(4):
+            budget.record_success()
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        assert budget.stats() == {"successes": 4, "retries": 2, "available": 0}
+
+
+class TestCircuitBreaker:
+    """Testes para as transições do disjuntor"""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.stats()["times_opened"] == 1
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=0.05)
+        for _ in range(5):
+            breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_release_probe_libera_a_sondagem(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.release_probe()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
+    def test_for_url_is_shared(self):
+        a = CircuitBreaker.for_url("http://engine-compartilhado:9292/")
+        b = CircuitBreaker.for_url("http://engine-compartilhado:9292")
+        assert a is b
+
+    def test_clients_share_the_url_breaker_by_default(self, base_url):
+        """Testa que clientes da mesma URL (e cada réplica) usam o disjuntor do processo"""
+        pytest.importorskip("httpx")
+        from boleto_cnab_client import AsyncBoletoClient
+
+        first, second = BoletoClient(base_url), BoletoClient(base_url + "/")
+        replicas = BoletoClient([base_url, "http://engine-2:9292"])
+
+        assert first.circuit_breaker is second.circuit_breaker is CircuitBreaker.for_url(base_url)
+        assert AsyncBoletoClient(base_url).circuit_breaker is first.circuit_breaker
+        assert [e.breaker for e in replicas.balancer.endpoints] == [
+            CircuitBreaker.for_url(base_url), CircuitBreaker.for_url("http://engine-2:9292")
+        ]
+        assert BoletoClient(base_url, circuit_breaker=CircuitBreaker()).circuit_breaker \
+            is not first.circuit_breaker
+
+
+class TestClientRetryPolicy:
+    """Testes da política aplicada pelo BoletoClient"""
+
+    @responses.activate
+    def test_honours_retry_after(self, base_url, sleeps):
+        """Testa espera pelo Retry-After antes de repetir"""
+        responses.add(responses.GET, f"{base_url}/api/health", status=429, headers={"Retry-After": "3"})
+        responses.add(responses.GET, f"{base_url}/api/health", json={"status": "OK"})
+        client = BoletoClient(base_url, retries=2)
+
+        assert client.health_check() == {"status": "OK"}
+        assert sleeps == [3.0]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_exhausted_retries(self, base_url, sleeps):
+        """Testa erro 500 de indisponibilidade após as tentativas"""
+        responses.add(responses.GET, f"{base_url}/api/health", status=503)
+        client = BoletoClient(base_url, retries=2)
+
+        with pytest.raises(BoletoAPIError) as exc_info:
+            client.health_check()
+        assert exc_info.value.status_code == 500
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_budget_stops_retries(self, base_url, sleeps):
+        """Testa que sem orçamento o erro volta sem retry"""
+        responses.add(responses.GET, f"{base_url}/api/health", status=503, json={"error": "ocupado"})
+        client = BoletoClient(base_url, retries=3, retry_budget=RetryBudget(min_retries=0))
+
+        with pytest.raises(BoletoAPIError) as exc_info:
+            client.health_check()
+        assert exc_info.value.status_code == 503
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retries_connection_error(self, base_url, sleeps):
+        """Testa retry em erro de conexão"""
+        responses.add(responses.GET, f"{base_url}/api/health", body=requests.ConnectionError("recusada"))
+        responses.add(responses.GET, f"{base_url}/api/health", json={"status": "OK"})
+        client = BoletoClient(base_url, retries=1)
+
+        assert client.health_check() == {"status": "OK"}
+
+    @responses.activate
+    def test_multipart_body_replayed(self, base_url, sleeps, tmp_path):
+        """Testa que o upload de arquivo é reenviado inteiro no retry"""
+        retorno = tmp_path / "ret.txt"
+        retorno.write_bytes(b"LINHA RETORNO")
+        responses.add(responses.POST, f"{base_url}/api/retorno", status=502)
+        responses.add(responses.POST, f"{base_url}/api/retorno", json=[])
+        client = BoletoClient(base_url, retries=1)
+
+        client.process_retorno("sicoob", "cnab240", str(retorno))
+
+        assert b"LINHA RETORNO" in responses.calls[1].request.body
+
+    @responses.activate
+    def test_circuit_opens_and_fails_fast(self, base_url, sleeps):
+        """Testa falha rápida com o circuito aberto"""
+        responses.add(responses.GET, f"{base_url}/api/health", status=500)
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = BoletoClient(base_url, retries=0, circuit_breaker=breaker)
+
+        for _ in range(2):
+            with pytest.raises(BoletoAPIError):
+                client.health_check()
+        assert client.circuit_breaker.state == "open"
+
+        with pytest.raises(BoletoCircuitOpenError) as exc_info:
+            client.health_check()
+        assert isinstance(exc_info.value, BoletoConnectionError)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_local_error_releases_half_open_probe(self, base_url):
+        """Testa que erro local numa sondagem não deixa o disjuntor preso em half-open"""
+        responses.add(responses.GET, f"{base_url}/api/health",
+                      body=requests.exceptions.ChunkedEncodingError("corpo truncado"))
+        responses.add(responses.GET, f"{base_url}/api/health", json={"status": "OK"})
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+        client = BoletoClient(base_url, retries=0, circuit_breaker=breaker)
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.health_check()
+        assert breaker.state == "half_open"
+        assert client.health_check() == {"status": "OK"}
+        assert breaker.state == "closed"
+
+    @responses.activate
+    def test_client_errors_do_not_trip_breaker(self, base_url, invalid_boleto_data):
+        """Testa que 4xx não conta como falha do engine"""
+        responses.add(responses.GET, f"{base_url}/api/boleto/validate", status=400, json={"error": "x"})
+        client = BoletoClient(base_url, circuit_breaker=CircuitBreaker(failure_threshold=1))
+
+        for _ in range(3):
+            with pytest.raises(BoletoAPIError):
+                client.validate("sicoob", invalid_boleto_data)
+        assert client.circuit_breaker.state == "closed"
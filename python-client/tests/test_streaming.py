@@ -0,0 +1,64 @@
+"""
+Testes para a decodificação incremental de arrays JSON
+"""
+import json
+
+import pytest
+
+from boleto_cnab_client.streaming import iter_json_array
+
+
+def byte_chunks(data, size):
+    """Divide bytes em blocos de tamanho fixo"""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    """Testes para iter_json_array"""
+
+    ITEMS = [
+        {"nosso_numero": "123", "valor_pago": 150.5, "sacado": "João Ação"},
+        {"nosso_numero": "456", "valor_pago": 1234567, "ok": True, "obs": None},
+        {"nosso_numero": "789", "lista": [1, 2, {"x": "]}"}]},
+    ]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+    def test_top_level_array_any_chunking(self, size):
+        """Testa que qualquer divisão em blocos produz os mesmos itens"""
+        data = json.dumps(self.ITEMS, ensure_ascii=False).encode("utf-8")
+        assert list(iter_json_array(byte_chunks(data, size))) == self.ITEMS
+
+    @pytest.mark.parametrize("size", [1, 5, 100000])
+    def test_nested_key(self, size):
+        """Testa iteração do array de uma chave do objeto"""
+        doc = {
+            "banco": {"org": "SICOOB"},
+            "saldo": 12345,
+            "transacoes": self.ITEMS,
+            "resumo": {"total_transacoes": 3},
+        }
+        data = json.dumps(doc).encode("utf-8")
+        assert list(iter_json_array(byte_chunks(data, size), key="transacoes")) == self.ITEMS
+
+    def test_truncated_number_at_chunk_boundary(self):
+        """Testa número dividido entre blocos"""
+        chunks = [b'{"total": 12', b'3, "itens": [1', b'0, 20]}']
+        assert list(iter_json_array(chunks, key="itens")) == [10, 20]
+
+    def test_empty_array_and_missing_key(self):
+        """Testa array vazio e chave ausente"""
+        assert list(iter_json_array([b" [ ] "])) == []
+        assert list(iter_json_array([b'{"a": 1}'], key="itens")) == []
+
+    def test_is_lazy(self):
+        """Testa que itens saem antes do fim do stream"""
+        def chunks():
+            yield b'[{"a": 1},'
+            raise AssertionError("não deveria ler o próximo bloco")
+
+        assert next(iter_json_array(chunks())) == {"a": 1}
+
+    def test_invalid_document(self):
+        """Testa erro em documento que não é array"""
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"a": 1}']))
@@ -0,0 +1,104 @@
+"""
+Testes para os transportes plugáveis (requests e httpx/HTTP/2)
+"""
+import io
+
+import httpx
+import pytest
+from requests.adapters import HTTPAdapter
+
+from boleto_cnab_client import BoletoClient, HTTPXAdapter
+from boleto_cnab_client.exceptions import BoletoConnectionError, BoletoTimeoutError
+
+
+def make_client(base_url, handler, **kwargs):
+    """Cliente sobre o HTTPXAdapter com transporte mockado (sem rede)"""
+    adapter = HTTPXAdapter(http2=False, transport=httpx.MockTransport(handler))
+    return BoletoClient(base_url, transport=adapter, **kwargs)
+
+
+class TestTransportSelection:
+    """Testes da escolha do transporte"""
+
+    def test_requests_is_default(self, base_url):
+        client = BoletoClient(base_url)
+        assert isinstance(client.transport, HTTPAdapter)
+        assert client.session.get_adapter(base_url) is client.transport
+
+    def test_http2(self, base_url):
+        pytest.importorskip("h2")
+        client = BoletoClient(base_url, transport="http2", pool_maxsize=4)
+        assert isinstance(client.transport, HTTPXAdapter)
+        assert client.transport.http2 and client.transport.max_connections == 4
+
+    def test_invalid(self, base_url):
+        with pytest.raises(ValueError):
+            BoletoClient(base_url, transport="curl")
+
+
+class TestHTTPXAdapter:
+    """Testes do BoletoClient enviando pelo httpx"""
+
+    def test_json_request(self, base_url, valid_boleto_data):
+        """Testa query string, headers e corpo JSON da resposta"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"valid": True})
+
+        client = make_client(base_url, handler)
+
+        assert client.validate("banco_brasil", valid_boleto_data) == {"valid": True}
+        assert seen[0].url.params["bank"] == "banco_brasil"
+
+    def test_streamed_body(self, base_url, valid_boleto_data):
+        """Testa gravação em blocos a partir do corpo em streaming"""
+        pdf = b"%PDF-1.4 " + b"x" * 10_000
+        client = make_client(base_url, lambda request: httpx.Response(200, content=pdf))
+        dest = io.BytesIO()
+
+        written = client.generate_boleto_to_file("banco_brasil", valid_boleto_data, dest, chunk_size=1024)
+
+        assert written == len(pdf)
+        assert dest.getvalue() == pdf
+
+    def test_multipart_upload(self, base_url, tmp_path):
+        """Testa envio do corpo multipart preparado pelo requests"""
+        retorno = tmp_path / "ret.txt"
+        retorno.write_bytes(b"LINHA RETORNO")
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            return httpx.Response(200, json=[])
+
+        make_client(base_url, handler).process_retorno("sicoob", "cnab240", str(retorno))
+
+        assert b"LINHA RETORNO" in bodies[0]
+
+    def test_retry_on_503(self, base_url, monkeypatch):
+        """Testa que o retry do cliente vale também para o httpx"""
+        monkeypatch.setattr("boleto_cnab_client.client.time.sleep", lambda s: None)
+        statuses = iter([503, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"status": "OK"})
+
+        assert make_client(base_url, handler, retries=1).health_check() == {"status": "OK"}
+
+    def test_connection_error(self, base_url):
+        """Testa erro de conexão do httpx mapeado para BoletoConnectionError"""
+        def handler(request):
+            raise httpx.ConnectError("recusada", request=request)
+
+        with pytest.raises(BoletoConnectionError):
+            make_client(base_url, handler, retries=0).health_check()
+
+    def test_timeout(self, base_url):
+        """Testa timeout do httpx mapeado para BoletoTimeoutError"""
+        def handler(request):
+            raise httpx.ReadTimeout("lento", request=request)
+
+        with pytest.raises(BoletoTimeoutError):
+            make_client(base_url, handler, retries=0).health_check()
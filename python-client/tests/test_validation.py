@@ -0,0 +1,107 @@
+"""
+Testes para a pré-validação local de lotes
+"""
+import pytest
+
+from boleto_cnab_client import BoletoBatch
+from boleto_cnab_client import validation
+from boleto_cnab_client.validation import documento_valido, validate_batch
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Roda cada teste com e sem NumPy"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validation, "np", None)
+    return request.param
+
+
+@pytest.fixture
+def good_row(valid_boleto_data):
+    """Boleto com CPF/CNPJ de dígitos válidos"""
+    return dict(
+        valid_boleto_data,
+        documento_cedente="11.222.333/0001-81",
+        sacado_documento="52998224725"
+    )
+
+
+class TestDocumentoValido:
+    """Testes para CPF/CNPJ"""
+
+    @pytest.mark.parametrize("doc,expected", [
+        ("529.982.247-25", True),
+        ("52998224724", False),
+        ("11222333000181", True),
+        ("11222333000180", False),
+        ("00000000000", False),
+        ("123", False),
+        ("529.982.247-\u0662\u0665", False),
+        (None, False),
+    ])
+    def test_documento_valido(self, doc, expected):
+        """Testa dígitos verificadores"""
+        assert documento_valido(doc) is expected
+
+
+class TestValidateBatch:
+    """Testes para validate_batch"""
+
+    def test_valid_batch(self, backend, good_row):
+        """Testa lote sem erros"""
+        report = validate_batch([good_row] * 3)
+
+        assert report.valid
+        assert report.invalid_indices == []
+
+    def test_masks_per_field(self, backend, good_row):
+        """Testa máscaras de erro por campo e por linha"""
+        rows = [
+            good_row,
+            dict(good_row, sacado_documento="52998224724"),
+            dict(good_row, valor=0),
+            {k: v for k, v in good_row.items() if k != "cedente"},
+            dict(good_row, data_vencimento="2025/13/40"),
+            dict(good_row, valor="abc", documento_cedente="11222333000180"),
+        ]
+
+        report = validate_batch(rows)
+
+        assert list(report.invalid) == [False, True, True, True, True, True]
+        assert list(report.masks["sacado_documento"]) == [False, True, False, False, False, False]
+        assert report.errors(0) == {}
+        assert report.errors(3) == {"cedente": "obrigatório"}
+        assert set(report.errors(5)) == {"valor", "documento_cedente"}
+        assert "data_vencimento" in report.errors(4)
+
+    def test_unicode_digits_are_invalid(self, backend, good_row):
+        """Testa documento com dígitos não ASCII (ex.: árabe-índicos) como inválido"""
+        rows = [good_row, dict(good_row, sacado_documento="529982247\u0662\u0665")]
+
+        assert list(validate_batch(rows).masks["sacado_documento"]) == [False, True]
+
+    def test_documents_can_be_skipped(self, backend, valid_boleto_data):
+        """Testa check_documents=False (dígitos não conferidos)"""
+        assert not validate_batch([valid_boleto_data]).valid
+        assert validate_batch([valid_boleto_data], check_documents=False).valid
+
+    def test_split(self, backend, good_row):
+        """Testa separação das linhas válidas"""
+        rows = [good_row, dict(good_row, valor=-1), good_row]
+
+        valid, invalid = validate_batch(rows).split(rows)
+
+        assert valid == [good_row, good_row]
+        assert invalid == [(1, {"valor": validation.ValidationReport._MESSAGES["valor"]})]
+
+    def test_boleto_batch(self, backend, good_row):
+        """Testa validação direto sobre as colunas de um BoletoBatch"""
+        batch = BoletoBatch([good_row, dict(good_row, valor=None), good_row], bank="sicoob")
+
+        valid, invalid = validate_batch(batch).split(batch)
+
+        assert isinstance(valid, BoletoBatch)
+        assert len(valid) == 2
+        assert invalid == [(1, {"valor": "obrigatório"})]
@@ -0,0 +1,68 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+
+RSpec.describe 'POST /api/boleto/batch/*' do
+  let(:fixtures) { JSON.parse(File.read('spec/fixtures/sample_data.json')) }
+  let(:items) do
+    [
+      { bank: 'banco_brasil', data: fixtures['banco_brasil_valido'] },
+      { bank: 'banco_brasil', data: fixtures['invalido_sem_nosso_numero'] },
+      { bank: 'banco_inexistente', data: fixtures['banco_brasil_valido'] },
+      { bank: 'sicoob', data: fixtures['sicoob_valido'] }
+    ]
+  end
+
+  def post_json(path, payload)
+    post path, payload.to_json, 'CONTENT_TYPE' => 'application/json'
+  end
+
+  it 'valida cada item e devolve os resultados na ordem' do
+    post_json('/api/boleto/batch/validate', { items: items })
+
+    expect(last_response.status).to eq(200)
+    body = JSON.parse(last_response.body)
+    expect(body['total']).to eq(4)
+    expect(body['valid_count']).to eq(2)
+    expect(body['invalid_count']).to eq(2)
+    expect(body['results'].map { |r| r['index'] }).to eq([1, 2, 3, 4])
+    expect(body['results'].map { |r| r['valid'] }).to eq([true, false, false, true])
+    expect(body['results'][1]).to have_key('errors')
+    expect(body['results'][2]['error']).to include('não suportado')
+  end
+
+  it 'retorna os mesmos dados do endpoint unitário' do
+    get '/api/boleto/data', { bank: 'banco_brasil', data: fixtures['banco_brasil_valido'].to_json }
+    single = JSON.parse(last_response.body)
+
+    post_json('/api/boleto/batch/data', { items: items.first(1) })
+
+    result = JSON.parse(last_response.body)['results'].first
+    expect(result.except('index', 'valid')).to eq(single)
+  end
+
+  it 'gera nosso_numero por item' do
+    post_json('/api/boleto/batch/nosso_numero', { items: [items[0], items[3]] })
+
+    results = JSON.parse(last_response.body)['results']
+    expect(results.map { |r| r['nosso_numero'] }).to eq(%w[000000123 0007890])
+  end
+
+  it 'rejeita lotes acima do máximo' do
+    stub_const('BoletoApi::Config::Constants::MAX_BATCH_ITEMS', 2)
+
+    post_json('/api/boleto/batch/validate', { items: items })
+
+    expect(last_response.status).to eq(400)
+    expect(JSON.parse(last_response.body)['error']).to include('excede o máximo de 2')
+  end
+
+  it 'é anunciado em /api/metadata' do
+    get '/api/metadata'
+
+    endpoints = JSON.parse(last_response.body)['endpoints']
+    %w[validate data nosso_numero].each do |action|
+      expect(endpoints["boleto_batch_#{action}"]).to eq("POST /api/boleto/batch/#{action}")
+    end
+  end
+end
@@ -54,6 +54,30 @@ RSpec.describe 'Boleto endpoints com include_data=true' do
       expect(last_response.headers['X-Nosso-Numero']).to eq('000000123')
       expect(last_response.headers['X-Nosso-Numero-Formatado']).to eq('01234567000000123')
       expect(last_response.headers['X-Nosso-Numero-DV']).to eq('9')
+      expect(last_response.headers['X-Banco']).to be_nil
+      expect(last_response.headers['X-Valor']).to be_nil
+    end
+
+    it 'com include_data=headers retorna binário + campos escalares em headers X-*' do
+      data = fixtures['banco_brasil_valido']
+
+      get '/api/boleto', {
+        bank: 'banco_brasil',
+        type: 'pdf',
+        data: data.to_json,
+        include_data: 'headers'
+      }
+
+      expect(last_response.status).to eq(200)
+      expect(last_response.content_type).to include('application/pdf')
+      expect(last_response.body.bytes[0..3]).to eq([0x25, 0x50, 0x44, 0x46])
+      expect(last_response.headers['X-Codigo-Barras']).not_to be_empty
+      expect(last_response.headers['X-Linha-Digitavel']).not_to be_empty
+
+      expect(last_response.headers['X-Banco']).to eq('banco_brasil')
+      expect(last_response.headers['X-Valor'].to_f).to eq(data['valor'].to_f)
+      expect(last_response.headers).not_to have_key('X-Boleto-Info')
+      expect(last_response.headers.values.join).not_to include(data['instrucao1'])
     end
   end
 
@@ -0,0 +1,56 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+
+RSpec.describe 'Boleto endpoints com corpo JSON (POST)' do
+  let(:fixtures) { JSON.parse(File.read('spec/fixtures/sample_data.json')) }
+  let(:data) { fixtures['banco_brasil_valido'] }
+
+  def post_json(path, payload)
+    post path, payload.to_json, 'CONTENT_TYPE' => 'application/json'
+  end
+
+  %w[validate data nosso_numero].each do |action|
+    describe "POST /api/boleto/#{action}" do
+      it 'retorna a mesma resposta do GET equivalente' do
+        get "/api/boleto/#{action}", { bank: 'banco_brasil', data: data.to_json }
+        expected = JSON.parse(last_response.body)
+
+        post_json("/api/boleto/#{action}", { bank: 'banco_brasil', data: data })
+
+        expect(last_response.status).to eq(200)
+        expect(JSON.parse(last_response.body)).to eq(expected)
+      end
+
+      it 'retorna 400 com os mesmos erros de validação' do
+        invalid = fixtures['invalido_sem_nosso_numero']
+
+        get "/api/boleto/#{action}", { bank: 'banco_brasil', data: invalid.to_json }
+        expected = JSON.parse(last_response.body)
+
+        post_json("/api/boleto/#{action}", { bank: 'banco_brasil', data: invalid })
+
+        expect(last_response.status).to eq(400)
+        expect(JSON.parse(last_response.body)).to eq(expected)
+      end
+    end
+  end
+
+  it 'aceita instruções longas que estourariam o limite de URL' do
+    longo = data.merge('instrucoes' => 'Não receber após o vencimento. ' * 500)
+
+    post_json('/api/boleto/validate', { bank: 'banco_brasil', data: longo })
+
+    expect(last_response.status).to eq(200)
+    expect(JSON.parse(last_response.body)['valid']).to be true
+  end
+
+  it 'é anunciado em /api/metadata' do
+    get '/api/metadata'
+
+    endpoints = JSON.parse(last_response.body)['endpoints']
+    %w[validate data nosso_numero].each do |action|
+      expect(endpoints["boleto_#{action}_post"]).to eq("POST /api/boleto/#{action}")
+    end
+  end
+end
@@ -0,0 +1,43 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+
+RSpec.describe 'Cache condicional de /api/info, /api/metadata e /api/bancos' do
+  %w[/api/info /api/metadata /api/bancos].each do |path|
+    describe "GET #{path}" do
+      it 'envia ETag e Cache-Control com max-age' do
+        get path
+
+        expect(last_response.status).to eq(200)
+        expect(last_response.headers['ETag']).to match(/\A"\h{32}"\z/)
+        expect(last_response.headers['Cache-Control'])
+          .to eq("public, max-age=#{BoletoApi::Config::Constants::DISCOVERY_MAX_AGE}")
+      end
+
+      it 'responde 304 sem corpo quando If-None-Match confere' do
+        get path
+        etag = last_response.headers['ETag']
+
+        get path, {}, 'HTTP_IF_NONE_MATCH' => etag
+
+        expect(last_response.status).to eq(304)
+        expect(last_response.body).to be_empty
+        expect(last_response.headers['ETag']).to eq(etag)
+      end
+
+      it 'responde 200 quando o ETag não confere' do
+        get path, {}, 'HTTP_IF_NONE_MATCH' => '"antigo"'
+
+        expect(last_response.status).to eq(200)
+        expect(JSON.parse(last_response.body)).not_to be_empty
+      end
+    end
+  end
+
+  it 'GET /api/health não é cacheável' do
+    get '/api/health'
+
+    expect(last_response.headers['Cache-Control']).to eq('no-cache')
+    expect(last_response.headers['ETag']).to be_nil
+  end
+end
@@ -15,7 +15,7 @@ RSpec.describe 'Docs endpoints (Swagger / OpenAPI)' do
       expect(spec['info']['version']).to eq(BoletoApi::VERSION)
     end
 
-    it 'inclui todos os 12 endpoints principais' do
+    it 'inclui todos os 15 endpoints principais' do
       get '/api/openapi.json'
       spec = JSON.parse(last_response.body)
       paths = spec['paths'].keys
@@ -23,6 +23,7 @@ RSpec.describe 'Docs endpoints (Swagger / OpenAPI)' do
       %w[
         /api/health /api/info /api/metadata /api/bancos
         /api/boleto/validate /api/boleto/data /api/boleto/nosso_numero
+        /api/boleto/batch/validate /api/boleto/batch/data /api/boleto/batch/nosso_numero
         /api/boleto /api/boleto/multi
         /api/remessa /api/retorno /api/ofx/parse
       ].each do |path|
@@ -0,0 +1,62 @@
+# frozen_string_literal: true
+
+require 'spec_helper'
+require 'zlib'
+
+RSpec.describe 'Requisições com Content-Encoding: gzip' do
+  let(:fixtures) { JSON.parse(File.read('spec/fixtures/sample_data.json')) }
+  let(:data) { fixtures['banco_brasil_valido'] }
+
+  def gzip(text)
+    Zlib.gzip(text)
+  end
+
+  it 'descomprime corpo JSON antes do parse' do
+    post '/api/boleto/validate', gzip({ bank: 'banco_brasil', data: data }.to_json),
+         'CONTENT_TYPE' => 'application/json', 'HTTP_CONTENT_ENCODING' => 'gzip'
+
+    expect(last_response.status).to eq(200)
+    expect(JSON.parse(last_response.body)['valid']).to be true
+  end
+
+  it 'descomprime upload multipart do /multi' do
+    file = Tempfile.new(['boletos', '.json'])
+    file.write([data.merge('bank' => 'banco_brasil')].to_json)
+    file.rewind
+    upload = Rack::Test::UploadedFile.new(file.path, 'application/json')
+    body = Rack::Test::Utils.build_multipart({ 'type' => 'pdf', 'data' => upload })
+
+    post '/api/boleto/multi', gzip(body),
+         'CONTENT_TYPE' => "multipart/form-data; boundary=#{Rack::Test::MULTIPART_BOUNDARY}",
+         'HTTP_CONTENT_ENCODING' => 'gzip'
+
+    expect(last_response.status).to eq(200)
+    expect(last_response.content_type).to include('application/pdf')
+  ensure
+    file.close
+    file.unlink
+  end
+
+  it 'retorna 400 para gzip corrompido' do
+    post '/api/boleto/validate', 'não é gzip',
+         'CONTENT_TYPE' => 'application/json', 'HTTP_CONTENT_ENCODING' => 'gzip'
+
+    expect(last_response.status).to eq(400)
+    expect(JSON.parse(last_response.body)['type']).to eq('GzipError')
+  end
+
+  it 'retorna 415 para encoding não suportado' do
+    post '/api/boleto/validate', '{}', 'CONTENT_TYPE' => 'application/json', 'HTTP_CONTENT_ENCODING' => 'br'
+
+    expect(last_response.status).to eq(415)
+  end
+
+  it 'retorna 413 quando o corpo descomprimido passa do limite' do
+    stub_const('BoletoApi::Config::Constants::MAX_INFLATED_BODY_BYTES', 1024)
+
+    post '/api/boleto/validate', gzip(' ' * 10_000),
+         'CONTENT_TYPE' => 'application/json', 'HTTP_CONTENT_ENCODING' => 'gzip'
+
+    expect(last_response.status).to eq(413)
+  end
+end